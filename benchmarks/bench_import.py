@@ -0,0 +1,63 @@
+"""Import time benchmark of a synthetic step library.
+
+Generates a module with the given number of step definitions, evenly split between the string, ``parsers.parse``,
+``parsers.cfparse`` and ``parsers.re`` step names, and measures the import time of the module in a fresh
+interpreter (the python bytecode is compiled before the measurement).
+
+Usage:
+
+    python benchmarks/bench_import.py --steps 10000 --repeat 5
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from corpus import generate_step_library
+
+MEASURE = """\
+import time
+
+import pytest_bdd
+
+start = time.time()
+import {module}
+print(time.time() - start)
+"""
+
+
+def measure_import_time(directory, module, repeat):
+    """Measure the import time of the module in fresh interpreters.
+
+    :return: `list` of the import times in seconds.
+    """
+    subprocess.check_call([sys.executable, "-m", "compileall", "-q", directory])
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", MEASURE.format(module=module)], cwd=directory)
+        times.append(float(output.decode("ascii").strip().splitlines()[-1]))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time benchmark of a synthetic step library.")
+    parser.add_argument("--steps", type=int, default=10000, help="Number of the step definitions")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of the measurements")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="pytest-bdd-bench-")
+    try:
+        generate_step_library(os.path.join(directory, "step_library.py"), args.steps)
+        times = measure_import_time(directory, "step_library", args.repeat)
+    finally:
+        shutil.rmtree(directory)
+    print("Import of {0} step definitions: best {1:.3f}s, worst {2:.3f}s".format(args.steps, min(times), max(times)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Synthetic test suite corpus of the benchmarks.
+
+The step library has the given number of step definitions, evenly split between the string, ``parsers.parse``,
+``parsers.cfparse`` and ``parsers.re`` step names. The feature files have the given number of scenarios, which are
+scenario outlines if the number of the example rows is given, and every scenario step uses one of the step
+definitions in turn. The test module binds all the scenarios of the feature files, and the ``conftest.py`` makes
+the step definitions of the library available to it.
+"""
+
+import os
+
+STEP_TEMPLATES = [
+    '@given("there is the step number {index}")\ndef step_{index}():\n    pass\n',
+    '@when(parsers.parse("I eat {{count:d}} cucumbers {index}"))\ndef step_{index}(count):\n    pass\n',
+    '@then(parsers.cfparse("I should have {{count:Number}} cucumbers {index}", extra_types={{"Number": int}}))\n'
+    "def step_{index}(count):\n    pass\n",
+    '@then(parsers.re(r"there are (?P<count>\\d+) cucumbers left {index}$"))\ndef step_{index}(count):\n    pass\n',
+]
+
+# Feature file steps matching the step templates
+STEP_LINES = [
+    "Given there is the step number {index}",
+    "When I eat 3 cucumbers {index}",
+    "Then I should have 5 cucumbers {index}",
+    "Then there are 2 cucumbers left {index}",
+]
+
+CONFTEST = "from step_library import *  # noqa\n"
+
+TEST_MODULE = """\
+from pytest_bdd import scenarios
+
+scenarios("features")
+"""
+
+
+def generate_step_library(path, steps):
+    """Write the synthetic step library module with the given number of steps."""
+    lines = ["from pytest_bdd import given, when, then, parsers", ""]
+    for index in range(steps):
+        lines.append(STEP_TEMPLATES[index % len(STEP_TEMPLATES)].format(index=index))
+    with open(path, "w") as fd:
+        fd.write("\n".join(lines))
+
+
+def generate_feature(path, feature_index, scenarios, rows, scenario_steps, steps):
+    """Write the synthetic feature file.
+
+    :return: Number of the steps executed by the scenarios of the feature.
+    """
+    lines = ["Feature: Feature {0}".format(feature_index), ""]
+    step_index = feature_index * scenarios * scenario_steps
+    for scenario_index in range(scenarios):
+        keyword = "Scenario Outline" if rows else "Scenario"
+        lines.append("    {0}: Scenario {1} {2}".format(keyword, feature_index, scenario_index))
+        for _ in range(scenario_steps):
+            index = step_index % steps
+            lines.append("        " + STEP_LINES[index % len(STEP_LINES)].format(index=index))
+            step_index += 1
+        if rows:
+            lines.extend(["", "        Examples:", "        | row |"])
+            lines.extend("        | {0} |".format(row) for row in range(rows))
+        lines.append("")
+    with open(path, "w") as fd:
+        fd.write("\n".join(lines))
+    return scenarios * max(rows, 1) * scenario_steps
+
+
+def generate_corpus(directory, features, scenarios, rows, scenario_steps, steps):
+    """Write the synthetic test suite in the directory.
+
+    :param int features: Number of the feature files.
+    :param int scenarios: Number of the scenarios per feature.
+    :param int rows: Number of the example rows per scenario, 0 for the scenarios without examples.
+    :param int scenario_steps: Number of the steps per scenario.
+    :param int steps: Number of the step definitions.
+
+    :return: Number of the steps executed by the test suite.
+    """
+    generate_step_library(os.path.join(directory, "step_library.py"), steps)
+    with open(os.path.join(directory, "conftest.py"), "w") as fd:
+        fd.write(CONFTEST)
+    with open(os.path.join(directory, "test_corpus.py"), "w") as fd:
+        fd.write(TEST_MODULE)
+    features_dir = os.path.join(directory, "features")
+    os.mkdir(features_dir)
+    executed_steps = 0
+    for feature_index in range(features):
+        executed_steps += generate_feature(
+            os.path.join(features_dir, "feature_{0}.feature".format(feature_index)),
+            feature_index,
+            scenarios,
+            rows,
+            scenario_steps,
+            steps,
+        )
+    return executed_steps
@@ -0,0 +1,193 @@
+"""Benchmark suite of the parser, step matching, collection and execution overhead.
+
+Generates a synthetic test suite (see ``corpus.py``) and measures in fresh interpreters:
+
+* ``parse``: parsing of all the feature files;
+* ``import``: import of the step library;
+* ``collection``: pytest collection of the test suite;
+* ``execution``: pytest run of the test suite, including the collection;
+* ``step_overhead``: execution time per executed step, without the collection.
+
+The best time of the repeated measurements and the peak memory (maximum resident set size in kilobytes) of every
+benchmark are written as JSON, and the ``compare`` command flags the regressions against a stored baseline:
+
+    python benchmarks/run.py run --features 20 --rows 10 --output current.json
+    python benchmarks/run.py compare baseline.json current.json --threshold 0.1
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from corpus import generate_corpus
+
+MEASURE = """\
+import json
+import resource
+import time
+
+{setup}
+start = time.time()
+{statement}
+elapsed = time.time() - start
+print(json.dumps({{"time": elapsed, "peak_memory": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+BENCHMARKS = [
+    (
+        "parse",
+        "import glob\nfrom pytest_bdd.parser import parse_feature\n"
+        "filenames = sorted(glob.glob('features/*.feature'))",
+        "for filename in filenames:\n    parse_feature('features', filename[len('features/'):])",
+    ),
+    ("import", "import pytest_bdd", "import step_library"),
+    (
+        "collection",
+        "import pytest",
+        "assert pytest.main(['--collect-only', '-q', '-p', 'no:cacheprovider']) == 0",
+    ),
+    ("execution", "import pytest", "assert pytest.main(['-q', '-p', 'no:cacheprovider']) == 0"),
+]
+
+
+def measure(directory, setup, statement, repeat):
+    """Measure the statement in fresh interpreters.
+
+    :return: `dict` with the best time in seconds, all the times and the peak memory in kilobytes.
+    """
+    times = []
+    peak_memory = 0
+    for _ in range(repeat):
+        with open(os.devnull, "w") as devnull:
+            output = subprocess.check_output(
+                [sys.executable, "-c", MEASURE.format(setup=setup, statement=statement)], cwd=directory, stderr=devnull
+            )
+        result = json.loads(output.decode("utf-8").strip().splitlines()[-1])
+        times.append(result["time"])
+        peak_memory = max(peak_memory, result["peak_memory"])
+    return {"time": min(times), "times": times, "peak_memory": peak_memory}
+
+
+def run(args):
+    directory = tempfile.mkdtemp(prefix="pytest-bdd-bench-")
+    try:
+        executed_steps = generate_corpus(
+            directory, args.features, args.scenarios, args.rows, args.scenario_steps, args.steps
+        )
+        subprocess.check_call([sys.executable, "-m", "compileall", "-q", directory])
+        results = {}
+        for name, setup, statement in BENCHMARKS:
+            print("Measuring {0}...".format(name), file=sys.stderr)
+            results[name] = measure(directory, setup, statement, args.repeat)
+    finally:
+        shutil.rmtree(directory)
+    results["step_overhead"] = {
+        "time": max(results["execution"]["time"] - results["collection"]["time"], 0) / max(executed_steps, 1)
+    }
+
+    import pytest_bdd
+
+    report = {
+        "parameters": {
+            "features": args.features,
+            "scenarios": args.scenarios,
+            "rows": args.rows,
+            "scenario_steps": args.scenario_steps,
+            "steps": args.steps,
+            "executed_steps": executed_steps,
+        },
+        "environment": {"python": platform.python_version(), "pytest-bdd": pytest_bdd.__version__},
+        "results": results,
+    }
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as fd:
+            fd.write(output)
+    else:
+        print(output)
+    return 0
+
+
+def compare_results(baseline, current, threshold):
+    """Compare the benchmark results.
+
+    :param dict baseline: Baseline report.
+    :param dict current: Current report.
+    :param float threshold: Relative increase of the time or the peak memory considered as a regression.
+
+    :return: `list` of (<benchmark>, <metric>, <baseline value>, <current value>, <relative change>, <regression>).
+    """
+    comparison = []
+    for name, baseline_result in sorted(baseline["results"].items()):
+        current_result = current["results"].get(name)
+        if current_result is None:
+            continue
+        for metric in ("time", "peak_memory"):
+            if metric not in baseline_result or metric not in current_result:
+                continue
+            baseline_value = baseline_result[metric]
+            current_value = current_result[metric]
+            change = (current_value - baseline_value) / baseline_value if baseline_value else 0.0
+            comparison.append((name, metric, baseline_value, current_value, change, change > threshold))
+    return comparison
+
+
+def compare(args):
+    with open(args.baseline) as fd:
+        baseline = json.load(fd)
+    with open(args.current) as fd:
+        current = json.load(fd)
+    if baseline["parameters"] != current["parameters"]:
+        print("Warning: the benchmarks were run with different parameters.", file=sys.stderr)
+
+    comparison = compare_results(baseline, current, args.threshold)
+    regressions = 0
+    for name, metric, baseline_value, current_value, change, regression in comparison:
+        regressions += regression
+        print(
+            "{0:<15} {1:<12} {2:>14.6g} {3:>14.6g} {4:>+8.1%}{5}".format(
+                name, metric, baseline_value, current_value, change, "  REGRESSION" if regression else ""
+            )
+        )
+    if regressions:
+        print("{0} regression(s) above {1:.0%}.".format(regressions, args.threshold))
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite of pytest-bdd.")
+    subparsers = parser.add_subparsers(help="sub-command help", dest="command")
+    subparsers.required = True
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks and write the results as JSON.")
+    run_parser.add_argument("--features", type=int, default=20, help="Number of the feature files")
+    run_parser.add_argument("--scenarios", type=int, default=10, help="Number of the scenarios per feature")
+    run_parser.add_argument("--rows", type=int, default=5, help="Number of the example rows per scenario")
+    run_parser.add_argument("--scenario-steps", type=int, default=4, help="Number of the steps per scenario")
+    run_parser.add_argument("--steps", type=int, default=1000, help="Number of the step definitions")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Number of the measurements")
+    run_parser.add_argument("-o", "--output", help="Output JSON file, the standard output by default")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser("compare", help="Compare the results with a baseline.")
+    compare_parser.add_argument("baseline", help="Baseline results JSON file")
+    compare_parser.add_argument("current", help="Current results JSON file")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Relative increase considered as a regression"
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
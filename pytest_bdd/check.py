@@ -0,0 +1,329 @@
+"""Static check of the step definitions.
+
+The python files are not imported, the step definitions are found by scanning their syntax tree for the
+``given``, ``when`` and ``then`` decorators with literal step names or literal ``parsers.parse``,
+``parsers.cfparse`` and ``parsers.re`` patterns. The found definitions are cached by the file modification time,
+so that only the changed files are scanned again, and every step of the feature files is matched against them.
+
+The literal keyword arguments of the parsers are used as they are. The ``extra_types`` of the parsers only have to
+be declared with the literal type names, the types match any value. The other arguments can not be evaluated
+without importing the files, so the step definitions using them are matched approximately: the keyword arguments
+are ignored and all the types which are not known match any value.
+"""
+
+import ast
+import io
+import json
+import os.path
+import re
+
+import glob2
+import six
+
+from . import parsers
+from .exceptions import StepPatternError
+from .parser import parse_feature
+from .types import STEP_TYPES
+from .utils import safe_create_dir
+
+# Step definitions cache, in the pytest cache directory layout
+CACHE_PATH = os.path.join(".pytest_cache", "v", "bdd", "step_index")
+# Version of the cached step definitions format, the files cached in another format are scanned again
+CACHE_VERSION = 2
+
+# Error of the parse expression using a type which is not declared
+UNKNOWN_TYPE_RE = re.compile(r"^format spec '(?P<type>.+)' not recognised$")
+
+# Step parsers supported by the static check, by the name they are referenced with
+PARSERS = {"string": parsers.string, "parse": parsers.parse, "cfparse": parsers.cfparse, "re": parsers.re}
+
+# Step definitions of the pytest-bdd plugin itself
+BUILTIN_STEP_DEFINITIONS = [
+    (step_type, "string", "trace", "pytest_bdd/plugin.py", 0, {}, True) for step_type in STEP_TYPES
+]
+
+
+def _get_name(node):
+    """Get the name of the decorator or the parser, without the module (e.g. ``given`` of ``pytest_bdd.given``)."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _get_literal(node):
+    """Get the value of the literal string node, or `None` if the node is not a literal string."""
+    # String literals are ``ast.Constant`` nodes since python 3.8
+    if type(node).__name__ == "Constant" and isinstance(node.value, six.string_types):
+        return node.value
+    if type(node).__name__ == "Str":
+        return node.s
+    return None
+
+
+def _get_type_names(node):
+    """Get the type names of the literal ``extra_types`` dictionary, or `None` if the names are not literal."""
+    if isinstance(node, ast.Dict):
+        names = [_get_literal(key) for key in node.keys]
+    elif isinstance(node, ast.Call) and _get_name(node.func) == "dict" and not node.args:
+        names = [keyword.arg for keyword in node.keywords]
+    else:
+        return None
+    return None if None in names else names
+
+
+def _get_parser_kwargs(parser_call):
+    """Get the keyword arguments of the parser which can be evaluated without importing the file.
+
+    :return: (<keyword arguments>, <whether all the arguments are known>), the ``extra_types`` are the type names.
+    """
+    kwargs = {}
+    known = len(parser_call.args) == 1
+    for keyword in parser_call.keywords:
+        if keyword.arg == "extra_types":
+            value = _get_type_names(keyword.value)
+        else:
+            try:
+                value = ast.literal_eval(keyword.value)
+                # The arguments are cached as JSON
+                json.dumps(value)
+            except (ValueError, TypeError, SyntaxError):
+                value = None
+        if value is None or keyword.arg is None:
+            known = False
+        else:
+            kwargs[keyword.arg] = value
+    return kwargs, known
+
+
+def _get_step_definition(decorator):
+    """Get the step definition of the decorator.
+
+    :return: (<step type>, <parser name>, <pattern>, <parser keyword arguments>, <whether the arguments are known>)
+             or `None` if the decorator is not a static step definition.
+    """
+    if not isinstance(decorator, ast.Call) or _get_name(decorator.func) not in STEP_TYPES:
+        return None
+    step_name = decorator.args[0] if decorator.args else None
+    for keyword in decorator.keywords:
+        if keyword.arg == "name":
+            step_name = keyword.value
+    if step_name is None:
+        return None
+
+    pattern = _get_literal(step_name)
+    if pattern is not None:
+        return _get_name(decorator.func), "string", pattern, {}, True
+    if isinstance(step_name, ast.Call) and _get_name(step_name.func) in PARSERS and step_name.args:
+        pattern = _get_literal(step_name.args[0])
+        if pattern is not None:
+            kwargs, known = _get_parser_kwargs(step_name)
+            return _get_name(decorator.func), _get_name(step_name.func), pattern, kwargs, known
+    return None
+
+
+def _any_value(value):
+    """Converter of the types which are not known statically."""
+    return value
+
+
+def make_parser(parser_name, pattern, kwargs, known):
+    """Make the parser of the scanned step definition.
+
+    :param str parser_name: Parser name.
+    :param str pattern: Step name pattern.
+    :param dict kwargs: Keyword arguments of the parser, with the type names as the ``extra_types``.
+    :param bool known: Whether all the arguments of the parser are known, the types are not checked otherwise.
+    """
+    kwargs = dict(kwargs)
+    if "extra_types" in kwargs:
+        kwargs["extra_types"] = dict((name, _any_value) for name in kwargs["extra_types"])
+    parser = PARSERS[parser_name](pattern, **kwargs)
+    if known or not isinstance(parser, parsers.parse):
+        return parser
+    extra_types = kwargs.setdefault("extra_types", {})
+    while True:
+        try:
+            parser.compile()
+        except (ValueError, re.error) as exception:
+            match = UNKNOWN_TYPE_RE.match(str(exception))
+            if match is None or match.group("type") in extra_types:
+                # Other errors of the pattern are reported when it is matched
+                return parser
+            extra_types[match.group("type")] = _any_value
+            parser = PARSERS[parser_name](pattern, **kwargs)
+        else:
+            return parser
+
+
+def scan_step_definitions(filename):
+    """Scan the python file for the step definitions.
+
+    :param str filename: Python file path.
+
+    :return: `list` of (<step type>, <parser name>, <pattern>, <line number>, <parser keyword arguments>,
+             <whether the arguments are known>).
+    """
+    with io.open(filename, "rb") as fd:
+        try:
+            tree = ast.parse(fd.read(), filename)
+        except SyntaxError:
+            return []
+
+    step_definitions = []
+    for node in ast.walk(tree):
+        for decorator in getattr(node, "decorator_list", []):
+            step_definition = _get_step_definition(decorator)
+            if step_definition is not None:
+                step_type, parser_name, pattern, kwargs, known = step_definition
+                step_definitions.append((step_type, parser_name, pattern, decorator.lineno, kwargs, known))
+    return step_definitions
+
+
+class StepDefinitionIndex(object):
+    """Step definitions of the python files, matched against the steps by the type."""
+
+    def __init__(self, cache_path=None):
+        """Step definition index constructor.
+
+        :param str cache_path: Optional path to the step definitions cache.
+        """
+        self.cache_path = cache_path
+        self.cache = {}
+        if cache_path and os.path.exists(cache_path):
+            with io.open(cache_path, encoding="utf-8") as fd:
+                try:
+                    self.cache = json.load(fd)
+                except ValueError:
+                    pass
+        self.changed = False
+        # Errors of the step definition patterns in form {(<filename>, <line number>): <message>}
+        self.invalid = {}
+        # Step definitions in form {<step type>: [(<parser>, <filename>, <line number>, <known arguments>)]}
+        self.step_definitions = dict((step_type, []) for step_type in STEP_TYPES)
+        for step_type, parser_name, pattern, filename, line_number, kwargs, known in BUILTIN_STEP_DEFINITIONS:
+            self.add(step_type, parser_name, pattern, filename, line_number, kwargs, known)
+
+    def add(self, step_type, parser_name, pattern, filename, line_number, kwargs=None, known=True):
+        parser = make_parser(parser_name, pattern, kwargs or {}, known)
+        self.step_definitions[step_type].append((parser, filename, line_number, known))
+
+    def add_file(self, filename):
+        """Add the step definitions of the python file, scanning it only if it changed since it was cached."""
+        key = os.path.abspath(filename)
+        stat = os.stat(filename)
+        cached = self.cache.get(key)
+        if (
+            cached is None
+            or cached.get("version") != CACHE_VERSION
+            or cached["mtime"] != stat.st_mtime
+            or cached["size"] != stat.st_size
+        ):
+            cached = self.cache[key] = {
+                "version": CACHE_VERSION,
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "steps": scan_step_definitions(filename),
+            }
+            self.changed = True
+        for step_type, parser_name, pattern, line_number, kwargs, known in cached["steps"]:
+            self.add(step_type, parser_name, pattern, filename, line_number, kwargs, known)
+
+    def save(self):
+        """Save the step definitions cache."""
+        if not self.cache_path or not self.changed:
+            return
+        dirname = os.path.dirname(self.cache_path)
+        if dirname:
+            safe_create_dir(dirname)
+        with io.open(self.cache_path, "w", encoding="utf-8") as fd:
+            fd.write(six.text_type(json.dumps(self.cache)))
+
+    def _is_matching(self, step_definition, name):
+        """Match the step name, the step definitions with the patterns which can not be compiled never match."""
+        parser, filename, line_number, _ = step_definition
+        try:
+            return parser.is_matching(name)
+        except StepPatternError as exception:
+            self.invalid[(filename, line_number)] = six.text_type(exception)
+            return False
+
+    def find(self, step):
+        """Find the step definitions matching the step.
+
+        The step definitions with the same name take precedence over the argumented ones, like at run time, and the
+        step definitions with the known parser arguments take precedence over the approximate ones.
+
+        :return: `list` of (<parser>, <filename>, <line number>).
+        """
+        step_definitions = [
+            step_definition
+            for step_definition in self.step_definitions[step.type]
+            if self._is_matching(step_definition, step.name)
+        ]
+        exact_step_definitions = [
+            step_definition for step_definition in step_definitions if isinstance(step_definition[0], parsers.string)
+        ]
+        known_step_definitions = [step_definition for step_definition in step_definitions if step_definition[3]]
+        return [
+            step_definition[:3]
+            for step_definition in exact_step_definitions or known_step_definitions or step_definitions
+        ]
+
+
+def iter_files(paths, extension):
+    """Iterate over the files with the extension in the given paths (files or directories)."""
+    for path in paths:
+        if os.path.isdir(path):
+            for filename in sorted(glob2.iglob(os.path.join(path, "**", "*" + extension))):
+                yield filename
+        elif path.endswith(extension):
+            yield path
+
+
+def iter_feature_steps(feature):
+    """Iterate over the steps of the background and the scenarios of the feature."""
+    if feature.background:
+        for step in feature.background.steps:
+            yield step
+    for scenario in feature.scenarios.values():
+        for step in scenario._steps:
+            yield step
+
+
+def check(paths, cache_path=CACHE_PATH):
+    """Check that every step of the feature files is defined exactly once.
+
+    :param list paths: Feature files, python files or directories containing them.
+    :param str cache_path: Path to the step definitions cache.
+
+    :return: `list` of the error messages.
+    """
+    index = StepDefinitionIndex(cache_path)
+    for filename in iter_files(paths, ".py"):
+        index.add_file(filename)
+    index.save()
+
+    errors = []
+    for filename in iter_files(paths, ".feature"):
+        feature = parse_feature(*os.path.split(os.path.abspath(filename)))
+        for step in iter_feature_steps(feature):
+            step_definitions = index.find(step)
+            location = u"{0}:{1}".format(filename, step.line_number)
+            if not step_definitions:
+                errors.append(u"{0}: Step definition is not found: {1}".format(location, step))
+            elif len(step_definitions) > 1:
+                errors.append(
+                    u"{0}: Step {1} is ambiguous, it matches the step definitions:\n{2}".format(
+                        location,
+                        step,
+                        u"\n".join(
+                            u"    {0}:{1} {2!r}".format(definition_filename, line_number, parser.name)
+                            for parser, definition_filename, line_number in step_definitions
+                        ),
+                    )
+                )
+    for (filename, line_number), message in sorted(index.invalid.items()):
+        errors.append(u"{0}:{1}: {2}".format(filename, line_number, message))
+    return errors
@@ -0,0 +1,107 @@
+"""Direct collection of the feature files.
+
+With the ``bdd_collect_feature_files`` ini option the ``.feature`` files are collected as test modules, without
+the python modules calling ``scenarios()``. The feature file is parsed and the scenario test functions are created
+only when pytest collects the items of the file, and the items are named after the scenarios:
+
+    py.test "features/login.feature::Successful login"
+
+The step definitions have to be in the ``conftest.py`` files or in the general step definitions directory.
+"""
+
+import os
+import types
+
+import pytest
+
+from . import selection
+from . import tag_expression
+from .feature import get_feature
+from .scenario import _get_scenario_decorator
+from .utils import CONFIG_STACK
+
+
+def add_ini(parser):
+    parser.addini(
+        "bdd_collect_feature_files",
+        "Collect the scenarios of the .feature files without the python test modules.",
+        type="bool",
+        default=False,
+    )
+
+
+# The legacy py.path arguments of the hooks and the nodes are removed in the recent pytest versions
+PYTEST_7 = int(pytest.__version__.split(".")[0]) >= 7
+
+
+def configure(config):
+    """Register the feature files collection only if it is enabled, to not collect every file otherwise."""
+    if config.getini("bdd_collect_feature_files"):
+        config.pluginmanager.register(FeatureFilesCollector(), "pytest-bdd-feature-files")
+
+
+def collect_file(path, parent):
+    """Collect the feature file as a test module.
+
+    :param path: `pathlib.Path` (pytest 7+) or `py.path.local` of the file.
+    """
+    if os.path.splitext(str(path))[1] != ".feature":
+        return None
+    if not selection.is_feature_selected(parent.config, str(path)):
+        return None
+    if PYTEST_7:
+        return FeatureModule.from_parent(parent, path=path)
+    if hasattr(FeatureModule, "from_parent"):
+        return FeatureModule.from_parent(parent, fspath=path)
+    return FeatureModule(path, parent)
+
+
+class FeatureFilesCollector(object):
+    """Plugin collecting the feature files."""
+
+    if PYTEST_7:
+
+        def pytest_collect_file(self, file_path, parent):
+            return collect_file(file_path, parent)
+
+    else:
+
+        def pytest_collect_file(self, path, parent):
+            return collect_file(path, parent)
+
+
+class FeatureModule(pytest.Module):
+    """Feature file collected as a module with the test functions of the scenarios."""
+
+    def _getobj(self):
+        filename = str(self.path if PYTEST_7 else self.fspath)
+        feature = get_feature(os.path.dirname(filename), os.path.basename(filename))
+        module = types.ModuleType(os.path.splitext(os.path.basename(filename))[0])
+        module.__file__ = filename
+        config = CONFIG_STACK[-1]
+        for scenario_name, scenario in feature.scenarios.items():
+            if not tag_expression.is_selected(config, scenario.tags | feature.tags) or not selection.is_selected(
+                config, scenario
+            ):
+                continue
+            scenario.validate()
+
+            def _scenario():
+                pass  # pragma: no cover
+
+            setattr(
+                module,
+                scenario_name,
+                _get_scenario_decorator(
+                    feature=feature,
+                    feature_name=feature.rel_filename,
+                    scenario=scenario,
+                    scenario_name=scenario_name,
+                    encoding="utf-8",
+                )(_scenario),
+            )
+        return module
+
+    def istestfunction(self, obj, name):
+        """Collect the scenario test functions, whatever their names are."""
+        return hasattr(obj, "__scenario__")
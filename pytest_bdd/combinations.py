@@ -0,0 +1,178 @@
+"""Combinatorial reduction of the example tables.
+
+The example tables of the scenario and of the feature are combined as the cartesian product of their rows.
+With the ``@combinations:pairwise`` (or ``@combinations:<n>-wise``) scenario or feature tag only a covering
+subset of the combinations is used instead: every combination of values of any 2 (or n) example columns of
+different tables is in at least one of the selected combinations, and every row of every table is used.
+The rows of a table are never split, the values of the same table only come in the combinations they are declared.
+
+The covering combinations are built greedily, one by one: a combination is started from the first combination
+of values not covered yet, and completed with the rows covering most of the remaining ones.
+"""
+
+import itertools
+import re
+
+from . import exceptions
+from .types import COMBINATIONS_TAG_PREFIX
+
+STRENGTH_RE = re.compile(r"^(?:pairwise|(?P<strength>[1-9]\d*)-wise)$")
+
+
+def get_strength(feature, scenario):
+    """Get the combination strength of the ``@combinations:`` tag, the scenario tag takes precedence.
+
+    :return: Number of the example columns whose value combinations are covered, `None` for the full product.
+    """
+    for tags in (scenario.tags, feature.tags):
+        for tag in sorted(tags):
+            if tag.startswith(COMBINATIONS_TAG_PREFIX):
+                return _parse_strength(tag, scenario)
+    return None
+
+
+def _parse_strength(tag, scenario):
+    match = STRENGTH_RE.match(tag[len(COMBINATIONS_TAG_PREFIX) :])
+    if match is None:
+        raise exceptions.ScenarioValidationError(
+            u'Scenario "{0}" in the feature "{1}" has not valid tag "@{2}", '
+            u'expected "@{3}pairwise" or "@{3}<n>-wise".'.format(
+                scenario.name, scenario.feature.filename, tag, COMBINATIONS_TAG_PREFIX
+            )
+        )
+    return 2 if match.group("strength") is None else int(match.group("strength"))
+
+
+def get_params(feature, scenario):
+    """Get the parametrization tables of the scenario, reduced to the covering combinations if it is tagged.
+
+    :return: `list` of the parametrization tables in form [<names>, <rows>].
+    """
+    param_sets = [param_set for param_set in scenario.get_params() if param_set]
+    strength = get_strength(feature, scenario)
+    if strength is None or len(param_sets) < 2:
+        return param_sets
+    names = []
+    for param_names, _ in param_sets:
+        names.extend(param_names)
+    rows = []
+    for combination in cover([param_rows for _, param_rows in param_sets], strength):
+        row = []
+        for (_, param_rows), row_index in zip(param_sets, combination):
+            row.extend(param_rows[row_index])
+        rows.append(row)
+    return [[names, rows]]
+
+
+def _get_value_ids(rows):
+    """Replace the values with the indexes of the distinct values of their column (the values may be unhashable)."""
+    columns = []
+    for column in zip(*rows):
+        distinct_values = []
+        value_ids = []
+        for value in column:
+            try:
+                value_id = distinct_values.index(value)
+            except ValueError:
+                value_id = len(distinct_values)
+                distinct_values.append(value)
+            value_ids.append(value_id)
+        columns.append(value_ids)
+    return [tuple(row) for row in zip(*columns)]
+
+
+def cover(tables, strength):
+    """Get the combinations of the table rows covering the value combinations of the columns of different tables.
+
+    :param list tables: `list` of the tables, `list` of the rows of the same length each.
+    :param int strength: Number of the columns whose value combinations are covered.
+
+    :return: `list` of the combinations, `tuple` of the row index in every table.
+    """
+    tables = [_get_value_ids(rows) for rows in tables]
+    # Columns in form (<table index>, <column index>), the columns of the same table are adjacent
+    columns = [
+        (table_index, column_index) for table_index, rows in enumerate(tables) for column_index in range(len(rows[0]))
+    ]
+    column_combinations = [
+        combination
+        for combination in itertools.combinations(columns, min(strength, len(columns)))
+        if combination[0][0] != combination[-1][0]
+    ]
+
+    def get_values(combination, assignment):
+        return tuple(
+            tables[table_index][assignment[table_index]][column_index] for table_index, column_index in combination
+        )
+
+    def group_by_table(combination):
+        for table_index, table_columns in itertools.groupby(combination, key=lambda column: column[0]):
+            yield table_index, [column_index for _, column_index in table_columns]
+
+    # Value combinations to cover in form (<column combination>, <values>), in a deterministic order
+    required = []
+    for combination in column_combinations:
+        projections = [
+            sorted(set(tuple(row[column_index] for column_index in column_indexes) for row in tables[table_index]))
+            for table_index, column_indexes in group_by_table(combination)
+        ]
+        for values in itertools.product(*projections):
+            required.append((combination, tuple(itertools.chain(*values))))
+    uncovered = set(required)
+    unused_rows = [set(range(len(rows))) for rows in tables]
+    position = 0
+
+    # Column combinations by the tables of their columns, to count the coverage of an assigned row
+    combinations_by_table = {}
+    for combination in column_combinations:
+        for table_index, _ in group_by_table(combination):
+            combinations_by_table.setdefault(table_index, []).append(combination)
+
+    def count_covered(table_index, assignment):
+        return sum(
+            1
+            for combination in combinations_by_table.get(table_index, [])
+            if all(column_table_index in assignment for column_table_index, _ in combination)
+            and (combination, get_values(combination, assignment)) in uncovered
+        )
+
+    result = []
+    while True:
+        while position < len(required) and required[position] not in uncovered:
+            position += 1
+        # Candidate rows by the table
+        candidates = {}
+        if position < len(required):
+            # Start from the rows of the first uncovered value combination
+            combination, values = required[position]
+            values = iter(values)
+            for table_index, column_indexes in group_by_table(combination):
+                table_values = tuple(next(values) for _ in column_indexes)
+                candidates[table_index] = [
+                    row_index
+                    for row_index, row in enumerate(tables[table_index])
+                    if tuple(row[column_index] for column_index in column_indexes) == table_values
+                ]
+        else:
+            unused = [table_index for table_index, rows in enumerate(unused_rows) if rows]
+            if not unused:
+                break
+            candidates[unused[0]] = sorted(unused_rows[unused[0]])[:1]
+
+        # Choose the rows covering most of the uncovered value combinations, the constrained tables first
+        assignment = {}
+        for table_index in sorted(range(len(tables)), key=lambda table_index: table_index not in candidates):
+            best = None
+            for row_index in candidates.get(table_index, range(len(tables[table_index]))):
+                assignment[table_index] = row_index
+                key = (count_covered(table_index, assignment), row_index in unused_rows[table_index], -row_index)
+                if best is None or key > best[0]:
+                    best = (key, row_index)
+            assignment[table_index] = best[1]
+
+        for combination in column_combinations:
+            uncovered.discard((combination, get_values(combination, assignment)))
+        for table_index, row_index in assignment.items():
+            unused_rows[table_index].discard(row_index)
+        result.append(tuple(assignment[table_index] for table_index in range(len(tables))))
+    return result
@@ -4,13 +4,25 @@ import codecs
 import json
 import math
 import os
+import re
+import shutil
 import sys
+import tempfile
 import time
+from collections import OrderedDict
 
 from .feature import force_unicode
+from .parser import expand_step_template
 from .utils import safe_create_dir
 
 
+def _open(path, mode):
+    """Open a text file in utf-8 encoding (Python compatibility function)."""
+    if sys.version_info[0] < 3:
+        return codecs.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
 def add_options(parser):
     """Add pytest-bdd options."""
     group = parser.getgroup("bdd", "Cucumber JSON")
@@ -41,7 +53,7 @@ def configure(config):
     cucumber_json_path = config.option.cucumber_json_path
     if not cucumber_json_path:
         cucumber_json_path = config.getini("cucumber_json_path")
-    if cucumber_json_path:
+    if cucumber_json_path and not os.path.isabs(cucumber_json_path):
         cucumber_json_path = str(config.rootdir.join(cucumber_json_path))
     expand = config.option.expand
     if not expand:
@@ -66,12 +78,9 @@ class LogBDDCucumberJSON(object):
     def __init__(self, logfile, expand=False):
         logfile = os.path.expanduser(os.path.expandvars(logfile))
         self.logfile = os.path.normpath(os.path.abspath(logfile))
-        self.features = {}
+        self.spool = None
         self.expand = expand
 
-    def append(self, obj):
-        self.features[-1].append(obj)
-
     def _get_result(self, step, report, error_message=False):
         """Get scenario test run result.
 
@@ -103,22 +112,10 @@ class LogBDDCucumberJSON(object):
         """
         return [{"name": tag, "line": item["line_number"] - 1} for tag in item["tags"]]
 
-    def _format_name(self, name, keys, values):
-        for param, value in zip(keys, values):
-            name = name.replace("<{}>".format(param), value)
-        return name
-
-    def _format_step_name(self, report, step):
-        examples = report.scenario["examples"]
-        if len(examples) == 0:
+    def _format_step_name(self, report, step, example_kwargs):
+        if len(report.scenario["examples"]) == 0:
             return step["name"]
-
-        # we take the keys from the first "examples", but in each table, the keys should
-        # be the same anyway since all the variables need to be filled in.
-        keys, values = examples[0]["rows"]
-        row_index = examples[0]["row_index"]
-
-        return self._format_name(step["name"], keys, values[row_index])
+        return expand_step_template(step["template"], example_kwargs)
 
     def pytest_runtest_logreport(self, report):
         try:
@@ -131,7 +128,7 @@ class LogBDDCucumberJSON(object):
             # skip if there isn't a result or scenario has no steps
             return
 
-        def stepmap(step):
+        def stepmap(step, example_kwargs):
             error_message = False
             if step["failed"] and not scenario.setdefault("failed", False):
                 scenario["failed"] = True
@@ -141,7 +138,7 @@ class LogBDDCucumberJSON(object):
                 # XXX The format is already 'expanded' (scenario oultines -> scenarios),
                 # but the step names were not filled in with parameters. To be backwards
                 # compatible, do not fill in the step names unless explicitly asked for.
-                step_name = self._format_step_name(report, step)
+                step_name = self._format_step_name(report, step, example_kwargs)
             else:
                 step_name = step["name"]
 
@@ -153,45 +150,257 @@ class LogBDDCucumberJSON(object):
                 "result": self._get_result(step, report, error_message),
             }
 
-        if scenario["feature"]["filename"] not in self.features:
-            self.features[scenario["feature"]["filename"]] = {
-                "keyword": "Feature",
-                "uri": scenario["feature"]["rel_filename"],
-                "name": scenario["feature"]["name"] or scenario["feature"]["rel_filename"],
-                "id": scenario["feature"]["rel_filename"].lower().replace(" ", "-"),
-                "line": scenario["feature"]["line_number"],
-                "description": scenario["feature"]["description"],
-                "tags": self._serialize_tags(scenario["feature"]),
-                "elements": [],
-            }
-
-        self.features[scenario["feature"]["filename"]]["elements"].append(
-            {
+        # The example rows executed in one item are reported as separate scenarios
+        rows = scenario.get("rows") or [scenario]
+        for row_index, row in enumerate(rows):
+            element = {
                 "keyword": "Scenario",
-                "id": report.item["name"],
+                "id": report.item["name"] if len(rows) == 1 else u"{0}[{1}]".format(report.item["name"], row_index),
                 "name": scenario["name"],
                 "line": scenario["line_number"],
                 "description": "",
                 "tags": self._serialize_tags(scenario),
                 "type": "scenario",
-                "steps": [stepmap(step) for step in scenario["steps"]],
+                "steps": [stepmap(step, row["example_kwargs"]) for step in row["steps"]],
             }
-        )
+            self._spool_element(scenario["feature"], element)
+
+    def _spool_element(self, feature, element):
+        """Append the scenario element to the spool of its feature."""
+        if not self.spool.has_feature(feature["filename"]):
+            self.spool.add_feature(
+                feature["filename"],
+                {
+                    "keyword": "Feature",
+                    "uri": feature["rel_filename"],
+                    "name": feature["name"] or feature["rel_filename"],
+                    "id": get_feature_id(feature["rel_filename"]),
+                    "line": feature["line_number"],
+                    "description": feature["description"],
+                    "tags": self._serialize_tags(feature),
+                },
+            )
+        self.spool.add_element(feature["filename"], element)
 
     def pytest_sessionstart(self):
         self.suite_start_time = time.time()
-
-    def pytest_sessionfinish(self):
-        if sys.version_info[0] < 3:
-            logfile_open = codecs.open
-        else:
-            logfile_open = open
-
         dir_name = os.path.dirname(self.logfile)
         safe_create_dir(dir_name)
+        self.spool = FeatureSpool(dir_name)
 
-        with logfile_open(self.logfile, "w", encoding="utf-8") as logfile:
-            logfile.write(json.dumps(list(self.features.values())))
+    def pytest_sessionfinish(self):
+        try:
+            self.spool.write(self.logfile)
+        finally:
+            self.spool.close()
 
     def pytest_terminal_summary(self, terminalreporter):
         terminalreporter.write_sep("-", "generated json file: %s" % (self.logfile))
+
+
+def get_feature_id(rel_filename):
+    """Get the cucumber json feature id, stable between the test runs and the shards of the same test suite.
+
+    :param str rel_filename: Relative path to the feature file.
+    """
+    return rel_filename.lower().replace(" ", "-")
+
+
+class FeatureSpool(object):
+
+    """Cucumber json features, with their elements spooled to disk.
+
+    Only the features are kept in memory, the elements are appended as JSON lines to a spool file per feature
+    as they arrive, and assembled into the report at the end. The spool files of the most recently used features
+    are kept open, so that the elements of the same feature are written without reopening its file.
+    """
+
+    def __init__(self, dir_name, max_open_files=32):
+        """Create the spool directory in the given directory (the report directory).
+
+        :param int max_open_files: Maximum number of the spool files kept open.
+        """
+        # Features in form {<key>: (<feature without elements>, <elements spool file path>)}
+        self.features = OrderedDict()
+        self.spool_dir = tempfile.mkdtemp(prefix=".cucumber-json-", dir=dir_name)
+        self.max_open_files = max_open_files
+        # Open spool files in form {<spool file path>: <file>}, the least recently used first
+        self.files = OrderedDict()
+
+    def has_feature(self, key):
+        return key in self.features
+
+    def add_feature(self, key, feature):
+        """Add the feature (without the elements) under the given key."""
+        self.features[key] = (feature, os.path.join(self.spool_dir, "{0}.json".format(len(self.features))))
+
+    def add_element(self, key, element):
+        """Append the element to the spool file of the feature."""
+        _, spool_path = self.features[key]
+        spool = self.files.pop(spool_path, None)
+        if spool is None:
+            if len(self.files) >= self.max_open_files:
+                self.files.popitem(last=False)[1].close()
+            spool = _open(spool_path, "a")
+        self.files[spool_path] = spool
+        spool.write(json.dumps(element) + "\n")
+
+    def close_files(self):
+        """Close the open spool files."""
+        while self.files:
+            self.files.popitem()[1].close()
+
+    def write(self, path):
+        """Write the features with their elements to the report file."""
+        self.close_files()
+        # Write to a temporary file first, so that the report is never left incomplete
+        tmp_path = os.path.join(self.spool_dir, "report.json")
+        with _open(tmp_path, "w") as report:
+            report.write("[")
+            for index, (feature, spool_path) in enumerate(self.features.values()):
+                if index:
+                    report.write(", ")
+                # Feature elements are the last key of the feature object
+                report.write(json.dumps(feature)[:-1] + ', "elements": [')
+                if os.path.exists(spool_path):
+                    with _open(spool_path, "r") as spool:
+                        for element_index, element in enumerate(spool):
+                            if element_index:
+                                report.write(", ")
+                            report.write(element.rstrip("\n"))
+                report.write("]}")
+            report.write("]")
+        if os.path.exists(path):
+            # os.rename doesn't replace existing files on Windows
+            os.remove(path)
+        os.rename(tmp_path, path)
+
+    def close(self):
+        """Close and remove the spool files."""
+        self.close_files()
+        shutil.rmtree(self.spool_dir, ignore_errors=True)
+
+
+# Characters changing the nesting or starting a string outside of the strings of a JSON value
+JSON_TOKEN_RE = re.compile(r'["{}\[\]]')
+# Characters ending or escaping in a JSON string
+JSON_STRING_RE = re.compile(r'["\\]')
+# End of a JSON scalar (number, true, false or null) in an array
+JSON_SCALAR_END_RE = re.compile(r"[\s,\]]")
+# Separators of the items of a JSON array
+JSON_SEPARATORS_RE = re.compile(r"[\s,]*")
+
+
+def iter_json_array(path, chunk_size=64 * 1024):
+    """Iterate over the items of the JSON array stored in the file, without loading the whole file.
+
+    The chunks are scanned once for the end of the current item, which is decoded only when it is complete.
+
+    :param str path: Path to the JSON file containing an array (e.g. a cucumber json report).
+
+    :return: Iterator over the decoded items.
+    """
+    decoder = json.JSONDecoder()
+    with _open(path, "r") as fd:
+        chunk = fd.read(chunk_size).lstrip()
+        if not chunk.startswith("["):
+            raise ValueError("{0} does not contain a JSON array.".format(path))
+        pos = 1
+        # Parts of the current item in the previous chunks
+        parts = []
+        start = None
+        depth = 0
+        in_string = escape = scalar = False
+        while True:
+            if pos >= len(chunk):
+                if start is not None:
+                    parts.append(chunk[start:])
+                    start = 0
+                chunk = fd.read(chunk_size)
+                pos = 0
+                if not chunk:
+                    raise ValueError("{0} ends in the middle of a JSON array.".format(path))
+                continue
+
+            end = None
+            if start is None:
+                pos = JSON_SEPARATORS_RE.match(chunk, pos).end()
+                if pos >= len(chunk):
+                    continue
+                char = chunk[pos]
+                if char == "]":
+                    return
+                start = pos
+                depth = 0
+                in_string = char == '"'
+                scalar = char not in '"{['
+                if not scalar:
+                    depth = int(char != '"')
+                    pos += 1
+            elif escape:
+                escape = False
+                pos += 1
+            elif in_string:
+                match = JSON_STRING_RE.search(chunk, pos)
+                if match is None:
+                    pos = len(chunk)
+                    continue
+                pos = match.end()
+                if match.group() == "\\":
+                    escape = True
+                else:
+                    in_string = False
+                    if depth == 0:
+                        end = pos
+            elif scalar:
+                match = JSON_SCALAR_END_RE.search(chunk, pos)
+                if match is None:
+                    pos = len(chunk)
+                    continue
+                pos = end = match.start()
+            else:
+                match = JSON_TOKEN_RE.search(chunk, pos)
+                if match is None:
+                    pos = len(chunk)
+                    continue
+                pos = match.end()
+                token = match.group()
+                if token == '"':
+                    in_string = True
+                elif token in "{[":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        end = pos
+
+            if end is not None:
+                parts.append(chunk[start:end])
+                yield decoder.decode("".join(parts))
+                parts = []
+                start = None
+
+
+def merge(paths, output_path):
+    """Merge cucumber json reports (e.g. shards of the same test suite) into a single report.
+
+    Elements of the features with the same id are combined, in the order of the given reports.
+    Only one feature is loaded in memory at a time.
+
+    :param list paths: Paths to the cucumber json reports.
+    :param str output_path: Path to the merged report.
+    """
+    dir_name = os.path.dirname(os.path.abspath(output_path))
+    safe_create_dir(dir_name)
+    spool = FeatureSpool(dir_name)
+    try:
+        for path in paths:
+            for feature in iter_json_array(path):
+                elements = feature.pop("elements", [])
+                if not spool.has_feature(feature["id"]):
+                    spool.add_feature(feature["id"], feature)
+                for element in elements:
+                    spool.add_element(feature["id"], element)
+        spool.write(output_path)
+    finally:
+        spool.close()
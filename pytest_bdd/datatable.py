@@ -0,0 +1,135 @@
+"""Data tables of the steps.
+
+A step can be followed by a data table, its first row is the row of the column headings:
+
+    Given there are the users:
+        | name  | age |
+        | Alice | 31  |
+        | Bob   | 27  |
+
+The table is parsed once with the feature file and stored by columns. The step function receives it as the
+``datatable`` argument, with the columns converted by the ``datatable_converters`` of the step definition:
+
+    @given("there are the users:", datatable_converters={"age": int})
+    def users(datatable):
+        return dict(zip(datatable["name"], datatable["age"]))
+
+A column is converted on its first access only, and the same table is passed to the step for every example row, so
+it is not copied nor converted again for the outline items. The table is immutable, the converted values are
+shared by all the items of the step.
+"""
+
+from collections import OrderedDict
+
+import six
+
+
+@six.python_2_unicode_compatible
+class DataTable(object):
+    """Immutable columnar data table."""
+
+    def __init__(self, headings, rows, line_number=None, converters=None, columns=None):
+        """Data table constructor.
+
+        :param list headings: Column headings.
+        :param list rows: Rows of the cell values (unicode strings), of the same length as the headings.
+        :param int line_number: Line number of the table in the feature file.
+        :param dict converters: Optional column converters in form {<heading>: <converter function>}.
+        :param tuple columns: Columns of the cell values, used instead of the rows to share them between the tables.
+        """
+        self._headings = tuple(headings)
+        if columns is None:
+            columns = tuple(zip(*rows)) if rows else tuple(() for _ in self._headings)
+        self._columns = columns
+        self._line_number = line_number
+        self._converters = dict(converters or {})
+        # Converted columns by the column index
+        self._converted = {}
+        # Tables with the converters in form [(<converters>, <table>)], by the converters identity
+        self._tables = []
+
+    @property
+    def headings(self):
+        """Column headings."""
+        return self._headings
+
+    @property
+    def line_number(self):
+        """Line number of the table in the feature file."""
+        return self._line_number
+
+    def with_converters(self, converters):
+        """Get the table with the columns converted by the given converters, sharing the cell values.
+
+        The table is created once for the same converters, so its converted columns are shared by all its users.
+
+        :param dict converters: Column converters in form {<heading>: <converter function>}.
+        """
+        if not converters:
+            return self
+        for table_converters, table in self._tables:
+            if table_converters is converters:
+                return table
+        table = DataTable(self._headings, None, self._line_number, converters, self._columns)
+        self._tables.append((converters, table))
+        return table
+
+    def column(self, heading):
+        """Get the converted values of the column.
+
+        :param str heading: Column heading.
+
+        :return: `tuple` of the values.
+        :raises KeyError: when the table has no such column.
+        """
+        try:
+            index = self._headings.index(heading)
+        except ValueError:
+            raise KeyError(heading)
+        try:
+            return self._converted[index]
+        except KeyError:
+            pass
+        column = self._columns[index]
+        converter = self._converters.get(heading)
+        if converter is not None:
+            column = tuple(converter(value) for value in column)
+        self._converted[index] = column
+        return column
+
+    def __getitem__(self, heading):
+        return self.column(heading)
+
+    def __contains__(self, heading):
+        return heading in self._headings
+
+    def __len__(self):
+        """Number of the rows without the headings."""
+        return len(self._columns[0]) if self._columns else 0
+
+    def row(self, index):
+        """Get the converted values of the row.
+
+        :param int index: Row index, the headings are not counted.
+
+        :return: `OrderedDict` in form {<heading>: <value>}.
+        """
+        return OrderedDict((heading, self.column(heading)[index]) for heading in self._headings)
+
+    def __iter__(self):
+        """Iterate the rows as `OrderedDict` in form {<heading>: <value>}."""
+        columns = [self.column(heading) for heading in self._headings]
+        for values in zip(*columns):
+            yield OrderedDict(zip(self._headings, values))
+
+    def __str__(self):
+        """Table in the feature file format."""
+        rows = [self._headings] + list(zip(*self._columns))
+        rows = [[value.replace(u"|", u"\\|") for value in row] for row in rows]
+        widths = [max(len(row[index]) for row in rows) for index in range(len(self._headings))]
+        return u"\n".join(
+            u"| {0} |".format(u" | ".join(value.ljust(width) for value, width in zip(row, widths))) for row in rows
+        )
+
+    def __repr__(self):
+        return "<DataTable {0!r} of {1} rows>".format(list(self._headings), len(self))
@@ -0,0 +1,203 @@
+"""Cucumber messages style NDJSON event stream.
+
+Every event is written as a JSON line to the events file as soon as it happens, so that the progress of the test
+run can be followed live (e.g. with ``tail -f``). The xdist workers send their events to the controller with the
+reports of the test phases, and the controller writes them as the reports arrive. The events are envelopes keyed by
+the event type:
+
+{"testStepFinished": {"testCaseId": "...", "step": {...}, "status": "passed", "duration": 0.01, ...}}
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from .utils import safe_create_dir
+
+
+def add_options(parser):
+    """Add pytest-bdd options."""
+    group = parser.getgroup("bdd", "Events")
+    group._addoption(
+        "--bdd-events",
+        action="store",
+        dest="bdd_events_path",
+        metavar="path",
+        default=None,
+        help="write the scenario and step events as JSON lines to the file at given path.",
+    )
+
+
+def configure(config):
+    events_path = config.option.bdd_events_path
+    if not events_path:
+        return
+    events_path = os.path.expanduser(os.path.expandvars(events_path))
+    if not os.path.isabs(events_path):
+        events_path = str(config.rootdir.join(events_path))
+    # xdist workers send the events to the controller
+    is_worker = hasattr(config, "workerinput")
+    config._bddevents = LogBDDEvents(events_path, is_worker=is_worker)
+    config.pluginmanager.register(config._bddevents)
+
+
+def unconfigure(config):
+    events = getattr(config, "_bddevents", None)
+    if events is not None:
+        del config._bddevents
+        events.close()
+        config.pluginmanager.unregister(events)
+
+
+def _serialize_step(step):
+    return {"keyword": step.keyword, "type": step.type, "text": step.name, "line": step.line_number}
+
+
+def get_pending_count(config):
+    """Get the number of the events not sent to the xdist controller yet."""
+    events = getattr(config, "_bddevents", None)
+    return len(events.pending) if events is not None else 0
+
+
+def get_pending(config, start=0):
+    """Get the events not sent to the xdist controller yet, emitted after the given position."""
+    events = getattr(config, "_bddevents", None)
+    return events.pending[start:] if events is not None else []
+
+
+def add_pending(config, lines):
+    """Add the events emitted in another process (e.g. a forked scenario process) to be sent to the controller."""
+    events = getattr(config, "_bddevents", None)
+    if events is not None:
+        events.pending.extend(lines)
+
+
+class LogBDDEvents(object):
+
+    """Logging plugin for the NDJSON event stream."""
+
+    def __init__(self, path, is_worker=False):
+        self.path = os.path.normpath(os.path.abspath(path))
+        self.is_worker = is_worker
+        self.file = None
+        if not is_worker:
+            safe_create_dir(os.path.dirname(self.path))
+            self.file = open(self.path, "w")
+        # Events of the xdist worker not sent to the controller yet, as JSON lines
+        self.pending = []
+        # Test cases in progress by test case id, the example rows executed in one item are separate test cases
+        self.cases = {}
+        # Start times of the steps in progress by test case id
+        self.step_started = {}
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+    def emit(self, event_type, **data):
+        """Write the event to the file, or keep it to be sent to the xdist controller."""
+        data["timestamp"] = time.time()
+        line = json.dumps({event_type: data}) + "\n"
+        if self.file is None:
+            self.pending.append(line)
+        else:
+            self.write(line)
+
+    def write(self, line):
+        self.file.write(line)
+        self.file.flush()
+
+    def pytest_sessionstart(self):
+        if not self.is_worker:
+            self.emit("testRunStarted")
+
+    def pytest_sessionfinish(self, exitstatus):
+        if not self.is_worker:
+            self.emit("testRunFinished", success=exitstatus == 0)
+
+    def pytest_runtest_logreport(self, report):
+        """Write the events sent by the xdist worker with the report."""
+        if self.file is not None:
+            for line in getattr(report, "bdd_events", ()):
+                self.write(line)
+
+    def pytest_bdd_before_scenario(self, request, feature, scenario):
+        case_id = request.node.nodeid
+        self.emit(
+            "pickle",
+            id=case_id,
+            uri=feature.rel_filename,
+            name=scenario.name,
+            line=scenario.line_number,
+            tags=sorted(scenario.tags | feature.tags),
+            steps=[_serialize_step(step) for step in scenario.steps],
+        )
+        self.cases.setdefault(case_id, []).append({"started": time.time(), "finished": None, "status": "passed"})
+        self.emit("testCaseStarted", testCaseId=case_id)
+
+    def pytest_bdd_after_scenario(self, request, feature, scenario):
+        cases = self.cases.get(request.node.nodeid)
+        if cases:
+            cases[-1]["finished"] = time.time()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        """Finish the test cases of the item once the test function is executed.
+
+        The events of the xdist worker are sent to the controller with the report.
+        """
+        outcome = yield
+        report = outcome.get_result()
+        if report.when == "call":
+            self._finish_cases(item, report)
+        if self.pending:
+            report.bdd_events = self.pending
+            self.pending = []
+
+    def _finish_cases(self, item, report):
+        cases = self.cases.pop(item.nodeid, ())
+        for index, case in enumerate(cases):
+            status = case["status"]
+            finished = case["finished"]
+            if index == len(cases) - 1:
+                # The test function is executed after the steps of the last test case
+                finished = time.time()
+                if status == "passed" and not report.passed:
+                    status = report.outcome
+            self.emit("testCaseFinished", testCaseId=item.nodeid, status=status, duration=finished - case["started"])
+
+    def pytest_bdd_before_step(self, request, feature, scenario, step, step_func):
+        self._step_started(request, step)
+
+    def _step_started(self, request, step):
+        case_id = request.node.nodeid
+        self.step_started[case_id] = time.time()
+        self.emit("testStepStarted", testCaseId=case_id, step=_serialize_step(step))
+
+    def _step_finished(self, request, step, status, error=None):
+        case_id = request.node.nodeid
+        started = self.step_started.pop(case_id, None)
+        cases = self.cases.get(case_id)
+        if status != "passed" and cases:
+            cases[-1]["status"] = "failed"
+        self.emit(
+            "testStepFinished",
+            testCaseId=case_id,
+            step=_serialize_step(step),
+            status=status,
+            duration=time.time() - started if started is not None else None,
+            error=error,
+        )
+
+    def pytest_bdd_after_step(self, request, feature, scenario, step, step_func, step_func_args):
+        self._step_finished(request, step, "passed")
+
+    def pytest_bdd_step_error(self, request, feature, scenario, step, step_func, step_func_args, exception):
+        self._step_finished(request, step, "failed", error=repr(exception))
+
+    def pytest_bdd_step_func_lookup_error(self, request, feature, scenario, step, exception):
+        # The step is not started by the before step hook, as its function is not found
+        self._step_started(request, step)
+        self._step_finished(request, step, "undefined", error=repr(exception))
@@ -30,14 +30,30 @@ class StepDefinitionNotFoundError(Exception):
     """Step definition not found."""
 
 
+class TagExpressionError(Exception):
+    """Tag expression is not valid."""
+
+
+class ExampleRowsFailedError(Exception):
+    """Example rows executed in one item failed."""
+
+
 class InvalidStepParserError(Exception):
     """Invalid step parser."""
 
 
+class StepPatternError(Exception):
+    """Step parser pattern can not be compiled."""
+
+
 class NoScenariosFound(Exception):
     """No scenarios found."""
 
 
+class ForkedScenarioError(Exception):
+    """Scenario failed in the forked process."""
+
+
 @six.python_2_unicode_compatible
 class FeatureError(Exception):
     """Feature parse error."""
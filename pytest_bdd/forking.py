@@ -0,0 +1,97 @@
+"""Forked scenario execution.
+
+The scenario steps are executed in a child process forked after the background, so that every scenario
+starts from the same warmed up state of the parent process and its side effects are discarded afterwards.
+The step reports and the outcome of the child are sent back to the parent through a pipe.
+"""
+
+import json
+import os
+import sys
+import traceback
+
+import pytest
+
+from . import events
+from . import exceptions
+from . import reporting
+from . import step_cache
+
+
+def is_supported():
+    """Check if the platform supports forking."""
+    return hasattr(os, "fork")
+
+
+def execute_forked(request, func):
+    """Execute the function in a forked child process.
+
+    :param request: pytest fixture request.
+    :param func: Function executing the scenario steps.
+
+    :raises ForkedScenarioError: when the function failed in the child process.
+    """
+    step_reports_count = reporting.get_step_reports_count(request.node)
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover (executed in the child process)
+        os.close(read_fd)
+        exit_code = 1
+        try:
+            _run_child(request, func, step_reports_count, write_fd)
+            exit_code = 0
+        except BaseException:
+            # The result could not be sent to the parent
+            traceback.print_exc()
+        finally:
+            os._exit(exit_code)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        data = pipe.read()
+    _, status = os.waitpid(pid, 0)
+    if status != 0 or not data:
+        raise exceptions.ForkedScenarioError(
+            "Forked scenario process exited unexpectedly with {0}.".format(_format_status(status))
+        )
+
+    result = json.loads(data.decode("utf-8"))
+    reporting.add_serialized_step_reports(request.node, result["steps"])
+    step_cache.add_counts(result["step_cache"])
+    events.add_pending(request.config, result["events"])
+    if result["outcome"] == "skipped":
+        pytest.skip(result["message"])
+    elif result["outcome"] == "xfailed":
+        pytest.xfail(result["message"])
+    elif result["outcome"] == "failed":
+        raise exceptions.ForkedScenarioError(result["message"])
+
+
+def _format_status(status):
+    """Format the exit status of the child process returned by `os.waitpid`."""
+    if os.WIFSIGNALED(status):
+        return "signal {0}".format(os.WTERMSIG(status))
+    return "exit code {0}".format(os.WEXITSTATUS(status))
+
+
+def _run_child(request, func, step_reports_count, write_fd):
+    """Execute the function and write the result to the pipe."""
+    result = {"outcome": "passed", "message": None}
+    step_cache_counts = step_cache.get_counts()
+    events_count = events.get_pending_count(request.config)
+    try:
+        func()
+    except pytest.skip.Exception as exception:
+        result.update(outcome="skipped", message=exception.msg)
+    except pytest.xfail.Exception as exception:
+        result.update(outcome="xfailed", message=exception.msg)
+    except BaseException:
+        result.update(outcome="failed", message=traceback.format_exc())
+    result["steps"] = reporting.serialize_step_reports(request.node, start=step_reports_count)
+    result["step_cache"] = step_cache.get_counts_since(step_cache_counts)
+    result["events"] = events.get_pending(request.config, events_count)
+
+    for stream in (sys.stdout, sys.stderr):
+        stream.flush()
+    with os.fdopen(write_fd, "wb") as pipe:
+        pipe.write(json.dumps(result).encode("utf-8"))
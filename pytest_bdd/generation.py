@@ -6,13 +6,16 @@ import os.path
 from mako.lookup import TemplateLookup
 import py
 
-from .scenario import find_argumented_step_fixture_name, make_python_docstring, make_python_name, make_string_literal
-from .steps import get_step_fixture_name
+from .scenario import get_general_step_defs, make_python_docstring, make_python_name, make_string_literal
+from .steps import get_step_fixture_name, is_step_matching
 from .feature import get_features
 from .types import STEP_TYPES
 
 
-template_lookup = TemplateLookup(directories=[os.path.join(os.path.dirname(__file__), "templates")])
+# The templates are compiled once per process, without checking the template files for changes
+template_lookup = TemplateLookup(
+    directories=[os.path.join(os.path.dirname(__file__), "templates")], filesystem_checks=False
+)
 
 
 def add_options(parser):
@@ -109,21 +112,83 @@ def print_missing_code(scenarios, steps):
     tw.write(code)
 
 
-def _find_step_fixturedef(fixturemanager, item, name, type_, encoding="utf-8"):
-    """Find step fixturedef.
-
-    :param request: PyTest Item object.
-    :param step: `Step`.
-
-    :return: Step function.
-    """
-    fixturedefs = fixturemanager.getfixturedefs(get_step_fixture_name(name, type_, encoding), item.nodeid)
-    if not fixturedefs:
-        name = find_argumented_step_fixture_name(name, type_, fixturemanager)
-        if name:
-            return _find_step_fixturedef(fixturemanager, item, name, encoding)
-    else:
-        return fixturedefs
+class StepDefinitionIndex(object):
+    """Index of the step definitions, to look up the steps of all the collected items at once."""
+
+    def __init__(self, fixturemanager, encoding="utf-8"):
+        """Build the index of the step definitions.
+
+        :param fixturemanager: pytest fixture manager.
+        :param str encoding: Step name encoding.
+        """
+        self.fixturemanager = fixturemanager
+        self.encoding = encoding
+        # Step fixture functions of the argumented steps
+        self.step_fixture_funcs = []
+        for fixturedefs in list(fixturemanager._arg2fixturedefs.values()):
+            for fixturedef in fixturedefs:
+                if getattr(fixturedef.func, "parser", None) is not None:
+                    self.step_fixture_funcs.append(fixturedef.func)
+        self.general_step_defs = get_general_step_defs()
+        # Found step fixture names by (<step type>, <step name>)
+        self.fixture_names = {}
+        # Step functions by (<step type>, <step name>, <item location>)
+        self.found = {}
+
+    def _get_fixture_names(self, name, type_):
+        """Get the names of the step fixtures the step may be defined with."""
+        key = (type_, name)
+        try:
+            return self.fixture_names[key]
+        except KeyError:
+            pass
+        fixture_names = [get_step_fixture_name(name, type_, self.encoding)]
+        fixture_names.extend(
+            get_step_fixture_name(func.parser.name, type_)
+            for func in self.step_fixture_funcs
+            if is_step_matching(func, name)
+        )
+        self.fixture_names[key] = fixture_names
+        return fixture_names
+
+    def get_step_function(self, item, name, type_):
+        """Get the function of the step visible to the item.
+
+        :param item: pytest item.
+        :param str name: Step name.
+        :param str type_: Step type.
+
+        :return: Step function or `None` if the step is not defined.
+        """
+        # Fixtures visible to the items of the same module are the same
+        key = (type_, name, item.parent.nodeid)
+        try:
+            return self.found[key]
+        except KeyError:
+            pass
+        fixture_names = self._get_fixture_names(name, type_)
+        step_func = None
+        for fixture_name in fixture_names:
+            fixturedefs = self.fixturemanager.getfixturedefs(fixture_name, item.nodeid)
+            if fixturedefs:
+                # Step fixtures return the step function
+                step_func = fixturedefs[-1].func()
+                break
+        else:
+            lazy_step_func = self.general_step_defs.get(fixture_names[0])
+            if lazy_step_func is not None:
+                step_func = lazy_step_func.__pytest_wrapped__.obj()
+        self.found[key] = step_func
+        return step_func
+
+    def is_defined(self, item, name, type_):
+        """Check if the step is defined for the item.
+
+        :param item: pytest item.
+        :param str name: Step name.
+        :param str type_: Step type.
+        """
+        return self.get_step_function(item, name, type_) is not None
 
 
 def parse_feature_files(paths, **kwargs):
@@ -172,24 +237,23 @@ def _show_missing_code_main(config, session):
         session.exitstatus = 100
         return
 
+    # The features are parsed once, the scenarios of the collected items come from the same feature cache
     features, scenarios, steps = parse_feature_files(config.option.features)
 
+    index = StepDefinitionIndex(fm)
+    bound_scenarios = set()
+    defined_steps = set()
     for item in session.items:
         scenario = getattr(item.obj, "__scenario__", None)
         if scenario:
-            if scenario in scenarios:
-                scenarios.remove(scenario)
+            bound_scenarios.add(scenario)
             for step in scenario.steps:
-                fixturedefs = _find_step_fixturedef(fm, item, step.name, step.type)
-                if fixturedefs:
-                    try:
-                        steps.remove(step)
-                    except ValueError:
-                        pass
-    for scenario in scenarios:
-        for step in scenario.steps:
-            if step.background is None:
-                steps.remove(step)
+                if step not in defined_steps and index.is_defined(item, step.name, step.type):
+                    defined_steps.add(step)
+    scenarios = [scenario for scenario in scenarios if scenario not in bound_scenarios]
+    # Steps of the scenarios which are not bound are generated along with the scenarios
+    unbound_steps = set(step for scenario in scenarios for step in scenario.steps if step.background is None)
+    steps = [step for step in steps if step not in defined_steps and step not in unbound_steps]
     grouped_steps = group_steps(steps)
     print_missing_code(scenarios, grouped_steps)
 
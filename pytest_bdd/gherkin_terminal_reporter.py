@@ -2,11 +2,17 @@
 
 from __future__ import unicode_literals
 
-import re
-
 from _pytest.terminal import TerminalReporter
 
-from .parser import STEP_PARAM_RE
+from .parser import expand_step_template
+
+# Words and markups of the outcomes of the example rows executed in one item
+ROW_OUTCOMES = {
+    "passed": ("PASSED", {"green": True}),
+    "failed": ("FAILED", {"red": True}),
+    "skipped": ("SKIPPED", {"yellow": True}),
+    "xfailed": ("XFAIL", {"yellow": True}),
+}
 
 
 def add_options(parser):
@@ -43,8 +49,6 @@ def configure(config):
         gherkin_reporter = GherkinTerminalReporter(config)
         config.pluginmanager.unregister(current_reporter)
         config.pluginmanager.register(gherkin_reporter, "terminalreporter")
-        if config.pluginmanager.getplugin("dsession"):
-            raise Exception("gherkin-terminal-reporter is not compatible with 'xdist' plugin.")
 
 
 class GherkinTerminalReporter(TerminalReporter):
@@ -72,49 +76,47 @@ class GherkinTerminalReporter(TerminalReporter):
         feature_markup = {"blue": True}
         scenario_markup = word_markup
 
-        if self.verbosity <= 0:
+        if self.verbosity <= 0 or not hasattr(report, "scenario"):
             return TerminalReporter.pytest_runtest_logreport(self, rep)
-        elif self.verbosity == 1:
-            if hasattr(report, "scenario"):
-                self.ensure_newline()
-                self._tw.write("Feature: ", **feature_markup)
-                self._tw.write(report.scenario["feature"]["name"], **feature_markup)
-                self._tw.write("\n")
-                self._tw.write("    Scenario: ", **scenario_markup)
-                self._tw.write(report.scenario["name"], **scenario_markup)
-                self._tw.write(" ")
-                self._tw.write(word, **word_markup)
-                self._tw.write("\n")
-            else:
-                return TerminalReporter.pytest_runtest_logreport(self, rep)
-        elif self.verbosity > 1:
-            if hasattr(report, "scenario"):
-                self.ensure_newline()
-                self._tw.write("Feature: ", **feature_markup)
-                self._tw.write(report.scenario["feature"]["name"], **feature_markup)
-                self._tw.write("\n")
-                self._tw.write("    Scenario: ", **scenario_markup)
-                self._tw.write(report.scenario["name"], **scenario_markup)
-                self._tw.write("\n")
-                for step in report.scenario["steps"]:
-                    if self.config.option.expand:
-                        step_name = self._format_step_name(step["name"], **report.scenario["example_kwargs"])
-                    else:
-                        step_name = step["name"]
-                    self._tw.write("        {} {}\n".format(step["keyword"], step_name), **scenario_markup)
-                self._tw.write("    " + word, **word_markup)
-                self._tw.write("\n\n")
+
+        # With pytest-xdist the report is deserialized on the master, and the scenario is the serialized one
+        scenario = report.scenario
+        lines = [
+            self._tw.markup("Feature: ", **feature_markup),
+            self._tw.markup(scenario["feature"]["name"], **feature_markup),
+            "\n",
+            self._tw.markup("    Scenario: ", **scenario_markup),
+            self._tw.markup(scenario["name"], **scenario_markup),
+        ]
+        if self.verbosity == 1:
+            lines.extend([" ", self._tw.markup(word, **word_markup), "\n"])
+        else:
+            lines.append("\n")
+            rows = scenario.get("rows")
+            if rows:
+                # The example rows executed in one item are reported as blocks of steps with their own result
+                for row in rows:
+                    row_word, row_markup = ROW_OUTCOMES[row["outcome"]]
+                    example = ", ".join(
+                        "{}={}".format(name, value) for name, value in sorted(row["example_kwargs"].items())
+                    )
+                    lines.append(self._tw.markup("      Example: {}\n".format(example), **row_markup))
+                    lines.extend(self._format_steps(row["steps"], row["example_kwargs"], row_markup))
+                    lines.extend([self._tw.markup("      " + row_word, **row_markup), "\n"])
             else:
-                return TerminalReporter.pytest_runtest_logreport(self, rep)
+                lines.extend(self._format_steps(scenario["steps"], scenario["example_kwargs"], scenario_markup))
+            lines.extend([self._tw.markup("    " + word, **word_markup), "\n\n"])
+        self.ensure_newline()
+        # Write the whole scenario at once, the terminal output is the bottleneck of the verbose runs
+        self._tw.write("".join(lines))
         self.stats.setdefault(cat, []).append(rep)
 
-    def _format_step_name(self, step_name, **example_kwargs):
-        while True:
-            param_match = re.search(STEP_PARAM_RE, step_name)
-            if not param_match:
-                break
-            param_token = param_match.group(0)
-            param_name = param_match.group(1)
-            param_value = example_kwargs[param_name]
-            step_name = step_name.replace(param_token, param_value)
-        return step_name
+    def _format_steps(self, steps, example_kwargs, markup):
+        lines = []
+        for step in steps:
+            if self.config.option.expand:
+                step_name = expand_step_template(step["template"], example_kwargs)
+            else:
+                step_name = step["name"]
+            lines.append(self._tw.markup("        {} {}\n".format(step["keyword"], step_name), **markup))
+        return lines
@@ -8,6 +8,8 @@ import six
 import json
 
 from . import types, exceptions
+from .datatable import DataTable
+from .sampling import get_sampling
 
 SPLIT_LINE_RE = re.compile(r"(?<!\\)\|")
 COMMENT_RE = re.compile(r"(^|(?<=\s))#")
@@ -64,6 +66,30 @@ def strip_comments(line):
     return line.strip()
 
 
+def parse_datatable_row(line, rows, line_number, filename):
+    """Parse the data table row of a step.
+
+    :param str line: Line of the Feature file, without the indentation.
+    :param list rows: Previous rows of the data table.
+    :param int line_number: Line number.
+    :param str filename: Feature file name.
+
+    :return: List of strings.
+    """
+    line = line.rstrip()
+    cells = split_line(line)
+    if not cells or not line.startswith("|") or not line.endswith("|") or line.endswith("\\|"):
+        raise exceptions.FeatureError("Data table row is expected", line_number, line, filename)
+    if rows and len(cells) != len(rows[0]):
+        raise exceptions.FeatureError(
+            "Data table row has {0} cells, the table has {1} columns".format(len(cells), len(rows[0])),
+            line_number,
+            line,
+            filename,
+        )
+    return cells
+
+
 def get_step_type(line):
     """Detect step type by the beginning of the line.
 
@@ -102,6 +128,9 @@ def parse_feature(basedir, filename, encoding="utf-8"):
     description = []
     step = None
     multiline_step = False
+    # Data table rows of the current step
+    datatable_rows = []
+    datatable_line_number = None
     prev_line = None
 
     with io.open(abs_filename, "rt", encoding=encoding) as f:
@@ -112,10 +141,20 @@ def parse_feature(basedir, filename, encoding="utf-8"):
         line_indent = len(line) - len(unindented_line)
         if step and (step.indent < line_indent or ((not unindented_line) and multiline_step)):
             multiline_step = True
+            if datatable_rows or (unindented_line.startswith("|") and not step.lines):
+                # data table step, the comments and the empty lines between the rows are skipped
+                if unindented_line and not unindented_line.startswith("#"):
+                    if not datatable_rows:
+                        datatable_line_number = line_number
+                    datatable_rows.append(parse_datatable_row(unindented_line, datatable_rows, line_number, filename))
+                continue
             # multiline step, so just add line and continue
             step.add_line(line)
             continue
         else:
+            if datatable_rows:
+                step.datatable = DataTable(datatable_rows[0], datatable_rows[1:], datatable_line_number)
+                datatable_rows = []
             step = None
             multiline_step = False
         stripped_line = line.strip()
@@ -178,7 +217,7 @@ def parse_feature(basedir, filename, encoding="utf-8"):
             (scenario or feature).examples.set_param_names([l for l in split_line(parsed_line) if l])
             mode = types.EXAMPLE_LINE
         elif mode == types.EXAMPLE_LINE:
-            (scenario or feature).examples.add_example([l for l in split_line(stripped_line)])
+            (scenario or feature).examples.add_example([l for l in split_line(stripped_line)], line_number)
         elif mode == types.EXAMPLE_LINE_VERTICAL:
             param_line_parts = [l for l in split_line(stripped_line)]
             try:
@@ -206,6 +245,8 @@ def parse_feature(basedir, filename, encoding="utf-8"):
                 target = scenario
             target.add_step(step)
         prev_line = clean_line
+    if datatable_rows:
+        step.datatable = DataTable(datatable_rows[0], datatable_rows[1:], datatable_line_number)
     if scenario:
         scenario.try_rock_current_examples()
     feature.try_rock_current_examples()
@@ -317,13 +358,19 @@ class Scenario(object):
             feature_params.update(examples.example_params)
         return scenario_params.intersection(feature_params)
 
-    def get_params(self, builtin=False):
-        """Get converted example params."""
+    def get_params(self, builtin=False, sample=True):
+        """Get converted example params.
+
+        :param bool sample: Sample the example rows if the rows are sampled in the current pytest session.
+        """
+        sample_key = self.feature.rel_filename if sample else None
         for examples in self.examples_collections:
-            yield examples.get_params(self.example_converters, builtin=builtin)
+            yield examples.get_params(self.example_converters, builtin=builtin, sample_key=sample_key)
         duplicate_params = self.get_duplicate_example_params()
         for examples in self.feature.examples_collections:
-            yield examples.get_params(self.example_converters, builtin=builtin, ignore_params=duplicate_params)
+            yield examples.get_params(
+                self.example_converters, builtin=builtin, ignore_params=duplicate_params, sample_key=sample_key
+            )
 
     def validate(self):
         """Validate the scenario.
@@ -362,9 +409,9 @@ class Step(object):
         :param int line_number: line number.
         :param str keyword: step keyword.
         """
+        self.lines = []
         self.name = name
         self.keyword = keyword
-        self.lines = []
         self.indent = indent
         self.type = type
         self.line_number = line_number
@@ -376,6 +423,7 @@ class Step(object):
         self.constant_params = {}
         self.alias_params = {}
         self.alias_convert = {}
+        self.datatable = None
 
         self._init_step_args_convert()
 
@@ -457,6 +505,7 @@ class Step(object):
         :param str line: Line of text - the continuation of the step name.
         """
         self.lines.append(line)
+        self.template = StepTemplate(self.name)
 
     @property
     def name(self):
@@ -476,8 +525,16 @@ class Step(object):
 
     @name.setter
     def name(self, value):
-        """Set step name."""
+        """Set step name and compile its template."""
         self._name = value
+        self.template = StepTemplate(self.name)
+
+    def expand(self, example_kwargs):
+        """Get the step name filled in with the example values.
+
+        :param dict example_kwargs: Example values (unicode strings) by the parameter name.
+        """
+        return self.template.expand(example_kwargs)
 
     def __str__(self):
         """Full step name including the type."""
@@ -519,6 +576,7 @@ class Examples(object):
         """Initialize examples instance."""
         self.example_params = []
         self.examples = []
+        self.example_line_numbers = []
         self.vertical_examples = []
         self.line_number = None
         self.name = None
@@ -530,12 +588,14 @@ class Examples(object):
         """
         self.example_params = [str(key) for key in keys]
 
-    def add_example(self, values):
+    def add_example(self, values, line_number=None):
         """Add example.
 
         :param values: `list` of `string` parameter values.
+        :param int line_number: Line number of the example row.
         """
         self.examples.append(values)
+        self.example_line_numbers.append(line_number)
 
     def add_example_row(self, param, values):
         """Add example row.
@@ -550,10 +610,12 @@ class Examples(object):
         self.example_params.append(param)
         self.vertical_examples.append(values)
 
-    def get_params(self, converters, builtin=False, ignore_params=None):
+    def get_params(self, converters, builtin=False, ignore_params=None, sample_key=None):
         """Get scenario pytest parametrization table.
 
         :param converters: `dict` of converter functions to convert parameter values
+        :param str sample_key: Key of the example table (the feature file) to sample the rows by, if the rows are
+            sampled in the current pytest session.
         """
         if ignore_params is None:
             ignore_params = set()
@@ -573,8 +635,15 @@ class Examples(object):
             else:
                 example_params = self.example_params
 
+            examples = self.examples
+            sampling = get_sampling() if sample_key is not None else None
+            if sampling is not None:
+                examples = sampling.sample(
+                    u"{0}:{1}".format(sample_key, self.line_number), self.example_params, examples
+                )
+
             params = []
-            for example in self.examples:
+            for example in examples:
                 example = list(example)
                 for index, param in enumerate(self.example_params):
                     if param in ignore_params:
@@ -612,3 +681,42 @@ def get_tags(line):
 
 
 STEP_PARAM_RE = re.compile(r"\<(.+?)\>")
+
+
+class StepTemplate(object):
+    """Step name compiled into the literal and the parameter segments."""
+
+    def __init__(self, name):
+        """Step template constructor.
+
+        :param str name: Step name with the ``<param>`` placeholders.
+        """
+        self.name = name
+        # Literals are at the even positions, the parameter names at the odd ones
+        self.segments = STEP_PARAM_RE.split(name)
+
+    def expand(self, example_kwargs):
+        """Fill in the step name with the example values.
+
+        Placeholders of the parameters missing in the example are kept as they are.
+
+        :param dict example_kwargs: Example values (unicode strings) by the parameter name.
+
+        :return: Expanded step name.
+        """
+        return expand_step_template(self.segments, example_kwargs)
+
+
+def expand_step_template(segments, example_kwargs):
+    """Fill in the compiled step name with the example values.
+
+    :param list segments: `StepTemplate` segments, e.g. serialized in the step report.
+    :param dict example_kwargs: Example values (unicode strings) by the parameter name.
+
+    :return: Expanded step name.
+    """
+    segments = list(segments)
+    for index in range(1, len(segments), 2):
+        param = segments[index]
+        segments[index] = example_kwargs[param] if param in example_kwargs else "<{0}>".format(param)
+    return "".join(segments)
@@ -8,7 +8,15 @@ import parse as base_parse
 import six
 from parse_type import cfparse as base_cfparse
 
-from .exceptions import InvalidStepParserError
+from .exceptions import InvalidStepParserError, StepPatternError
+
+
+def raise_pattern_error(parser, exception):
+    """Raise the error of the parser pattern which can not be compiled.
+
+    :raises StepPatternError: caused by the compilation error.
+    """
+    six.raise_from(StepPatternError(u'Step pattern "{0}" is not valid: {1}'.format(parser.name, exception)), exception)
 
 
 class StepParser(object):
@@ -33,9 +41,21 @@ class re(StepParser):
     """Regex step parser."""
 
     def __init__(self, name, *args, **kwargs):
-        """Compile regex."""
+        """Store the regex, it is compiled when the step is matched for the first time."""
         super(re, self).__init__(name)
-        self.regex = base_re.compile(self.name, *args, **kwargs)
+        self.args = args
+        self.kwargs = kwargs
+        self._regex = None
+
+    @property
+    def regex(self):
+        """Compiled regex."""
+        if self._regex is None:
+            try:
+                self._regex = base_re.compile(self.name, *self.args, **self.kwargs)
+            except base_re.error as exception:
+                raise_pattern_error(self, exception)
+        return self._regex
 
     def parse_arguments(self, name):
         """Get step arguments.
@@ -53,9 +73,25 @@ class parse(StepParser):
     """parse step parser."""
 
     def __init__(self, name, *args, **kwargs):
-        """Compile parse expression."""
+        """Store the parse expression, it is compiled when the step is matched for the first time."""
         super(parse, self).__init__(name)
-        self.parser = base_parse.compile(self.name, *args, **kwargs)
+        self.args = args
+        self.kwargs = kwargs
+        self._parser = None
+
+    def compile(self):
+        """Compile the parse expression."""
+        return base_parse.compile(self.name, *self.args, **self.kwargs)
+
+    @property
+    def parser(self):
+        """Compiled parse expression."""
+        if self._parser is None:
+            try:
+                self._parser = self.compile()
+            except (ValueError, base_re.error) as exception:
+                raise_pattern_error(self, exception)
+        return self._parser
 
     def parse_arguments(self, name):
         """Get step arguments.
@@ -66,8 +102,9 @@ class parse(StepParser):
 
     def is_matching(self, name):
         """Match given name with the step name."""
+        parser = self.parser
         try:
-            return bool(self.parser.parse(name))
+            return bool(parser.parse(name))
         except ValueError:
             return False
 
@@ -75,10 +112,9 @@ class parse(StepParser):
 class cfparse(parse):
     """cfparse step parser."""
 
-    def __init__(self, name, *args, **kwargs):
-        """Compile parse expression."""
-        super(parse, self).__init__(name)
-        self.parser = base_cfparse.Parser(self.name, *args, **kwargs)
+    def compile(self):
+        """Compile the parse expression."""
+        return base_cfparse.Parser(self.name, *self.args, **self.kwargs)
 
 
 class string(StepParser):
@@ -1,12 +1,24 @@
 """Pytest plugin entry point. Used for any fixtures needed."""
 
+import sys
+
 import pytest
 
 from . import given, when, then
+from . import collector
 from . import cucumber_json
+from . import events
 from . import generation
 from . import reporting
+from . import result_cache
+from . import sampling
+from . import scheduling
+from . import selection
 from . import gherkin_terminal_reporter
+from . import step_cache
+from . import tag_expression
+from .scenario import teardown_shared_background
+from .types import OPTION_TAG_PREFIXES
 from .utils import CONFIG_STACK
 
 
@@ -29,20 +41,46 @@ def pytest_addoption(parser):
     """Add pytest-bdd options."""
     add_bdd_ini(parser)
     cucumber_json.add_options(parser)
+    events.add_options(parser)
     generation.add_options(parser)
     gherkin_terminal_reporter.add_options(parser)
+    scheduling.add_options(parser)
+    selection.add_options(parser)
+    result_cache.add_options(parser)
+    sampling.add_options(parser)
+    tag_expression.add_options(parser)
 
 
 def add_bdd_ini(parser):
+    collector.add_ini(parser)
     parser.addini("bdd_features_base_dir", "Base features directory.")
     parser.addini("bdd_steps_def_dir", "Base steps definition directory.")
+    parser.addini(
+        "bdd_background_scope",
+        "Background execution scope: 'function' (for every scenario), 'feature' (once per feature) "
+        "or 'fork' (once per feature, scenarios are executed in forked processes).",
+        default="function",
+    )
+    parser.addini(
+        "bdd_rows_in_one_item",
+        "Execute all the example rows of a scenario outline in one test item.",
+        type="bool",
+        default=False,
+    )
 
 
 @pytest.mark.trylast
 def pytest_configure(config):
     """Configure all subplugins."""
     CONFIG_STACK.append(config)
+    reporting.configure(config)
+    tag_expression.configure(config)
+    selection.configure(config)
+    sampling.configure(config)
+    collector.configure(config)
     cucumber_json.configure(config)
+    events.configure(config)
+    result_cache.configure(config)
     gherkin_terminal_reporter.configure(config)
 
 
@@ -50,6 +88,9 @@ def pytest_unconfigure(config):
     """Unconfigure all subplugins."""
     CONFIG_STACK.pop()
     cucumber_json.unconfigure(config)
+    events.unconfigure(config)
+    result_cache.unconfigure(config)
+    step_cache.unconfigure()
 
 
 @pytest.mark.hookwrapper
@@ -58,6 +99,18 @@ def pytest_runtest_makereport(item, call):
     reporting.runtest_makereport(item, call, outcome.get_result())
 
 
+@pytest.hookimpl(hookwrapper=True, optionalhook=True)
+def pytest_report_to_serializable(config, report):
+    outcome = yield
+    reporting.compact_serialized_report(config, outcome.get_result())
+
+
+@pytest.hookimpl(hookwrapper=True, optionalhook=True)
+def pytest_report_from_serializable(config, data):
+    reporting.restore_serialized_report(config, data)
+    yield
+
+
 @pytest.mark.tryfirst
 def pytest_bdd_before_scenario(request, feature, scenario):
     reporting.before_scenario(request, feature, scenario)
@@ -78,32 +131,75 @@ def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func
     reporting.after_step(request, feature, scenario, step, step_func, step_func_args)
 
 
+def pytest_sessionfinish(session):
+    step_cache.sessionfinish(session.config)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    step_cache.testnodedown(node.config, node)
+
+
+def pytest_terminal_summary(terminalreporter):
+    step_cache.terminal_summary(terminalreporter)
+
+
+def pytest_runtest_teardown(item, nextitem):
+    teardown_shared_background(item, nextitem)
+
+
+@pytest.mark.tryfirst
+def pytest_load_initial_conftests(early_config, parser, args):
+    selection.load_initial_conftests(early_config, args)
+
+
 def pytest_cmdline_main(config):
     return generation.cmdline_main(config)
 
 
 def pytest_bdd_apply_tag(tag, function):
+    if tag.startswith(OPTION_TAG_PREFIXES):
+        # Option tags are not valid marker names
+        return True
     mark = getattr(pytest.mark, tag)
     return mark(function)
 
 
 @pytest.mark.tryfirst
 def pytest_collection_modifyitems(session, config, items):
-    """Re-order items using the creation counter as fallback.
+    """Deselect the scenario items not selected by the line and re-order them in their declaration order.
 
     Pytest has troubles to correctly order the test items for python < 3.6.
     For this reason, we have to apply some better ordering for pytest_bdd scenario-decorated test functions.
 
-    This is not needed for python 3.6+, but this logic is safe to apply in that case as well.
+    This is not needed for python 3.6+, where the module members keep their declaration order.
     """
-    # TODO: Try to only re-sort the items that have __pytest_bdd_counter__, and not the others,
-    #  since there may be other hooks that are executed before this and that want to reorder item as well
-    def item_key(item):
-        if isinstance(item, pytest.Function):
-            declaration_order = getattr(item.function, "__pytest_bdd_counter__", 0)
-        else:
-            declaration_order = 0
-        func, linenum = item.reportinfo()[:2]
-        return (func, linenum if linenum is not None else -1, declaration_order)
-
-    items.sort(key=item_key)
+    selection.deselect_items(config, items)
+    if sys.version_info < (3, 6):
+        reorder_scenario_items(items)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection_finish(session):
+    with scheduling.feature_group_node_ids(session.config, session.items):
+        yield
+
+
+def reorder_scenario_items(items):
+    """Sort the scenario items by the declaration order, keeping the positions of the other items."""
+    positions = []
+    scenario_items = []
+    for position, item in enumerate(items):
+        declaration_order = getattr(getattr(item, "function", None), "__pytest_bdd_counter__", None)
+        if declaration_order is not None:
+            positions.append(position)
+            scenario_items.append((declaration_order, item))
+    # The sort is stable, the parametrized items of the same scenario keep their order
+    scenario_items.sort(key=lambda scenario_item: scenario_item[0])
+    for position, (_, item) in zip(positions, scenario_items):
+        items[position] = item
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    return scheduling.make_scheduler(config, log)
@@ -7,7 +7,6 @@ that enriches the pytest test reporting.
 import time
 
 from .feature import force_unicode
-from .utils import get_parametrize_markers_args
 
 
 class StepReport(object):
@@ -15,6 +14,8 @@ class StepReport(object):
 
     failed = False
     stopped = None
+    # The step of the shared background executed by another scenario
+    reused = False
 
     def __init__(self, step):
         """Step report constructor.
@@ -32,13 +33,28 @@ class StepReport(object):
         """
         return {
             "name": self.step.name,
+            "template": self.step.template.segments,
             "type": self.step.type,
             "keyword": self.step.keyword,
             "line_number": self.step.line_number,
             "failed": self.failed,
+            "reused": self.reused,
             "duration": self.duration,
         }
 
+    @classmethod
+    def deserialize(cls, step, data):
+        """Restore the step excecution report serialized in another process.
+
+        :param pytest_bdd.parser.Step step: Step.
+        :param dict data: Serialized step excecution report.
+        """
+        report = cls(step=step)
+        report.stopped = report.started + data["duration"]
+        report.failed = data["failed"]
+        report.reused = data["reused"]
+        return report
+
     def finalize(self, failed):
         """Stop collecting information and finalize the report.
 
@@ -71,18 +87,21 @@ class ScenarioReport(object):
         """
         self.scenario = scenario
         self.step_reports = []
-        self.param_index = None
-        parametrize_args = get_parametrize_markers_args(node)
-        if parametrize_args and scenario.examples:
-            param_names = (
-                parametrize_args[0] if isinstance(parametrize_args[0], (tuple, list)) else [parametrize_args[0]]
-            )
-            param_values = parametrize_args[1]
-            node_param_values = [node.funcargs[param_name] for param_name in param_names]
-            if node_param_values in param_values:
-                self.param_index = param_values.index(node_param_values)
-            elif tuple(node_param_values) in param_values:
-                self.param_index = param_values.index(tuple(node_param_values))
+        self.serialized = None
+        # Outcome of the example row executed in one item with the other rows
+        self.outcome = None
+        self.examples = []
+        self.row_indexes = []
+        for examples, row_indexes, rows in get_scenario_examples(scenario):
+            values = [node.funcargs[param_name] for param_name in examples["rows"][0]]
+            try:
+                row_index = row_indexes.get(tuple(values))
+            except TypeError:
+                # Unhashable converted values
+                row_index = rows.index(values) if values in rows else None
+            self.examples.append(examples)
+            self.row_indexes.append(row_index)
+        self.param_index = self.row_indexes[0] if self.row_indexes else None
         self.example_kwargs = {
             example_param: force_unicode(node.funcargs[example_param])
             for example_param in scenario.get_example_params()
@@ -114,7 +133,6 @@ class ScenarioReport(object):
         scenario = self.scenario
         feature = scenario.feature
 
-        params = sum(scenario.get_params(builtin=True), []) if scenario.examples else None
         return {
             "steps": [step_report.serialize() for step_report in self.step_reports],
             "name": scenario.name,
@@ -129,21 +147,15 @@ class ScenarioReport(object):
                 "tags": sorted(feature.tags),
             },
             "examples": [
-                {
-                    "name": scenario.examples.name,
-                    "line_number": scenario.examples.line_number,
-                    "rows": params,
-                    "row_index": self.param_index,
-                }
-            ]
-            if scenario.examples
-            else [],
+                dict(examples, row_index=row_index) for examples, row_index in zip(self.examples, self.row_indexes)
+            ],
             "example_kwargs": self.example_kwargs,
         }
 
     def fail(self):
         """Stop collecting information and finalize the report as failed."""
         self.current_step_report.finalize(failed=True)
+        # The steps are reported in order, the same step can be used more than once
         remaining_steps = self.scenario.steps[len(self.step_reports) :]
 
         # Fail the rest of the steps and make reports.
@@ -153,6 +165,66 @@ class ScenarioReport(object):
             self.add_step_report(report)
 
 
+def serialize_row_reports(row_reports):
+    """Serialize the reports of the example rows executed in one item.
+
+    The steps of all the rows are the steps of the item, and every row is serialized with its own steps.
+    """
+    serialized = row_reports[0].serialize()
+    serialized["examples"] = [dict(examples, row_index=None) for examples in serialized["examples"]]
+    serialized["steps"] = []
+    serialized["rows"] = []
+    for row_report in row_reports:
+        steps = [step_report.serialize() for step_report in row_report.step_reports]
+        serialized["steps"].extend(steps)
+        failed = row_report.outcome == "failed" or any(step["failed"] for step in steps)
+        serialized["rows"].append(
+            {
+                "steps": steps,
+                "row_indexes": row_report.row_indexes,
+                "example_kwargs": row_report.example_kwargs,
+                "failed": failed,
+                "outcome": "failed" if failed else row_report.outcome or "passed",
+            }
+        )
+    return serialized
+
+
+def get_scenario_examples(scenario):
+    """Get the serialized example tables of the scenario and the lookup tables of their rows.
+
+    The example tables are the same for every example row, so they are prepared once per scenario and the row
+    of the test item is found in constant time.
+
+    :return: `list` of `tuple` in form
+        ({"name": <name>, "line_number": <line number>, "rows": [<names>, <values>]}, {<row>: <index>}, <rows>).
+    """
+    cached = getattr(scenario, "__pytest_bdd_examples__", None)
+    # Converters are set by the scenario decorator, and may differ between the modules using the scenario
+    if cached is not None and cached[0] is scenario.example_converters:
+        return cached[1]
+
+    examples_collections = scenario.examples_collections + scenario.feature.examples_collections
+    scenario_examples = []
+    for examples, builtin_params, params in zip(
+        examples_collections, scenario.get_params(builtin=True), scenario.get_params()
+    ):
+        if not params:
+            continue
+        rows = params[1]
+        row_indexes = {}
+        for index, row in enumerate(rows):
+            try:
+                row_indexes.setdefault(tuple(row), index)
+            except TypeError:
+                # Unhashable converted values are looked up in the rows
+                pass
+        serialized = {"name": examples.name, "line_number": examples.line_number, "rows": builtin_params}
+        scenario_examples.append((serialized, row_indexes, rows))
+    scenario.__pytest_bdd_examples__ = (scenario.example_converters, scenario_examples)
+    return scenario_examples
+
+
 def runtest_makereport(item, call, rep):
     """Store item in the report object."""
     try:
@@ -160,13 +232,85 @@ def runtest_makereport(item, call, rep):
     except AttributeError:
         pass
     else:
-        rep.scenario = scenario_report.serialize()
+        # The scenario is executed in the call phase, so the same serialized report is used for the teardown
+        if scenario_report.serialized is None:
+            row_reports = getattr(item, "__scenario_row_reports__", None)
+            if row_reports:
+                scenario_report.serialized = serialize_row_reports(row_reports)
+            else:
+                scenario_report.serialized = scenario_report.serialize()
+        rep.scenario = scenario_report.serialized
         rep.item = {"name": item.name}
 
 
+def configure(config):
+    """Initialize the references to the scenario report data shared between the reports."""
+    # Keys of the feature and examples data already sent by the xdist worker
+    config._bdd_sent_report_refs = set()
+    # Feature and examples data received by the xdist controller in form {<key>: <data>}
+    config._bdd_report_refs = {}
+
+
+def compact_serialized_report(config, data):
+    """Replace the feature and examples data already sent by the xdist worker with references.
+
+    :param data: Report serialized for the transport to the xdist controller.
+    """
+    scenario = data.get("scenario") if data else None
+    if scenario is None or not hasattr(config, "workerinput"):
+        return
+    # Don't modify the report scenario data, it is the same object
+    scenario = data["scenario"] = dict(scenario)
+    sent_refs = config._bdd_sent_report_refs
+
+    feature_ref = scenario["feature"]["filename"]
+    scenario["feature_ref"] = feature_ref
+    if feature_ref in sent_refs:
+        del scenario["feature"]
+    else:
+        sent_refs.add(feature_ref)
+
+    examples_ref = u"{0}:{1}".format(feature_ref, scenario["line_number"])
+    scenario["examples_ref"] = examples_ref
+    if examples_ref in sent_refs:
+        scenario["examples"] = [
+            dict((key, value) for key, value in examples.items() if key != "rows") for examples in scenario["examples"]
+        ]
+    else:
+        sent_refs.add(examples_ref)
+
+
+def restore_serialized_report(config, data):
+    """Restore the feature and examples data of the report compacted by the xdist worker.
+
+    :param data: Report serialized by the xdist worker.
+    """
+    scenario = data.get("scenario")
+    if scenario is None or "feature_ref" not in scenario:
+        return
+    refs = config._bdd_report_refs
+
+    feature_ref = scenario.pop("feature_ref")
+    if "feature" in scenario:
+        refs[feature_ref] = scenario["feature"]
+    else:
+        scenario["feature"] = refs[feature_ref]
+
+    examples_ref = scenario.pop("examples_ref")
+    if all("rows" in examples for examples in scenario["examples"]):
+        refs[examples_ref] = [examples["rows"] for examples in scenario["examples"]]
+    else:
+        for examples, rows in zip(scenario["examples"], refs[examples_ref]):
+            examples["rows"] = rows
+
+
 def before_scenario(request, feature, scenario):
     """Create scenario report for the item."""
-    request.node.__scenario_report__ = ScenarioReport(scenario=scenario, node=request.node)
+    scenario_report = request.node.__scenario_report__ = ScenarioReport(scenario=scenario, node=request.node)
+    row_reports = getattr(request.node, "__scenario_row_reports__", None)
+    if row_reports is not None:
+        # The example rows are executed in one item, each of them is reported
+        row_reports.append(scenario_report)
 
 
 def step_error(request, feature, scenario, step, step_func, step_func_args, exception):
@@ -182,3 +326,31 @@ def before_step(request, feature, scenario, step, step_func):
 def after_step(request, feature, scenario, step, step_func, step_func_args):
     """Finalize the step report as successful."""
     request.node.__scenario_report__.current_step_report.finalize(failed=False)
+
+
+def add_reused_step_reports(node, steps):
+    """Report the shared background steps executed by another scenario as passed without the duration."""
+    scenario_report = node.__scenario_report__
+    for step in steps:
+        report = StepReport(step=step)
+        report.stopped = report.started
+        report.reused = True
+        scenario_report.add_step_report(report)
+
+
+def get_step_reports_count(node):
+    """Get the number of the step reports collected for the item so far."""
+    return len(node.__scenario_report__.step_reports)
+
+
+def serialize_step_reports(node, start=0):
+    """Serialize the step reports of the item collected after the given position."""
+    return [step_report.serialize() for step_report in node.__scenario_report__.step_reports[start:]]
+
+
+def add_serialized_step_reports(node, serialized_step_reports):
+    """Add the step reports serialized in another process to the item scenario report."""
+    scenario_report = node.__scenario_report__
+    steps = {step.line_number: step for step in scenario_report.scenario.steps}
+    for data in serialized_step_reports:
+        scenario_report.add_step_report(StepReport.deserialize(steps[data["line_number"]], data))
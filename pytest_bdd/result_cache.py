@@ -0,0 +1,171 @@
+"""Skipping of the unchanged passing scenarios.
+
+With ``--bdd-skip-unchanged`` every scenario item gets a fingerprint of everything its result depends on:
+the scenario, background and examples of the feature file, the source of the test function, of the step
+functions bound to the steps at collection time and of all the fixtures they use, and the pytest-bdd version.
+The fingerprints of the passed items are stored in the pytest cache, and the items with the same fingerprint
+in the next runs are deselected.
+"""
+
+import hashlib
+import inspect
+
+import pytest
+
+from . import __version__
+from .generation import StepDefinitionIndex
+from .utils import get_args
+
+CACHE_KEY = "bdd/passed_fingerprints"
+
+# Source hashes of the functions
+_source_hashes = {}
+
+
+def add_options(parser):
+    """Add pytest-bdd options."""
+    group = parser.getgroup("bdd", "Result cache")
+    group._addoption(
+        "--bdd-skip-unchanged",
+        action="store_true",
+        dest="bdd_skip_unchanged",
+        default=False,
+        help="deselect the scenarios which passed in a previous run and didn't change since.",
+    )
+
+
+def configure(config):
+    if config.option.bdd_skip_unchanged and getattr(config, "cache", None) is not None:
+        config._bddresultcache = ResultCache(config)
+        config.pluginmanager.register(config._bddresultcache)
+
+
+def unconfigure(config):
+    result_cache = getattr(config, "_bddresultcache", None)
+    if result_cache is not None:
+        del config._bddresultcache
+        config.pluginmanager.unregister(result_cache)
+
+
+def get_source_hash(func):
+    """Get the hash of the function source."""
+    try:
+        return _source_hashes[func]
+    except KeyError:
+        pass
+    try:
+        source = inspect.getsource(func)
+    except (IOError, TypeError):
+        # The source is not available, the fingerprint is not stable then and the item is never deselected
+        source = repr(func)
+    if not isinstance(source, bytes):
+        source = source.encode("utf-8")
+    source_hash = _source_hashes[func] = hashlib.sha1(source).hexdigest()
+    return source_hash
+
+
+def _serialize_examples(examples):
+    return repr((examples.example_params, examples.examples, examples.vertical_examples))
+
+
+def get_fingerprint(item, scenario, index):
+    """Get the fingerprint of the scenario item.
+
+    :param item: pytest item.
+    :param scenario: `Scenario` of the item.
+    :param index: `StepDefinitionIndex` binding the steps to the step functions.
+
+    :return: Fingerprint string.
+    """
+    feature = scenario.feature
+    parts = [__version__, feature.rel_filename, scenario.name]
+    parts.extend(sorted(scenario.tags | feature.tags))
+    parts.extend(_serialize_examples(examples) for examples in feature.examples_collections)
+    parts.extend(_serialize_examples(examples) for examples in scenario.examples_collections)
+
+    functions = [item.function.__pytest_bdd_test_function__]
+    for step in scenario.steps:
+        parts.append(u"{0} {1}".format(step.type, step.name))
+        step_func = index.get_step_function(item, step.name, step.type)
+        if step_func is not None:
+            functions.append(step_func)
+
+    # Fixtures used by the test function and by the step functions
+    argnames = list(item.fixturenames)
+    for func in functions[1:]:
+        argnames.extend(get_args(func))
+    seen = set()
+    while argnames:
+        argname = argnames.pop()
+        if argname in seen:
+            continue
+        seen.add(argname)
+        fixturedefs = item._fixtureinfo.name2fixturedefs.get(argname) or index.fixturemanager.getfixturedefs(
+            argname, item.nodeid
+        )
+        if fixturedefs:
+            functions.append(fixturedefs[-1].func)
+            argnames.extend(fixturedefs[-1].argnames)
+
+    parts.extend(get_source_hash(func) for func in functions)
+    return hashlib.sha1(u"\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class ResultCache(object):
+
+    """Plugin deselecting the unchanged scenarios which passed in a previous run."""
+
+    def __init__(self, config):
+        self.config = config
+        # Fingerprints of the passed items by the node id
+        self.passed = config.cache.get(CACHE_KEY, {})
+        # Fingerprints of the collected items by the node id
+        self.fingerprints = {}
+        # Fingerprints of the executed items by the node id, `None` if the item didn't pass
+        self.results = {}
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        index = StepDefinitionIndex(session._fixturemanager)
+        remaining = []
+        deselected = []
+        for item in items:
+            scenario = getattr(getattr(item, "function", None), "__scenario__", None)
+            if scenario is None:
+                remaining.append(item)
+                continue
+            fingerprint = self.fingerprints[item.nodeid] = get_fingerprint(item, scenario, index)
+            if self.passed.get(item.nodeid) == fingerprint:
+                deselected.append(item)
+            else:
+                remaining.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = remaining
+
+    @pytest.mark.hookwrapper
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        fingerprint = self.fingerprints.get(item.nodeid)
+        if fingerprint is not None:
+            # Sent along with the report from the xdist workers
+            outcome.get_result().bdd_fingerprint = fingerprint
+
+    def pytest_runtest_logreport(self, report):
+        fingerprint = getattr(report, "bdd_fingerprint", None)
+        if fingerprint is None:
+            return
+        if report.failed or report.skipped:
+            self.results[report.nodeid] = None
+        elif report.when == "call":
+            self.results.setdefault(report.nodeid, fingerprint)
+
+    def pytest_sessionfinish(self):
+        if hasattr(self.config, "workerinput"):
+            return
+        passed = dict(self.passed)
+        for nodeid, fingerprint in self.results.items():
+            if fingerprint is None:
+                passed.pop(nodeid, None)
+            else:
+                passed[nodeid] = fingerprint
+        self.config.cache.set(CACHE_KEY, passed)
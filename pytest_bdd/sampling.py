@@ -0,0 +1,155 @@
+"""Deterministic sampling of the example rows.
+
+For the quick runs of large scenario outlines only a subset of the rows of every example table can be executed:
+
+    py.test --bdd-sample-rows 10 --bdd-seed 42
+    py.test --bdd-sample-fraction 0.05 --bdd-sample-stratify country
+
+The rows are sampled before the parametrization, so the rows which are not sampled never become test items.
+The sample only depends on the seed, the feature file and the line of the example table, so it is the same in every
+run (and in every pytest-xdist worker) with the same seed. With the stratification column every distinct value of
+the column keeps at least one row, and the rest of the sample is spread proportionally to the number of its rows.
+The number of the rows is still the hard limit: the strata over it lose their rows, the largest strata first.
+"""
+
+import math
+import random
+
+import pytest
+
+from .utils import CONFIG_STACK
+
+
+def add_options(parser):
+    """Add pytest-bdd options."""
+    group = parser.getgroup("bdd", "Sampling")
+    group._addoption(
+        "--bdd-sample-rows",
+        action="store",
+        type=int,
+        dest="bdd_sample_rows",
+        metavar="N",
+        default=None,
+        help="only execute at most N rows of every example table.",
+    )
+    group._addoption(
+        "--bdd-sample-fraction",
+        action="store",
+        type=float,
+        dest="bdd_sample_fraction",
+        metavar="FRACTION",
+        default=None,
+        help="only execute the given fraction (e.g. 0.05) of the rows of every example table, at least one row.",
+    )
+    group._addoption(
+        "--bdd-sample-stratify",
+        action="store",
+        dest="bdd_sample_stratify",
+        metavar="COLUMN",
+        default=None,
+        help="keep at least one example row for every value of the column when sampling the rows, "
+        "as long as --bdd-sample-rows allows.",
+    )
+    group._addoption(
+        "--bdd-seed",
+        action="store",
+        dest="bdd_seed",
+        metavar="SEED",
+        default="0",
+        help="seed of the example rows sampling.",
+    )
+
+
+def configure(config):
+    option = config.option
+    if option.bdd_sample_rows is not None and option.bdd_sample_rows < 1:
+        raise pytest.UsageError("--bdd-sample-rows: the number of the rows must be positive.")
+    if option.bdd_sample_fraction is not None and not 0 < option.bdd_sample_fraction <= 1:
+        raise pytest.UsageError("--bdd-sample-fraction: the fraction must be greater than 0 and at most 1.")
+    if option.bdd_sample_rows is None and option.bdd_sample_fraction is None:
+        config._bdd_sampling = None
+    else:
+        config._bdd_sampling = Sampling(
+            rows=option.bdd_sample_rows,
+            fraction=option.bdd_sample_fraction,
+            stratify=option.bdd_sample_stratify,
+            seed=option.bdd_seed,
+        )
+
+
+def get_sampling():
+    """Get the example rows sampling of the current pytest session, `None` if the rows are not sampled."""
+    if not CONFIG_STACK:
+        return None
+    return getattr(CONFIG_STACK[-1], "_bdd_sampling", None)
+
+
+class Sampling(object):
+    """Example rows sampling."""
+
+    def __init__(self, rows=None, fraction=None, stratify=None, seed="0"):
+        """Sampling constructor.
+
+        :param int rows: Maximum number of the rows of a table.
+        :param float fraction: Fraction of the rows of a table.
+        :param str stratify: Name of the column whose every value keeps at least one row.
+        :param str seed: Seed of the sampling.
+        """
+        self.rows = rows
+        self.fraction = fraction
+        self.stratify = stratify
+        self.seed = seed
+
+    def get_size(self, count):
+        """Get the number of the rows sampled out of the given number of the rows."""
+        size = count
+        if self.fraction is not None:
+            size = max(1, int(math.ceil(self.fraction * count)))
+        if self.rows is not None:
+            size = min(size, self.rows)
+        return size
+
+    def sample(self, key, example_params, rows):
+        """Sample the example rows.
+
+        :param str key: Key of the example table (e.g. the feature file and the line of the table).
+        :param list example_params: Names of the example columns.
+        :param list rows: Example rows.
+
+        :return: `list` of the sampled rows, in their original order.
+        """
+        size = self.get_size(len(rows))
+        if size >= len(rows):
+            return rows
+        rng = random.Random(u"{0}:{1}".format(self.seed, key))
+        if self.stratify in example_params:
+            column = example_params.index(self.stratify)
+            strata = {}
+            for index, row in enumerate(rows):
+                strata.setdefault(row[column], []).append(index)
+            samples = []
+            for value in sorted(strata):
+                stratum = strata[value]
+                stratum_size = max(1, int(round(size * float(len(stratum)) / len(rows))))
+                samples.append(rng.sample(stratum, min(stratum_size, len(stratum))))
+            if self.rows is not None:
+                samples = self._limit_strata(rng, samples)
+            indexes = [index for sample in samples for index in sample]
+        else:
+            indexes = rng.sample(range(len(rows)), size)
+        return [rows[index] for index in sorted(indexes)]
+
+    def _limit_strata(self, rng, samples):
+        """Limit the stratified sample to the number of the rows.
+
+        The rounding excess is taken from the largest strata, then if there are more strata than the rows only some
+        of them keep their row.
+        """
+        excess = sum(len(sample) for sample in samples) - self.rows
+        while excess > 0:
+            largest = max(samples, key=len)
+            if len(largest) == 1:
+                return rng.sample(samples, self.rows)
+            largest.pop()
+            excess -= 1
+        return samples
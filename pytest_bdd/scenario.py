@@ -15,16 +15,30 @@ import os
 import re
 
 import pytest
+import six
 
 try:
     from _pytest import fixtures as pytest_fixtures
 except ImportError:
     from _pytest import python as pytest_fixtures
 
+from . import combinations
 from . import exceptions
+from . import forking
+from . import reporting
+from . import selection
+from . import tag_expression
+from .types import BACKGROUND_SCOPE_TAG_PREFIX, ROWS_IN_ONE_ITEM_TAG
 from .feature import force_unicode, get_feature, get_features
-from .steps import get_step_fixture_name, inject_fixture
-from .utils import CONFIG_STACK, get_args, get_caller_module_locals, get_caller_module_path, get_args_default_values, iter_modules
+from .steps import get_step_fixture_name, inject_fixture, is_step_matching
+from .utils import (
+    CONFIG_STACK,
+    get_args,
+    get_caller_module_locals,
+    get_caller_module_path,
+    get_args_default_values,
+    iter_modules,
+)
 
 PYTHON_REPLACE_REGEX = re.compile(r"\W")
 ALPHA_REGEX = re.compile(r"^\d+_*")
@@ -34,6 +48,15 @@ GENERAL_STEP_DEFS = None
 # In python 3.6+ this is no longer necessary, as the order is automatically retained.
 _py2_scenario_creation_counter = 0
 
+# Target fixture values of the shared backgrounds in form {(<feature filename>, <module path>): {<name>: <value>}}
+_shared_backgrounds = {}
+
+# Scopes of the fixtures the shared background steps can depend on, they outlive the scenarios of the feature
+SHARED_FIXTURE_SCOPES = ("module", "package", "session")
+
+# Default value of the step function arguments without the default value
+_NO_DEFAULT = object()
+
 
 def find_argumented_step_fixture_name(name, type_, fixturemanager, request=None):
     """Find argumented step fixture name."""
@@ -41,7 +64,7 @@ def find_argumented_step_fixture_name(name, type_, fixturemanager, request=None)
     for fixturename, fixturedefs in list(fixturemanager._arg2fixturedefs.items()):
         for fixturedef in fixturedefs:
             parser = getattr(fixturedef.func, "parser", None)
-            match = parser.is_matching(name) if parser else None
+            match = is_step_matching(fixturedef.func, name) if parser else None
             if match:
                 converters = getattr(fixturedef.func, "converters", {})
                 for arg, value in parser.parse_arguments(name).items():
@@ -85,8 +108,7 @@ def _find_general_step_function(request, step, scenario, encoding):
     lazy_step_func = general_step_defs.get(step_name)
     if lazy_step_func is None:
         raise pytest_fixtures.FixtureLookupError(step.name, request)
-    inject_fixture(
-        request, step_name, lazy_step_func.__pytest_wrapped__.obj, inject_func=True)
+    inject_fixture(request, step_name, lazy_step_func.__pytest_wrapped__.obj, inject_func=True)
     return request.getfixturevalue(get_step_fixture_name(step.name, step.type, encoding))
 
 
@@ -120,60 +142,172 @@ def _find_step_function(request, step, scenario, encoding):
             )
 
 
-def _execute_step_function(request, scenario, step, step_func):
-    """Execute step function.
+class StepPlan(object):
+    """Execution plan of a step: the bound step function and the sources of its arguments.
 
-    :param request: PyTest request.
-    :param scenario: Scenario.
-    :param Step step: Step.
-    :param function step_func: Step function.
-    :param example: Example table.
+    The plan is the same for all the items of the scenario in the same module (or class), so the step function is
+    looked up and its arguments are inspected once, not for every example row.
     """
-    kw = dict(request=request, feature=scenario.feature, scenario=scenario, step=step, step_func=step_func)
-
-    request.config.hook.pytest_bdd_before_step(**kw)
 
-    kw["step_func_args"] = {}
-    try:
-        # Get the step argument values.
-        args = get_args(step_func)
-        default_values = get_args_default_values(step_func)
-        kwargs = {}
+    def __init__(self, step, step_func, parsed_args=None, converters=None):
+        """Step plan constructor.
+
+        :param Step step: Step.
+        :param function step_func: Step function.
+        :param dict parsed_args: Arguments parsed from the step name, not converted yet.
+        :param dict converters: Converters of the parsed arguments, the ones of the step function by default.
+        """
+        self.step = step
+        self.step_func = step_func
+        self.parsed_args = parsed_args or {}
+        self.converters = converters if converters is not None else getattr(step_func, "converters", {})
+        self.target_fixture = getattr(step_func, "target_fixture", None)
+        self.step_cache = getattr(step_func, "step_cache", None)
 
         extra_args_map = getattr(step_func, "extra_args_map", {})
         if extra_args_map:
             extra_args = extra_args_map.get(get_step_fixture_name(step.name, step.type), {})
         else:
             extra_args = {}
+        default_values = get_args_default_values(step_func)
 
-        for arg in args:
+        # Argument sources in form (<name>, <value>, <alias convert>, <is fixture>)
+        self.arguments = []
+        for arg in get_args(step_func):
             if arg in step.constant_params:
                 # constant step params
-                v = step.constant_params[arg]
-                if v == step.SKIP_MARK:
+                value = step.constant_params[arg]
+                if value == step.SKIP_MARK:
                     continue
-                kwargs[arg] = v
+                self.arguments.append((arg, value, None, False))
             elif arg in step.alias_params:
                 # step params alias
-                kwargs[arg] = step.alias_convert[arg](request)
+                self.arguments.append((arg, None, step.alias_convert[arg], False))
+            elif arg == "datatable" and step.datatable is not None:
+                # the same table for all the items, its columns are converted once
+                datatable = step.datatable.with_converters(getattr(step_func, "datatable_converters", None))
+                self.arguments.append((arg, datatable, None, False))
             elif arg in extra_args:
-                kwargs[arg] = extra_args[arg]
+                self.arguments.append((arg, extra_args[arg], None, False))
             else:
+                self.arguments.append((arg, default_values.get(arg, _NO_DEFAULT), None, True))
+
+    def inject_parsed_args(self, request):
+        """Inject the converted arguments parsed from the step name as fixtures."""
+        for arg, value in self.parsed_args.items():
+            if arg in self.converters:
+                value = self.converters[arg](value)
+            inject_fixture(request, arg, value)
+
+    def get_kwargs(self, request):
+        """Get the step function argument values.
+
+        :return: `dict` in form {<argument>: <value>}.
+        """
+        kwargs = {}
+        for arg, value, alias_convert, is_fixture in self.arguments:
+            if alias_convert is not None:
+                kwargs[arg] = alias_convert(request)
+            elif is_fixture:
                 try:
                     kwargs[arg] = request.getfixturevalue(arg)
-                except pytest_fixtures.FixtureLookupError as e:
-                    if arg in default_values:
-                        kwargs[arg] = default_values[arg]
-                    else:
+                except pytest_fixtures.FixtureLookupError:
+                    if value is _NO_DEFAULT:
                         raise
-        kw["step_func_args"] = kwargs
+                    kwargs[arg] = value
+            else:
+                kwargs[arg] = value
+        return kwargs
+
+
+def _plan_step(step, request, encoding):
+    """Plan the step by the step definitions visible to the test node.
+
+    :return: `StepPlan` or `None` if the step function can only be found by the request fixtures.
+    """
+    fixturemanager = request._fixturemanager
+    nodeid = request.node.nodeid
+
+    def get_step_func(fixture_name):
+        fixturedefs = fixturemanager.getfixturedefs(fixture_name, nodeid)
+        # Step fixtures return the step function, other fixtures of the same name need the request
+        if fixturedefs and getattr(fixturedefs[-1].func, "parser", None) is not None:
+            return fixturedefs[-1].func()
+
+    step_func = get_step_func(get_step_fixture_name(step.name, step.type, encoding))
+    if step_func is not None:
+        return StepPlan(step, step_func)
+
+    # happens to be that _arg2fixturedefs is changed during the iteration so we use a copy
+    for fixturedefs in list(fixturemanager._arg2fixturedefs.values()):
+        for fixturedef in fixturedefs:
+            parser = getattr(fixturedef.func, "parser", None)
+            if parser is None or not is_step_matching(fixturedef.func, step.name):
+                continue
+            step_func = get_step_func(get_step_fixture_name(parser.name, step.type))
+            if step_func is not None:
+                # The step function can have several step decorators, the matching one parses the arguments
+                return StepPlan(
+                    step,
+                    step_func,
+                    parser.parse_arguments(step.name),
+                    converters=getattr(fixturedef.func, "converters", {}),
+                )
+
+    lazy_step_func = get_general_step_defs().get(get_step_fixture_name(step.name, step.type, encoding))
+    if lazy_step_func is not None:
+        return StepPlan(step, lazy_step_func.__pytest_wrapped__.obj())
+    return None
+
+
+def _get_step_plan(scenario, step, request, encoding):
+    """Get the execution plan of the step, cached for the items of the same module (or class).
+
+    :raises StepDefinitionNotFoundError: when the step is not defined.
+    """
+    # Fixtures visible to the items of the same parent node are the same
+    node = request.node.parent
+    try:
+        plans = node.__pytest_bdd_step_plans__
+    except AttributeError:
+        plans = node.__pytest_bdd_step_plans__ = {}
+    key = (step, encoding)
+    plan = plans.get(key)
+    if plan is None:
+        plan = _plan_step(step, request, encoding)
+        if plan is None:
+            # Not cached, the request fixtures can differ for every item
+            return StepPlan(step, _find_step_function(request, step, scenario, encoding=encoding))
+        plans[key] = plan
+    return plan
+
+
+def _execute_step_function(request, scenario, step, plan):
+    """Execute step function.
+
+    :param request: PyTest request.
+    :param scenario: Scenario.
+    :param Step step: Step.
+    :param StepPlan plan: Step execution plan.
+    """
+    step_func = plan.step_func
+    kw = dict(request=request, feature=scenario.feature, scenario=scenario, step=step, step_func=step_func)
+
+    request.config.hook.pytest_bdd_before_step(**kw)
+
+    kw["step_func_args"] = {}
+    try:
+        # Get the step argument values.
+        kwargs = kw["step_func_args"] = plan.get_kwargs(request)
 
         request.config.hook.pytest_bdd_before_step_call(**kw)
-        target_fixture = getattr(step_func, "target_fixture", None)
         # Execute the step.
-        return_value = step_func(**kwargs)
-        if target_fixture:
-            inject_fixture(request, target_fixture, return_value)
+        if plan.step_cache is not None:
+            return_value = plan.step_cache.call(step_func, kwargs)
+        else:
+            return_value = step_func(**kwargs)
+        if plan.target_fixture:
+            inject_fixture(request, plan.target_fixture, return_value)
 
         request.config.hook.pytest_bdd_after_step(**kw)
     except Exception as exception:
@@ -181,29 +315,245 @@ def _execute_step_function(request, scenario, step, step_func):
         raise
 
 
-def _execute_scenario(feature, scenario, request, encoding):
+def _execute_step(feature, scenario, step, request, encoding):
+    """Find the step function and execute it.
+
+    :return: Function of the step.
+    """
+    try:
+        plan = _get_step_plan(scenario, step, request, encoding)
+    except exceptions.StepDefinitionNotFoundError as exception:
+        request.config.hook.pytest_bdd_step_func_lookup_error(
+            request=request, feature=feature, scenario=scenario, step=step, exception=exception
+        )
+        raise
+    plan.inject_parsed_args(request)
+    _execute_step_function(request, scenario, step, plan)
+    return plan.step_func
+
+
+def get_background_scope(feature, config):
+    """Get the background execution scope of the feature.
+
+    The ``@background-scope:<scope>`` feature tag takes precedence over the ``bdd_background_scope`` ini option.
+
+    :return: "function", "feature" or "fork".
+    """
+    for tag in feature.tags:
+        if tag.startswith(BACKGROUND_SCOPE_TAG_PREFIX):
+            return tag[len(BACKGROUND_SCOPE_TAG_PREFIX) :]
+    return config.getini("bdd_background_scope") or "function"
+
+
+def _get_shared_background_key(feature, node):
+    """Get the shared background cache key for the test node.
+
+    :return: Cache key or `None` if the background of the feature is executed for every scenario.
+    """
+    background = feature.background
+    scope = get_background_scope(feature, node.config)
+    if background is None or scope not in ("feature", "fork"):
+        return None
+    if scope == "fork" and not forking.is_supported():
+        # The scenarios can't be isolated from the shared background state, it is executed for every scenario
+        return None
+    if any(step.params for step in background.steps):
+        # Background steps depending on the examples can't be shared between the example rows
+        return None
+    # Step definitions are looked up from the test module, so it is part of the key
+    return feature.filename, str(node.fspath)
+
+
+def _is_background_shareable(feature, scenario, request, encoding):
+    """Check if the background steps only depend on the fixtures outliving the scenarios of the feature.
+
+    The values of the function-scoped fixtures are finalized after the first scenario, so a background using them
+    is executed for every scenario.
+    """
+    fixturemanager = request._fixturemanager
+    nodeid = request.node.nodeid
+    names = []
+    injected = set()
+    for step in feature.background.steps:
+        try:
+            plan = _get_step_plan(scenario, step, request, encoding)
+        except exceptions.StepDefinitionNotFoundError:
+            # Reported when the background is executed as a part of the scenario
+            return False
+        names.extend(arg for arg, _, _, is_fixture in plan.arguments if is_fixture and arg not in injected)
+        # Fixtures injected by the background steps are cached with the background
+        injected.update(plan.parsed_args)
+        if plan.target_fixture:
+            injected.add(plan.target_fixture)
+
+    seen = set()
+    while names:
+        name = names.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        if name == "request":
+            return False
+        fixturedefs = fixturemanager.getfixturedefs(name, nodeid)
+        if not fixturedefs:
+            continue
+        if fixturedefs[-1].scope not in SHARED_FIXTURE_SCOPES:
+            return False
+        names.extend(fixturedefs[-1].argnames)
+    return True
+
+
+def _execute_background(feature, scenario, request, encoding):
+    """Execute the feature-scoped background or re-inject its cached target fixtures.
+
+    :return: `True` if the background is shared, `False` if it has to be executed as a part of the scenario.
+    """
+    key = _get_shared_background_key(feature, request.node)
+    if key is None:
+        return False
+
+    target_fixtures = _shared_backgrounds.get(key)
+    if target_fixtures is None:
+        if not _is_background_shareable(feature, scenario, request, encoding):
+            return False
+        target_fixtures = collections.OrderedDict()
+        for step in feature.background.steps:
+            step_func = _execute_step(feature, scenario, step, request, encoding)
+            target_fixture = getattr(step_func, "target_fixture", None)
+            if target_fixture:
+                target_fixtures[target_fixture] = request.getfixturevalue(target_fixture)
+        _shared_backgrounds[key] = target_fixtures
+    else:
+        for name, value in target_fixtures.items():
+            inject_fixture(request, name, value)
+        reporting.add_reused_step_reports(request.node, feature.background.steps)
+    return True
+
+
+def teardown_shared_background(item, nextitem):
+    """Drop the cached background of the feature once its last scenario in a row is finished."""
+    key = _get_item_background_key(item)
+    if key is not None and key != _get_item_background_key(nextitem):
+        _shared_backgrounds.pop(key, None)
+
+
+def _get_item_background_key(item):
+    scenario = getattr(getattr(item, "function", None), "__scenario__", None)
+    if scenario is None:
+        return None
+    return _get_shared_background_key(scenario.feature, item)
+
+
+def _execute_steps(feature, scenario, steps, request, encoding):
+    for step in steps:
+        _execute_step(feature, scenario, step, request, encoding)
+
+
+def _is_scenario_forked(feature, config):
+    """Check if the scenario steps should be executed in a forked process."""
+    return get_background_scope(feature, config) == "fork" and forking.is_supported()
+
+
+def _execute_scenario(feature, scenario, request, encoding, test_func):
     """Execute the scenario.
 
     :param feature: Feature.
     :param scenario: Scenario.
     :param request: request.
     :param encoding: Encoding.
+    :param test_func: Function calling the decorated test function, executed after the steps.
+
+    :return: The decorated test function result.
     """
     request.config.hook.pytest_bdd_before_scenario(request=request, feature=feature, scenario=scenario)
 
     try:
         # Execute scenario steps
-        for step in scenario.steps:
-            try:
-                step_func = _find_step_function(request, step, scenario, encoding=encoding)
-            except exceptions.StepDefinitionNotFoundError as exception:
-                request.config.hook.pytest_bdd_step_func_lookup_error(
-                    request=request, feature=feature, scenario=scenario, step=step, exception=exception
-                )
-                raise
-            _execute_step_function(request, scenario, step, step_func)
+        if _execute_background(feature, scenario, request, encoding):
+            steps = scenario._steps
+        else:
+            steps = scenario.steps
+        if _is_scenario_forked(feature, request.config):
+            # Scenario steps and the test function are executed in the child process
+            def forked_func():
+                _execute_steps(feature, scenario, steps, request, encoding)
+                test_func()
+
+            return forking.execute_forked(request, forked_func)
+        _execute_steps(feature, scenario, steps, request, encoding)
     finally:
         request.config.hook.pytest_bdd_after_scenario(request=request, feature=feature, scenario=scenario)
+    return test_func()
+
+
+def is_rows_in_one_item(feature, scenario, config):
+    """Check if all the example rows of the scenario are executed in one test item.
+
+    The ``@rows-in-one-item`` scenario or feature tag takes precedence over the ``bdd_rows_in_one_item`` ini option.
+    """
+    return (
+        ROWS_IN_ONE_ITEM_TAG in scenario.tags
+        or ROWS_IN_ONE_ITEM_TAG in feature.tags
+        or config.getini("bdd_rows_in_one_item")
+    )
+
+
+def get_example_rows(feature, scenario):
+    """Get the example rows of the scenario, combined like the stacked parametrization of the example tables.
+
+    :return: `list` of `dict` in form {<param>: <value>}.
+    """
+    example_rows = [{}]
+    for names, rows in combinations.get_params(feature, scenario):
+        example_rows = [dict(example_row, **dict(zip(names, row))) for example_row in example_rows for row in rows]
+    return example_rows
+
+
+def _execute_scenario_rows(feature, scenario, request, encoding, test_func, example_rows):
+    """Execute the scenario for every example row in the same test item.
+
+    The fixtures are set up once for the item, the example values are injected before every row. All the rows are
+    executed even if some of them fail or are skipped, and each row has its own scenario report with its outcome.
+
+    :raises ExampleRowsFailedError: when any of the rows failed, caused by the first failure.
+    """
+    request.node.__scenario_row_reports__ = []
+    failures = []
+    not_passed = []
+    for row_index, example_row in enumerate(example_rows):
+        request.node.funcargs.update(example_row)
+        for name, value in example_row.items():
+            inject_fixture(request, name, value)
+        try:
+            _execute_scenario(feature, scenario, request, encoding, test_func)
+        except pytest.xfail.Exception as exception:
+            outcome = "xfailed"
+            not_passed.append(exception)
+        except pytest.skip.Exception as exception:
+            outcome = "skipped"
+            not_passed.append(exception)
+        except (Exception, pytest.fail.Exception) as exception:
+            outcome = "failed"
+            not_passed.append(exception)
+            failures.append((row_index, example_row, exception))
+        else:
+            outcome = "passed"
+        request.node.__scenario_report__.outcome = outcome
+    if failures:
+        error = exceptions.ExampleRowsFailedError(
+            u"{0} of {1} example rows failed:\n{2}".format(
+                len(failures),
+                len(example_rows),
+                u"\n".join(
+                    u"    [{0}] {1}: {2!r}".format(row_index, example_row, exception)
+                    for row_index, example_row, exception in failures
+                ),
+            )
+        )
+        six.raise_from(error, failures[0][2])
+    if not_passed and len(not_passed) == len(example_rows):
+        # None of the rows passed, the item is skipped (or xfailed) as its first row
+        raise not_passed[0]
 
 
 FakeRequest = collections.namedtuple("FakeRequest", ["module"])
@@ -228,18 +578,29 @@ def _get_scenario_decorator(feature, feature_name, scenario, scenario_name, enco
             )
         [fn] = args
         args = get_args(fn)
-        function_args = list(args)
-        for arg in scenario.get_example_params():
-            if arg not in function_args:
-                function_args.append(arg)
+        example_params = scenario.get_example_params()
+        if example_params and is_rows_in_one_item(feature, scenario, CONFIG_STACK[-1]):
+            # The example values are injected by the scenario for every row, they are not parametrized
+            example_rows = get_example_rows(feature, scenario)
+            function_args = [arg for arg in args if arg not in example_params]
+        else:
+            example_rows = None
+            function_args = list(args)
+            for arg in example_params:
+                if arg not in function_args:
+                    function_args.append(arg)
 
         @pytest.mark.usefixtures(*function_args)
         def scenario_wrapper(request):
-            _execute_scenario(feature, scenario, request, encoding)
-            return fn(*[request.getfixturevalue(arg) for arg in args])
+            def test_func():
+                return fn(*[request.getfixturevalue(arg) for arg in args])
+
+            if example_rows is not None:
+                return _execute_scenario_rows(feature, scenario, request, encoding, test_func, example_rows)
+            return _execute_scenario(feature, scenario, request, encoding, test_func)
 
-        for param_set in scenario.get_params():
-            if param_set:
+        if example_rows is None:
+            for param_set in combinations.get_params(feature, scenario):
                 scenario_wrapper = pytest.mark.parametrize(*param_set)(scenario_wrapper)
         for tag in scenario.tags.union(feature.tags):
             config = CONFIG_STACK[-1]
@@ -249,6 +610,7 @@ def _get_scenario_decorator(feature, feature_name, scenario, scenario_name, enco
             feature_name=feature_name, scenario_name=scenario_name
         )
         scenario_wrapper.__scenario__ = scenario
+        scenario_wrapper.__pytest_bdd_test_function__ = fn
         scenario_wrapper.__pytest_bdd_counter__ = counter
         scenario.test_function = scenario_wrapper
         return scenario_wrapper
@@ -272,6 +634,8 @@ def scenario(feature_name, scenario_name, encoding="utf-8", example_converters=N
     # Get the feature
     if features_base_dir is None:
         features_base_dir = get_features_base_dir(caller_module_path)
+    if not selection.is_feature_selected(CONFIG_STACK[-1], os.path.join(features_base_dir, feature_name)):
+        return _skip_scenario_decorator
     feature = get_feature(features_base_dir, feature_name, encoding=encoding)
 
     # Get the scenario
@@ -284,6 +648,12 @@ def scenario(feature_name, scenario_name, encoding="utf-8", example_converters=N
             )
         )
 
+    config = CONFIG_STACK[-1]
+    if not tag_expression.is_selected(config, scenario.tags | feature.tags) or not selection.is_selected(
+        config, scenario
+    ):
+        return _skip_scenario_decorator
+
     scenario.example_converters = example_converters
 
     # Validate the scenario
@@ -294,6 +664,12 @@ def scenario(feature_name, scenario_name, encoding="utf-8", example_converters=N
     )
 
 
+def _skip_scenario_decorator(fn):
+    """Decorator of the scenario not selected by the tag expression or the line, the test function is not collected."""
+    fn.__test__ = False
+    return fn
+
+
 def get_features_base_dir(caller_module_path):
     default_base_dir = os.path.dirname(caller_module_path)
     return get_from_ini("bdd_features_base_dir", default_base_dir)
@@ -366,6 +742,10 @@ def scenarios(*feature_paths, **kwargs):
         if not os.path.isabs(path):
             path = os.path.abspath(os.path.join(features_base_dir, path))
         abs_feature_paths.append(path)
+    abs_feature_paths = selection.filter_feature_paths(CONFIG_STACK[-1], abs_feature_paths)
+    if not abs_feature_paths:
+        # None of the feature files is selected by the line
+        return
     found = False
 
     module_scenarios = frozenset(
@@ -376,8 +756,14 @@ def scenarios(*feature_paths, **kwargs):
 
     for feature in get_features(abs_feature_paths):
         for scenario_name, scenario_object in feature.scenarios.items():
-            # skip already bound scenarios
-            if (scenario_object.feature.filename, scenario_name) not in module_scenarios:
+            # skip already bound scenarios and the scenarios not selected by the tag expression
+            is_bound = (scenario_object.feature.filename, scenario_name) in module_scenarios
+            tags = scenario_object.tags | feature.tags
+            if (
+                not is_bound
+                and tag_expression.is_selected(CONFIG_STACK[-1], tags)
+                and selection.is_selected(CONFIG_STACK[-1], scenario_object)
+            ):
 
                 @scenario(feature.filename, scenario_name, **kwargs)
                 def _scenario():
@@ -0,0 +1,105 @@
+"""pytest-xdist scheduling of the scenarios grouped by feature.
+
+With ``--bdd-dist=loadfeature`` the workers tag the node ids of the scenario items sent to the controller with
+the feature file they belong to, and the controller sends every feature as a single work unit to one worker, the
+same way ``--dist=loadscope`` does for modules. Features with more items than an even share of the collection per
+worker are split into balanced chunks of consecutive items (e.g. rows of the same outline).
+"""
+
+from __future__ import absolute_import
+
+import contextlib
+import math
+import os.path
+from collections import OrderedDict
+
+try:
+    from xdist.scheduler import LoadScopeScheduling
+except ImportError:  # pragma: no cover
+    LoadScopeScheduling = None
+
+# Separator of the node id and the feature group suffix
+FEATURE_GROUP_SEPARATOR = "@bdd-feature:"
+
+
+def add_options(parser):
+    """Add pytest-bdd options."""
+    group = parser.getgroup("bdd", "Distribution")
+    group._addoption(
+        "--bdd-dist",
+        action="store",
+        dest="bdd_dist",
+        choices=["no", "loadfeature"],
+        default="no",
+        help="loadfeature: with pytest-xdist, send the scenarios of the same feature to the same worker.",
+    )
+
+
+def make_scheduler(config, log):
+    """Create the feature scheduler on the xdist controller.
+
+    :return: `LoadFeatureScheduling` or `None` if the feature scheduling is disabled.
+    """
+    if config.getoption("bdd_dist") != "loadfeature":
+        return None
+    return LoadFeatureScheduling(config, log)
+
+
+def get_feature_groups(config, items):
+    """Get the feature groups of the scenario items on the xdist workers.
+
+    :return: `dict` in form {<item>: <feature group>}.
+    """
+    groups = {}
+    if config.getoption("bdd_dist") != "loadfeature" or not hasattr(config, "workerinput"):
+        return groups
+
+    features = OrderedDict()
+    for item in items:
+        scenario = getattr(getattr(item, "function", None), "__scenario__", None)
+        if scenario is not None:
+            features.setdefault(scenario.feature.filename, []).append(item)
+    if not features:
+        return groups
+
+    chunk_size = int(math.ceil(float(len(items)) / config.workerinput["workercount"]))
+    for filename, feature_items in features.items():
+        name = os.path.relpath(filename, str(config.rootdir))
+        chunks = int(math.ceil(float(len(feature_items)) / chunk_size))
+        for index, item in enumerate(feature_items):
+            groups[item] = "{name}:{chunk}".format(name=name, chunk=index * chunks // len(feature_items))
+    return groups
+
+
+@contextlib.contextmanager
+def feature_group_node_ids(config, items):
+    """Add the feature group suffix to the node ids of the scenario items sent to the xdist controller.
+
+    The suffix is only visible to the controller scheduling, the node ids of the items are restored once the
+    collection is sent, so the reports, ``--lf`` and the junit xml use the original node ids.
+    """
+    groups = get_feature_groups(config, items)
+    for item, group in groups.items():
+        item._nodeid = "{nodeid}{separator}{group}".format(
+            nodeid=item.nodeid, separator=FEATURE_GROUP_SEPARATOR, group=group
+        )
+    try:
+        yield
+    finally:
+        for item in groups:
+            item._nodeid = item._nodeid.rsplit(FEATURE_GROUP_SEPARATOR, 1)[0]
+
+
+if LoadScopeScheduling is not None:
+
+    class LoadFeatureScheduling(LoadScopeScheduling):
+        """Load scheduling grouping the scenarios by feature.
+
+        Items without the feature group suffix are grouped by module or class, like in ``loadscope``.
+        """
+
+        def _split_scope(self, nodeid):
+            """Determine the scope (grouping) of a nodeid."""
+            if FEATURE_GROUP_SEPARATOR in nodeid:
+                return nodeid.rsplit(FEATURE_GROUP_SEPARATOR, 1)[1]
+            return LoadScopeScheduling._split_scope(self, nodeid)
@@ -7,6 +7,8 @@ import re
 import glob2
 import six
 
+from . import check
+from . import cucumber_json
 from .generation import generate_code, parse_feature_files
 
 MIGRATE_REGEX = re.compile(r"\s?(\w+)\s\=\sscenario\((.+)\)", flags=re.MULTILINE)
@@ -55,6 +57,22 @@ def print_generated_code(args):
         print(code)
 
 
+def merge_cucumber_json(args):
+    """Merge the cucumber json reports of the test suite shards."""
+    cucumber_json.merge(args.files, args.output)
+
+
+def check_step_definitions(args):
+    """Check the step definitions of the feature files without importing the test code."""
+    errors = check.check(args.paths, cache_path=args.cache)
+    for error in errors:
+        print(error)
+    if errors:
+        print("{0} step definition error(s) found.".format(len(errors)))
+        return 1
+    return 0
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(prog="pytest-bdd")
@@ -74,6 +92,32 @@ def main():
     parser_migrate.add_argument("path", metavar="PATH", help="Migrate outdated tests to the most recent form")
     parser_migrate.set_defaults(func=migrate_tests)
 
+    parser_merge = subparsers.add_parser("merge-cucumber", help="merge cucumber json reports help")
+    parser_merge.add_argument(
+        "files",
+        metavar="JSON_FILE",
+        type=check_existense,
+        nargs="+",
+        help="Cucumber json reports (e.g. of the test suite shards) to merge",
+    )
+    parser_merge.add_argument(
+        "-o", "--output", metavar="PATH", required=True, help="Path to the merged cucumber json report"
+    )
+    parser_merge.set_defaults(func=merge_cucumber_json)
+
+    parser_check = subparsers.add_parser("check", help="check step definitions help")
+    parser_check.add_argument(
+        "paths",
+        metavar="PATH",
+        type=check_existense,
+        nargs="+",
+        help="Feature files, python files and directories to check the step definitions of",
+    )
+    parser_check.add_argument(
+        "--cache", metavar="PATH", default=check.CACHE_PATH, help="Path to the step definitions cache"
+    )
+    parser_check.set_defaults(func=check_step_definitions)
+
     args = parser.parse_args()
     if hasattr(args, "func"):
-        args.func(args)
+        return args.func(args)
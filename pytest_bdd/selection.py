@@ -0,0 +1,186 @@
+"""Selection of the scenarios by the feature file line number.
+
+A single scenario, or a single example row of a scenario outline, can be selected by the line it is declared at:
+
+    py.test features/checkout.feature:42
+    py.test --bdd-select checkout.feature:42
+
+The feature files which are not selected are not parsed, and the scenarios which are not selected are not
+collected. The line of the feature header, background or feature examples selects all the scenarios of the feature,
+the line of an example row only selects the items of that row.
+"""
+
+import bisect
+import os.path
+import re
+
+import glob2
+import pytest
+
+SELECTION_RE = re.compile(r"^(?P<path>.+\.feature):(?P<line_number>\d+)$")
+
+
+def add_options(parser):
+    """Add pytest-bdd options."""
+    group = parser.getgroup("bdd", "Selection")
+    group._addoption(
+        "--bdd-select",
+        action="append",
+        dest="bdd_select",
+        metavar="FEATURE:LINE",
+        default=[],
+        help="only collect the scenario or the example row declared at the line of the feature file, "
+        "e.g. checkout.feature:42.",
+    )
+
+
+def load_initial_conftests(early_config, args):
+    """Turn the ``<feature file>:<line>`` command line arguments into the ``--bdd-select`` options.
+
+    The feature file stays in the arguments if the feature files are collected directly.
+    """
+    file_or_dir = set(early_config.known_args_namespace.file_or_dir)
+    for index, arg in reversed(list(enumerate(args))):
+        match = SELECTION_RE.match(arg)
+        if arg not in file_or_dir or not match or not os.path.isfile(match.group("path")):
+            continue
+        args[index : index + 1] = ["--bdd-select={0}".format(arg)]
+        if early_config.getini("bdd_collect_feature_files"):
+            args.insert(index + 1, match.group("path"))
+
+
+def configure(config):
+    selections = []
+    for value in config.option.bdd_select:
+        match = SELECTION_RE.match(value)
+        if not match:
+            raise pytest.UsageError(u'--bdd-select: "{0}" is not in form FEATURE:LINE'.format(value))
+        selections.append(Selection(match.group("path"), int(match.group("line_number")), str(config.invocation_dir)))
+    config._bdd_selections = selections
+
+
+def get_selections(config):
+    return getattr(config, "_bdd_selections", None) or []
+
+
+def get_line_numbers(config, filename):
+    """Get the selected line numbers of the feature file."""
+    return [selection.line_number for selection in get_selections(config) if selection.matches(filename)]
+
+
+def is_feature_selected(config, filename):
+    """Check if the feature file is selected, without parsing it."""
+    selections = get_selections(config)
+    return not selections or any(selection.matches(filename) for selection in selections)
+
+
+def filter_feature_paths(config, paths):
+    """Get the selected feature files of the feature files and directories."""
+    selections = get_selections(config)
+    if not selections:
+        return paths
+    selected_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            # Only the file names are matched, the feature files are not parsed
+            selected_paths.extend(
+                filename
+                for filename in sorted(glob2.iglob(os.path.join(path, "**", "*.feature")))
+                if is_feature_selected(config, filename)
+            )
+        elif is_feature_selected(config, path):
+            selected_paths.append(path)
+    return selected_paths
+
+
+def is_selected(config, scenario):
+    """Check if the scenario is declared at one of the selected lines of its feature file."""
+    if not get_selections(config):
+        return True
+    return any(
+        _get_scenario_at_line(scenario.feature, line_number) in (None, scenario)
+        for line_number in get_line_numbers(config, scenario.feature.filename)
+    )
+
+
+def _get_scenario_at_line(feature, line_number):
+    """Get the scenario declared at the line, `None` for the lines before the first scenario."""
+    index = getattr(feature, "__pytest_bdd_line_index__", None)
+    if index is None:
+        scenarios = sorted(feature.scenarios.values(), key=lambda scenario: scenario.line_number)
+        # The scenario starts at its tags line
+        starts = [scenario.line_number - (1 if scenario.tags else 0) for scenario in scenarios]
+        index = feature.__pytest_bdd_line_index__ = (starts, scenarios)
+    starts, scenarios = index
+    position = bisect.bisect_right(starts, line_number)
+    return scenarios[position - 1] if position else None
+
+
+def _get_row(scenario, line_number):
+    """Get the example row declared at the line.
+
+    :return: `dict` of the example row values by the parameter name or `None` if the line is not an example row of
+        the scenario.
+    """
+    examples_collections = scenario.examples_collections + scenario.feature.examples_collections
+    # The line numbers are the ones of all the rows, not only of the sampled ones
+    for examples, params in zip(examples_collections, scenario.get_params(sample=False)):
+        if params and line_number in examples.example_line_numbers:
+            names, rows = params
+            return dict(zip(names, rows[examples.example_line_numbers.index(line_number)]))
+    return None
+
+
+def _is_item_selected(item, scenario, line_numbers):
+    for line_number in line_numbers:
+        if _get_scenario_at_line(scenario.feature, line_number) not in (None, scenario):
+            continue
+        row = _get_row(scenario, line_number)
+        if row is None:
+            return True
+        # The items executing all the example rows have no parametrization
+        callspec = getattr(item, "callspec", None)
+        if callspec is None or all(callspec.params.get(name) == value for name, value in row.items()):
+            return True
+    return False
+
+
+def deselect_items(config, items):
+    """Deselect the items which are not the selected scenarios or example rows."""
+    if not get_selections(config):
+        return
+    remaining = []
+    deselected = []
+    for item in items:
+        scenario = getattr(getattr(item, "function", None), "__scenario__", None)
+        if scenario is not None and _is_item_selected(
+            item, scenario, get_line_numbers(config, scenario.feature.filename)
+        ):
+            remaining.append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = remaining
+
+
+class Selection(object):
+    """Line of a feature file selected on the command line."""
+
+    def __init__(self, path, line_number, invocation_dir):
+        """Selection constructor.
+
+        :param str path: Feature file path, absolute or relative to the invocation directory or to any base
+            directory of the features.
+        :param int line_number: Line number.
+        :param str invocation_dir: Invocation directory.
+        """
+        self.path = os.path.normpath(path)
+        self.line_number = line_number
+        self.abs_path = os.path.normcase(os.path.abspath(os.path.join(invocation_dir, path)))
+        self.suffix = os.path.normcase(os.sep + self.path)
+
+    def matches(self, filename):
+        """Check if the feature file is the selected one."""
+        filename = os.path.normcase(os.path.abspath(filename))
+        return filename == self.abs_path or (not os.path.isabs(self.path) and filename.endswith(self.suffix))
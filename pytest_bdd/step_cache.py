@@ -0,0 +1,181 @@
+"""Step result memoization.
+
+Deterministic and expensive steps can be declared as cacheable, so that their return value is computed once
+per step definition and resolved step arguments and reused for the rest of the test session:
+
+@given(parsers.parse("there is a dataset of {size:d} rows"), target_fixture="dataset", cache="session")
+def dataset(size):
+    return build_dataset(size)
+
+The hits and misses are counted in the process executing the step, the ones of the forked scenario processes and of
+the xdist workers are added up in the process reporting the terminal summary.
+"""
+
+import weakref
+from collections import OrderedDict
+
+import six
+
+CACHE_SCOPES = ("session",)
+
+# Default maximum number of the cached values per step definition
+DEFAULT_MAXSIZE = 128
+
+# Argument value types the default cache key is made of, other values (e.g. fixtures) are not part of the key
+VALUE_TYPES = (type(None), bool, float, complex, six.binary_type, six.text_type) + six.integer_types
+
+# Created step caches, so that they can be reported and cleared at the end of the session. The caches are owned by
+# the step functions, they are not kept alive once their step definitions are gone.
+caches = weakref.WeakSet()
+
+
+def is_value(value):
+    """Check if the value is of a value type, or a tuple or frozenset of them."""
+    if isinstance(value, VALUE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_value(item) for item in value)
+    return False
+
+
+class StepCache(object):
+    """Least recently used cache of the step function return values."""
+
+    def __init__(self, scope, key=None, maxsize=DEFAULT_MAXSIZE):
+        """Step cache constructor.
+
+        :param str scope: Cache scope, only "session" is supported.
+        :param key: Optional function computing the cache key from the step function arguments.
+        :param int maxsize: Maximum number of the cached values, `None` for unbounded.
+        """
+        if scope not in CACHE_SCOPES:
+            raise ValueError("Unsupported step cache scope: {0!r} (valid: {1}).".format(scope, ", ".join(CACHE_SCOPES)))
+        self.scope = scope
+        self.key = key
+        self.maxsize = maxsize
+        self.values = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.name = None
+        caches.add(self)
+
+    def get_key(self, kwargs):
+        """Get the cache key for the step function arguments.
+
+        The default key is made of the arguments of the value types only, the step function arguments of the other
+        types (e.g. fixture objects, which differ for every test) require the custom key function.
+
+        :return: Hashable cache key or `None` if the arguments can't be cached.
+        """
+        if self.key is not None:
+            return self.key(**kwargs)
+        if not all(is_value(value) for value in kwargs.values()):
+            return None
+        return tuple(sorted(kwargs.items()))
+
+    def call(self, func, kwargs):
+        """Call the step function or get its cached return value."""
+        key = self.get_key(kwargs)
+        if key is None:
+            self.misses += 1
+            return func(**kwargs)
+        try:
+            value = self.values[key]
+        except KeyError:
+            self.misses += 1
+            value = self.values[key] = func(**kwargs)
+            if self.maxsize is not None and len(self.values) > self.maxsize:
+                self.values.popitem(last=False)
+        else:
+            self.hits += 1
+            # Move the key to the end as the most recently used
+            del self.values[key]
+            self.values[key] = value
+        return value
+
+    def clear(self):
+        """Clear cached values and statistics."""
+        self.values.clear()
+        self.hits = self.misses = 0
+
+
+def get_counts():
+    """Get the hits and misses of the step caches used in this process.
+
+    :return: `dict` in form {<cache id>: [<hits>, <misses>]}.
+    """
+    return {str(id(cache)): [cache.hits, cache.misses] for cache in caches if cache.hits or cache.misses}
+
+
+def get_counts_since(counts):
+    """Get the hits and misses of the step caches since the given counts (e.g. in a forked process)."""
+    since = {}
+    for cache_id, (hits, misses) in get_counts().items():
+        before_hits, before_misses = counts.get(cache_id, (0, 0))
+        if hits != before_hits or misses != before_misses:
+            since[cache_id] = [hits - before_hits, misses - before_misses]
+    return since
+
+
+def add_counts(counts):
+    """Add the hits and misses counted by a forked process to the step caches.
+
+    The forked process has a copy of the memory of this process, so its step caches have the same ids.
+    """
+    for cache in caches:
+        hits, misses = counts.get(str(id(cache)), (0, 0))
+        cache.hits += hits
+        cache.misses += misses
+
+
+def get_named_counts(config):
+    """Get the hits and misses of the used step caches by the step name, including the ones of the xdist workers.
+
+    :return: `dict` in form {<step name>: [<hits>, <misses>]}.
+    """
+    counts = {}
+    for cache in caches:
+        if cache.hits or cache.misses:
+            named_counts = counts.setdefault(cache.name, [0, 0])
+            named_counts[0] += cache.hits
+            named_counts[1] += cache.misses
+    for name, (hits, misses) in getattr(config, "_bdd_step_cache_counts", {}).items():
+        named_counts = counts.setdefault(name, [0, 0])
+        named_counts[0] += hits
+        named_counts[1] += misses
+    return counts
+
+
+def sessionfinish(config):
+    """Send the hits and misses of the step caches of the xdist worker to the controller."""
+    workeroutput = getattr(config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["bdd_step_cache"] = get_named_counts(config)
+
+
+def testnodedown(config, node):
+    """Add up the hits and misses of the step caches of the finished xdist worker."""
+    worker_counts = getattr(node, "workeroutput", {}).get("bdd_step_cache", {})
+    counts = getattr(config, "_bdd_step_cache_counts", None)
+    if counts is None:
+        counts = config._bdd_step_cache_counts = {}
+    for name, (hits, misses) in worker_counts.items():
+        named_counts = counts.setdefault(name, [0, 0])
+        named_counts[0] += hits
+        named_counts[1] += misses
+
+
+def terminal_summary(terminalreporter):
+    """Report the cache hits and misses of the used step caches."""
+    counts = get_named_counts(terminalreporter.config)
+    if not counts:
+        return
+    terminalreporter.write_sep("-", "pytest-bdd step cache")
+    for name, (hits, misses) in sorted(counts.items()):
+        terminalreporter.write_line("{name}: {hits} hits, {misses} misses".format(name=name, hits=hits, misses=misses))
+
+
+def unconfigure():
+    """Clear the step caches at the end of the session."""
+    for cache in caches:
+        cache.clear()
@@ -38,16 +38,20 @@ def given_beautiful_article(article):
 from __future__ import absolute_import
 import inspect
 import sys
+
 import pytest
+import six
 
 try:
     from _pytest import fixtures as pytest_fixtures
 except ImportError:
     from _pytest import python as pytest_fixtures
 
+from .exceptions import StepPatternError
 from .feature import force_encode
 from .types import GIVEN, WHEN, THEN
 from .parsers import get_parser
+from .step_cache import DEFAULT_MAXSIZE, StepCache
 from .utils import get_args, get_caller_module_locals
 
 
@@ -65,52 +69,162 @@ def get_step_fixture_name(name, type_, encoding=None):
     )
 
 
-def given(name, converters=None, target_fixture=None, **kwargs):
+def is_step_matching(lazy_step_func, name):
+    """Match the step name with the parser of the step definition.
+
+    :param lazy_step_func: Step fixture function.
+    :param str name: Step name.
+
+    :raises StepPatternError: when the pattern of the step definition is not valid, with its location.
+    """
+    try:
+        return lazy_step_func.parser.is_matching(name)
+    except StepPatternError as exception:
+        step_func = lazy_step_func()
+        code = getattr(step_func, "__code__", None)
+        location = u"{0}:{1}".format(code.co_filename, code.co_firstlineno) if code else repr(step_func)
+        six.raise_from(
+            StepPatternError(
+                u'{0}, in the step definition "{1}" at {2}'.format(
+                    exception, getattr(step_func, "origin_name", step_func.__name__), location
+                )
+            ),
+            exception,
+        )
+
+
+def given(
+    name,
+    converters=None,
+    target_fixture=None,
+    cache=None,
+    cache_key=None,
+    cache_maxsize=DEFAULT_MAXSIZE,
+    datatable_converters=None,
+    **kwargs
+):
     """Given step decorator.
 
     :param name: Step name or a parser object.
     :param converters: Optional `dict` of the argument or parameter converters in form
                        {<param_name>: <converter function>}.
     :param target_fixture: Target fixture name to replace by steps definition function
+    :param cache: Optional cache scope ("session") to memoize the step function return value.
+    :param cache_key: Optional function computing the cache key from the step function arguments.
+    :param cache_maxsize: Maximum number of the cached return values, `None` for unbounded.
+    :param datatable_converters: Optional `dict` of the data table column converters in form
+                                 {<column heading>: <converter function>}.
     :param kwargs: default value
     :return: Decorator function for the step.
     """
-    return _step_decorator(GIVEN, name, converters=converters, target_fixture=target_fixture, extra_args=kwargs)
+    return _step_decorator(
+        GIVEN,
+        name,
+        converters=converters,
+        target_fixture=target_fixture,
+        cache=cache,
+        cache_key=cache_key,
+        cache_maxsize=cache_maxsize,
+        datatable_converters=datatable_converters,
+        extra_args=kwargs,
+    )
 
 
-def when(name, converters=None, target_fixture=None, **kwargs):
+def when(
+    name,
+    converters=None,
+    target_fixture=None,
+    cache=None,
+    cache_key=None,
+    cache_maxsize=DEFAULT_MAXSIZE,
+    datatable_converters=None,
+    **kwargs
+):
     """When step decorator.
 
     :param name: Step name or a parser object.
     :param converters: Optional `dict` of the argument or parameter converters in form
                        {<param_name>: <converter function>}.
     :param target_fixture: Target fixture name to replace by steps definition function
+    :param cache: Optional cache scope ("session") to memoize the step function return value.
+    :param cache_key: Optional function computing the cache key from the step function arguments.
+    :param cache_maxsize: Maximum number of the cached return values, `None` for unbounded.
+    :param datatable_converters: Optional `dict` of the data table column converters in form
+                                 {<column heading>: <converter function>}.
 
     :return: Decorator function for the step.
     """
-    return _step_decorator(WHEN, name, converters=converters, target_fixture=target_fixture, extra_args=kwargs)
+    return _step_decorator(
+        WHEN,
+        name,
+        converters=converters,
+        target_fixture=target_fixture,
+        cache=cache,
+        cache_key=cache_key,
+        cache_maxsize=cache_maxsize,
+        datatable_converters=datatable_converters,
+        extra_args=kwargs,
+    )
 
 
-def then(name, converters=None, target_fixture=None, **kwargs):
+def then(
+    name,
+    converters=None,
+    target_fixture=None,
+    cache=None,
+    cache_key=None,
+    cache_maxsize=DEFAULT_MAXSIZE,
+    datatable_converters=None,
+    **kwargs
+):
     """Then step decorator.
 
     :param name: Step name or a parser object.
     :param converters: Optional `dict` of the argument or parameter converters in form
                        {<param_name>: <converter function>}.
     :param target_fixture: Target fixture name to replace by steps definition function
+    :param cache: Optional cache scope ("session") to memoize the step function return value.
+    :param cache_key: Optional function computing the cache key from the step function arguments.
+    :param cache_maxsize: Maximum number of the cached return values, `None` for unbounded.
+    :param datatable_converters: Optional `dict` of the data table column converters in form
+                                 {<column heading>: <converter function>}.
 
     :return: Decorator function for the step.
     """
-    return _step_decorator(THEN, name, converters=converters, target_fixture=target_fixture, extra_args=kwargs)
+    return _step_decorator(
+        THEN,
+        name,
+        converters=converters,
+        target_fixture=target_fixture,
+        cache=cache,
+        cache_key=cache_key,
+        cache_maxsize=cache_maxsize,
+        datatable_converters=datatable_converters,
+        extra_args=kwargs,
+    )
 
 
-def _step_decorator(step_type, step_name, converters=None, target_fixture=None, extra_args=None):
+def _step_decorator(
+    step_type,
+    step_name,
+    converters=None,
+    target_fixture=None,
+    cache=None,
+    cache_key=None,
+    cache_maxsize=DEFAULT_MAXSIZE,
+    datatable_converters=None,
+    extra_args=None,
+):
     """Step decorator for the type and the name.
 
     :param str step_type: Step type (GIVEN, WHEN or THEN).
     :param str step_name: Step name as in the feature file.
     :param dict converters: Optional step arguments converters mapping
     :param target_fixture: Optional fixture name to replace by step definition
+    :param str cache: Optional step cache scope
+    :param cache_key: Optional step cache key function
+    :param int cache_maxsize: Step cache maximum size, `None` for unbounded
+    :param dict datatable_converters: Optional data table column converters mapping
     :param extra_args: extra args
     :return: Decorator function for the step.
     """
@@ -137,6 +251,11 @@ def _step_decorator(step_type, step_name, converters=None, target_fixture=None,
             step_func.converters = lazy_step_func.converters = converters
 
         step_func.target_fixture = lazy_step_func.target_fixture = target_fixture
+        if datatable_converters:
+            step_func.datatable_converters = lazy_step_func.datatable_converters = datatable_converters
+        if cache:
+            step_func.step_cache = StepCache(cache, key=cache_key, maxsize=cache_maxsize)
+            step_func.step_cache.name = u'{type} "{name}"'.format(type=step_type.capitalize(), name=parsed_step_name)
         step_func.origin_name = lazy_step_func.origin_name = func_name
 
         fixture_step_name = get_step_fixture_name(parsed_step_name, step_type)
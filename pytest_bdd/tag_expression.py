@@ -0,0 +1,116 @@
+"""Cucumber tag expressions.
+
+The scenarios can be selected by the tags at the collection time, before the test functions are created:
+
+    py.test --bdd-tags "@smoke and not (@slow or @wip)"
+
+The tags are matched against the tags of the scenario and of its feature, the ``@`` prefix is optional.
+The ``not`` operator binds tighter than ``and``, which binds tighter than ``or``.
+"""
+
+import re
+
+import pytest
+
+from . import exceptions
+
+TOKEN_RE = re.compile(r"\(|\)|[^\s()]+")
+
+OPERATORS = ("and", "or", "not")
+
+
+def add_options(parser):
+    """Add pytest-bdd options."""
+    group = parser.getgroup("bdd", "Tags")
+    group._addoption(
+        "--bdd-tags",
+        action="store",
+        dest="bdd_tags",
+        metavar="EXPRESSION",
+        default=None,
+        help='only collect the scenarios matching the cucumber tag expression, e.g. "@smoke and not @slow".',
+    )
+
+
+def configure(config):
+    expression = config.option.bdd_tags
+    try:
+        config._bdd_tag_expression = TagExpression(expression) if expression else None
+    except exceptions.TagExpressionError as exception:
+        raise pytest.UsageError(u"--bdd-tags: {0}".format(exception))
+
+
+def is_selected(config, tags):
+    """Check if the scenario with the given tags (including the feature tags) is selected by the tag expression."""
+    expression = getattr(config, "_bdd_tag_expression", None)
+    return expression is None or expression.evaluate(tags)
+
+
+class TagExpression(object):
+    """Compiled tag expression."""
+
+    def __init__(self, expression):
+        """Parse the tag expression.
+
+        :param str expression: Tag expression.
+
+        :raises TagExpressionError: when the expression is not valid.
+        """
+        self.expression = expression
+        self.tokens = TOKEN_RE.findall(expression)
+        self.position = 0
+        if not self.tokens:
+            raise exceptions.TagExpressionError(u'Empty tag expression: "{0}"'.format(expression))
+        self.evaluate = self._parse_or()
+        if self.position < len(self.tokens):
+            self._error(u'unexpected "{0}"'.format(self.tokens[self.position]))
+
+    def _error(self, message):
+        raise exceptions.TagExpressionError(u'Invalid tag expression "{0}": {1}'.format(self.expression, message))
+
+    def _next(self):
+        if self.position >= len(self.tokens):
+            self._error(u"unexpected end of the expression")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _parse_or(self):
+        operands = [self._parse_and()]
+        while self._peek() == "or":
+            self._next()
+            operands.append(self._parse_and())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda tags: any(operand(tags) for operand in operands)
+
+    def _parse_and(self):
+        operands = [self._parse_not()]
+        while self._peek() == "and":
+            self._next()
+            operands.append(self._parse_not())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda tags: all(operand(tags) for operand in operands)
+
+    def _parse_not(self):
+        if self._peek() == "not":
+            self._next()
+            operand = self._parse_not()
+            return lambda tags: not operand(tags)
+        return self._parse_primary()
+
+    def _parse_primary(self):
+        token = self._next()
+        if token == "(":
+            operand = self._parse_or()
+            if self._next() != ")":
+                self._error(u'")" expected')
+            return operand
+        if token == ")" or token in OPERATORS:
+            self._error(u'unexpected "{0}"'.format(token))
+        tag = token[1:] if token.startswith("@") else token
+        return lambda tags: tag in tags
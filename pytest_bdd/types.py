@@ -16,3 +16,9 @@ TAG = "tag"
 CONTINUE = "continue"  # AND, BUG
 
 STEP_TYPES = (GIVEN, WHEN, THEN)
+
+# Tags configuring pytest-bdd itself rather than marking the scenario
+BACKGROUND_SCOPE_TAG_PREFIX = "background-scope:"
+ROWS_IN_ONE_ITEM_TAG = "rows-in-one-item"
+COMBINATIONS_TAG_PREFIX = "combinations:"
+OPTION_TAG_PREFIXES = (BACKGROUND_SCOPE_TAG_PREFIX, ROWS_IN_ONE_ITEM_TAG, COMBINATIONS_TAG_PREFIX)
@@ -0,0 +1,72 @@
+"""Step parsers tests."""
+import textwrap
+
+import pytest
+
+from pytest_bdd import exceptions, parsers
+
+
+@pytest.mark.parametrize(
+    ["parser", "attribute"],
+    [
+        (parsers.re(r"I have (?P<euro>\d+) Euro"), "_regex"),
+        (parsers.parse("I have {euro:d} Euro"), "_parser"),
+        (parsers.cfparse("I have {euro:d} Euro"), "_parser"),
+    ],
+)
+def test_parser_is_compiled_on_first_use(parser, attribute):
+    """Test that the step parsers are compiled when the step is matched for the first time."""
+    assert getattr(parser, attribute) is None
+
+    assert parser.is_matching("I have 5 Euro")
+    compiled = getattr(parser, attribute)
+    assert compiled is not None
+    assert not parser.is_matching("I have some Euro")
+    assert int(parser.parse_arguments("I have 7 Euro")["euro"]) == 7
+    assert getattr(parser, attribute) is compiled
+
+
+@pytest.mark.parametrize(
+    "parser", [parsers.re(r"I have (?P<euro>\d+ Euro"), parsers.parse("I have {euro:Q} Euro"), parsers.cfparse("{")]
+)
+def test_parser_pattern_not_valid(parser):
+    """Test that the patterns which can not be compiled are reported when the step is matched."""
+    with pytest.raises(exceptions.StepPatternError) as excinfo:
+        parser.is_matching("I have 5 Euro")
+    assert str(excinfo.value).startswith(u'Step pattern "{0}" is not valid: '.format(parser.name))
+
+
+def test_step_definition_pattern_not_valid(testdir):
+    """Test that the step definition with the pattern which can not be compiled is reported with its location."""
+    testdir.makefile(
+        ".feature",
+        euro=textwrap.dedent(
+            """\
+            Feature: Euro
+                Scenario: Euro
+                    Given I have 5 Euro
+            """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, parsers, scenarios
+
+            scenarios("euro.feature")
+
+
+            @given(parsers.re(r"I have (?P<euro>\\d+ Euro"))
+            def euro(euro):
+                pass
+            """
+        )
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            '*StepPatternError: Step pattern "I have (?P<euro>\\d+ Euro" is not valid: *, '
+            'in the step definition "euro" at *test_step_definition_pattern_not_valid.py:6'
+        ]
+    )
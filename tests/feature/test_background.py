@@ -1,7 +1,11 @@
 """Test feature background."""
 
+import json
+import os
 import textwrap
 
+import pytest
+
 
 FEATURE = """\
 Feature: Background support
@@ -117,3 +121,315 @@ def test_background_check_order(testdir):
     )
     result = testdir.runpytest()
     result.assert_outcomes(passed=1)
+
+
+SHARED_FEATURE = """\
+{tags}
+Feature: Shared background
+
+    Background:
+        Given there is a dataset
+
+    Scenario: First usage
+        Then the dataset is loaded once
+
+    Scenario: Second usage
+        Then the dataset is loaded once
+"""
+
+SHARED_STEPS = """\
+from pytest_bdd import given, then, scenarios
+
+LOADS = []
+
+scenarios("shared.feature")
+
+
+@given("there is a dataset", target_fixture="dataset")
+def dataset():
+    LOADS.append(1)
+    return {"loaded": len(LOADS)}
+
+
+@then("the dataset is loaded once")
+def loaded_once(dataset):
+    assert dataset == {"loaded": 1}
+    assert len(LOADS) == 1
+"""
+
+
+def test_background_shared_by_tag(testdir):
+    """Test that the feature-scoped background is executed once per feature."""
+    testdir.makefile(".feature", shared=SHARED_FEATURE.format(tags="@background-scope:feature"))
+    testdir.makepyfile(SHARED_STEPS)
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=2)
+
+
+def test_background_shared_cucumber_json(testdir):
+    """Test that the shared background steps are reported in the cucumber json of every scenario."""
+    testdir.makefile(".feature", shared=SHARED_FEATURE.format(tags="@background-scope:feature"))
+    testdir.makepyfile(SHARED_STEPS)
+    result = testdir.runpytest("--cucumberjson", "cucumber.json")
+    result.assert_outcomes(passed=2)
+    with open(os.path.join(str(testdir.tmpdir), "cucumber.json")) as f:
+        report = json.load(f)
+    elements = report[0]["elements"]
+    assert [element["name"] for element in elements] == ["First usage", "Second usage"]
+    for element in elements:
+        assert [(step["name"], step["result"]["status"]) for step in element["steps"]] == [
+            ("there is a dataset", "passed"),
+            ("the dataset is loaded once", "passed"),
+        ]
+    assert elements[1]["steps"][0]["result"]["duration"] == 0
+
+
+def test_background_shared_by_ini(testdir):
+    """Test that the background scope can be configured globally."""
+    testdir.makeini(
+        """\
+        [pytest]
+        bdd_background_scope = feature
+        """
+    )
+    testdir.makefile(".feature", shared=SHARED_FEATURE.format(tags=""))
+    testdir.makepyfile(SHARED_STEPS)
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=2)
+
+
+def test_background_not_shared_by_default(testdir):
+    """Test that the background is executed for every scenario by default."""
+    testdir.makefile(".feature", shared=SHARED_FEATURE.format(tags=""))
+    testdir.makepyfile(SHARED_STEPS)
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1, failed=1)
+
+
+SCOPED_STEPS = """\
+import pytest
+
+from pytest_bdd import given, then, scenarios
+
+LOADS = []
+
+scenarios("shared.feature")
+
+
+@pytest.fixture(scope="{scope}")
+def source():
+    return "dataset"
+
+
+@given("there is a dataset", target_fixture="dataset")
+def dataset(source):
+    LOADS.append(source)
+    return {{"loaded": len(LOADS)}}
+
+
+@then("the dataset is loaded once")
+def loaded_once(dataset):
+    assert dataset == {{"loaded": 1}}
+    assert len(LOADS) == 1
+"""
+
+
+@pytest.mark.parametrize(
+    "scope, outcomes",
+    [
+        ("module", dict(passed=2)),
+        ("session", dict(passed=2)),
+        # The fixture value is finalized after the first scenario, so the background is executed for every scenario
+        ("function", dict(passed=1, failed=1)),
+    ],
+)
+def test_background_shared_by_fixture_scope(testdir, scope, outcomes):
+    """Test that the background is shared only if its steps depend on the fixtures outliving the scenarios."""
+    testdir.makefile(".feature", shared=SHARED_FEATURE.format(tags="@background-scope:feature"))
+    testdir.makepyfile(SCOPED_STEPS.format(scope=scope))
+    result = testdir.runpytest()
+    result.assert_outcomes(**outcomes)
+
+
+def test_background_shared_failed_step_report(testdir):
+    """Test that the steps following the failed step are reported when the background is shared."""
+    testdir.makefile(
+        ".feature",
+        shared=textwrap.dedent(
+            """\
+            @background-scope:feature
+            Feature: Shared background
+
+                Background:
+                    Given there is a dataset
+
+                Scenario: First usage
+                    Then the dataset is loaded once
+
+                Scenario: Second usage
+                    Then the dataset is not loaded
+                    Then the dataset is loaded once
+            """
+        ),
+    )
+    testdir.makepyfile(
+        SHARED_STEPS
+        + textwrap.dedent(
+            """\
+
+
+            @then("the dataset is not loaded")
+            def not_loaded(dataset):
+                assert not dataset
+            """
+        )
+    )
+    result = testdir.inline_run()
+    result.assertoutcome(passed=1, failed=1)
+    report = result.matchreport("test_second_usage", when="call").scenario
+    assert [(step["name"], step["failed"], step["reused"]) for step in report["steps"]] == [
+        ("there is a dataset", False, True),
+        ("the dataset is not loaded", True, False),
+        ("the dataset is loaded once", True, False),
+    ]
+
+
+FORKED_FEATURE = """\
+@background-scope:fork
+Feature: Forked scenarios
+
+    Background:
+        Given the state is warmed up
+
+    Scenario: First mutation
+        When I mutate the state
+        Then the state is mutated once
+
+    Scenario: Second mutation
+        When I mutate the state
+        Then the state is mutated once
+
+    Scenario: Failing mutation
+        When I mutate the state
+        Then the state is mutated twice
+"""
+
+FORKED_STEPS = """\
+import os
+
+from pytest_bdd import given, when, then, scenarios
+
+STATE = {"warmups": 0, "mutations": 0, "pids": set()}
+
+scenarios("forked.feature")
+
+
+@given("the state is warmed up")
+def warm_up():
+    STATE["warmups"] += 1
+    STATE["pids"].add(os.getpid())
+
+
+@when("I mutate the state")
+def mutate():
+    assert os.getpid() not in STATE["pids"]
+    STATE["mutations"] += 1
+
+
+@then("the state is mutated once")
+def mutated_once():
+    assert STATE["warmups"] == 1
+    assert STATE["mutations"] == 1
+
+
+@then("the state is mutated twice")
+def mutated_twice():
+    assert STATE["mutations"] == 2
+"""
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Forking is not supported")
+def test_background_fork(testdir):
+    """Test that the scenarios are executed in forked processes after the shared background."""
+    testdir.makefile(".feature", forked=FORKED_FEATURE)
+    testdir.makepyfile(FORKED_STEPS)
+    result = testdir.runpytest("-vv")
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines(["*ForkedScenarioError*", "*assert 1 == 2*"])
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Forking is not supported")
+@pytest.mark.parametrize(
+    "crash, status",
+    [
+        ("os._exit(3)", "exit code 3"),
+        ("os.kill(os.getpid(), 9)", "signal 9"),
+        # The result can't be written to the parent
+        ("import json; json.dumps = None", "exit code 1"),
+    ],
+)
+def test_background_fork_crash(testdir, crash, status):
+    """Test that the forked process exiting without sending the result fails the scenario."""
+    testdir.makefile(".feature", forked=FORKED_FEATURE)
+    testdir.makepyfile(FORKED_STEPS.replace('STATE["mutations"] += 1', crash))
+    result = testdir.runpytest()
+    result.assert_outcomes(failed=3)
+    result.stdout.fnmatch_lines(
+        ["*ForkedScenarioError: Forked scenario process exited unexpectedly with {0}.*".format(status)]
+    )
+
+
+def test_background_fork_not_supported(testdir):
+    """Test that the background is executed for every scenario when the platform doesn't support forking."""
+    testdir.makefile(".feature", forked=FORKED_FEATURE)
+    testdir.makeconftest(
+        textwrap.dedent(
+            """\
+            import importlib
+
+            import pytest
+
+            forking = importlib.import_module("pytest_bdd.forking")
+
+
+            @pytest.fixture(autouse=True, scope="session")
+            def fork_not_supported():
+                is_supported = forking.is_supported
+                forking.is_supported = lambda: False
+                yield
+                forking.is_supported = is_supported
+            """
+        )
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, when, then, scenarios
+
+            scenarios("forked.feature")
+
+
+            @given("the state is warmed up", target_fixture="state")
+            def warm_up():
+                return {"mutations": 0}
+
+
+            @when("I mutate the state")
+            def mutate(state):
+                state["mutations"] += 1
+
+
+            @then("the state is mutated once")
+            def mutated_once(state):
+                assert state["mutations"] == 1
+
+
+            @then("the state is mutated twice")
+            def mutated_twice(state):
+                assert state["mutations"] == 2
+            """
+        )
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines(["*assert 1 == 2*"])
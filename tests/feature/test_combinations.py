@@ -0,0 +1,98 @@
+"""Test the combinatorial reduction of the example tables."""
+
+import itertools
+import textwrap
+
+import pytest
+
+from pytest_bdd.combinations import cover
+
+FEATURE = """\
+Feature: Checkout
+
+    Examples:
+    | browser | os    |
+    | chrome  | linux |
+    | chrome  | mac   |
+    | firefox | linux |
+    | firefox | mac   |
+    | safari  | mac   |
+    | safari  | linux |
+
+    {tag}
+    Scenario Outline: Checkout
+        Given I use <browser> on <os> in <locale> with the <theme> theme
+
+        Examples:
+        | locale | theme |
+        | en     | dark  |
+        | en     | light |
+        | de     | dark  |
+        | de     | light |
+        | fr     | dark  |
+        | fr     | light |
+"""
+
+TEST_MODULE = """\
+from pytest_bdd import given, scenarios
+
+@given("I use <browser> on <os> in <locale> with the <theme> theme")
+def configuration(browser, os, locale, theme):
+    pass
+
+scenarios("checkout.feature")
+"""
+
+
+@pytest.mark.parametrize(
+    ["tag", "min_passed", "max_passed"],
+    [
+        ("", 36, 36),
+        ("@combinations:pairwise", 9, 12),
+        ("@combinations:3-wise", 18, 24),
+        ("@combinations:4-wise", 36, 36),
+    ],
+)
+def test_combinations_tag(testdir, tag, min_passed, max_passed):
+    testdir.makefile(".feature", checkout=FEATURE.format(tag=tag))
+    testdir.makepyfile(TEST_MODULE)
+    result = testdir.runpytest()
+    outcomes = result.parseoutcomes()
+    assert set(outcomes) == {"passed"}
+    assert min_passed <= outcomes["passed"] <= max_passed
+
+
+def test_combinations_tag_not_valid(testdir):
+    testdir.makefile(".feature", checkout=FEATURE.format(tag="@combinations:often"))
+    testdir.makepyfile(TEST_MODULE)
+    result = testdir.runpytest()
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(['*has not valid tag "@combinations:often"*'])
+
+
+def get_covered(tables, combinations, table_columns):
+    """Get the value combinations of the given columns of the tables covered by the combinations of the rows."""
+    return set(
+        repr(tuple(tables[table_index][combination[table_index]][column] for table_index, column in table_columns))
+        for combination in combinations
+    )
+
+
+@pytest.mark.parametrize("strength", [1, 2, 3])
+def test_cover(strength):
+    tables = [
+        [["a", "x"], ["a", "y"], ["b", "x"], ["c", "y"]],
+        [[1, [1]], [2, [1]], [3, [2]]],
+        [["p"], ["q"]],
+    ]
+    combinations = cover(tables, strength)
+    assert len(set(combinations)) == len(combinations) < 4 * 3 * 2
+
+    # Every row is used
+    for table_index, rows in enumerate(tables):
+        assert set(combination[table_index] for combination in combinations) == set(range(len(rows)))
+
+    columns = [(table_index, column) for table_index, rows in enumerate(tables) for column in range(len(rows[0]))]
+    for table_columns in itertools.combinations(columns, strength):
+        all_combinations = itertools.product(*[range(len(rows)) for rows in tables])
+        assert get_covered(tables, combinations, table_columns) == get_covered(tables, all_combinations, table_columns)
@@ -8,7 +8,8 @@ def runandparse(testdir, *args):
     """Run tests in testdir and parse json output."""
     resultpath = testdir.tmpdir.join("cucumber.json")
     result = testdir.runpytest("--cucumberjson={0}".format(resultpath), "-s", *args)
-    jsonobject = json.load(resultpath.open())
+    with resultpath.open() as fd:
+        jsonobject = json.load(fd)
     return result, jsonobject
 
 
@@ -282,3 +283,46 @@ def test_step_trace_with_expand_option(testdir):
     assert jsonobject[0]["elements"][0]["steps"][0]["name"] == "type str and value hello"
     assert jsonobject[0]["elements"][1]["steps"][0]["name"] == "type int and value 42"
     assert jsonobject[0]["elements"][2]["steps"][0]["name"] == "type float and value 1.0"
+
+
+def test_multiple_features(testdir):
+    """Test that the scenarios spooled per feature are assembled into the report."""
+    for name in ("first", "second"):
+        testdir.makefile(
+            ".feature",
+            **{
+                name: textwrap.dedent(
+                    """
+            Feature: {0}
+                Scenario: {0} one
+                    Given a passing step
+
+                Scenario: {0} two
+                    Given a passing step
+            """.format(
+                        name
+                    )
+                )
+            }
+        )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """
+        from pytest_bdd import given, scenarios
+
+        scenarios("first.feature", "second.feature")
+
+        @given('a passing step')
+        def a_passing_step():
+            pass
+    """
+        )
+    )
+    result, jsonobject = runandparse(testdir)
+    result.assert_outcomes(passed=4)
+
+    assert [(feature["name"], [element["name"] for element in feature["elements"]]) for feature in jsonobject] == [
+        ("first", ["first one", "first two"]),
+        ("second", ["second one", "second two"]),
+    ]
+    assert not testdir.tmpdir.listdir(".cucumber-json-*")
@@ -0,0 +1,152 @@
+"""Test the data tables of the steps."""
+import textwrap
+
+from pytest_bdd.datatable import DataTable
+
+FEATURE = """\
+Feature: Users
+    Scenario Outline: Finding the users
+        Given there are the users:
+            | name  | age |
+            # the comments between the rows are skipped
+            | Alice | 31  |
+
+            | Bob   | 27  |
+            | C\\|D  | 45  |
+        When I look for the <age> years old users
+        Then I should find <found>
+
+        Examples:
+        | age | found |
+        | 31  | Alice |
+        | 45  | C\\|D  |
+"""
+
+STEPS = """\
+from pytest_bdd import given, when, then, parsers, scenarios
+
+from pytest_bdd.datatable import DataTable
+
+scenarios("users.feature")
+
+TABLES = []
+
+
+@given("there are the users:", target_fixture="users", datatable_converters={"age": int})
+def users(datatable):
+    TABLES.append(datatable)
+    # The same table is passed for every example row
+    assert all(table is datatable for table in TABLES)
+    assert isinstance(datatable, DataTable)
+    assert datatable.headings == ("name", "age")
+    assert datatable.line_number == 4
+    return list(datatable)
+
+
+@when("I look for the <age> years old users", target_fixture="found_users")
+def found_users(users, age):
+    return [user["name"] for user in users if user["age"] == int(age)]
+
+
+@then("I should find <found>")
+def should_find(found_users, found):
+    assert found_users == [found]
+"""
+
+
+def test_datatable(testdir):
+    testdir.makefile(".feature", users=FEATURE)
+    testdir.makepyfile(STEPS)
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=2)
+
+
+def test_datatable_with_multiline_step(testdir):
+    testdir.makefile(
+        ".feature",
+        steps=textwrap.dedent(
+            """\
+            Feature: Steps
+                Scenario: Steps
+                    Given I have the text:
+                        Some text
+                        | not a table |
+                    Then the table should be:
+                        | heading |
+                        | value   |
+            """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, then, scenarios
+
+            scenarios("steps.feature")
+
+
+            @given("I have the text:\\nSome text\\n| not a table |")
+            def text(datatable=None):
+                assert datatable is None
+
+
+            @then("the table should be:")
+            def table(datatable):
+                assert datatable["heading"] == ("value",)
+            """
+        )
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_datatable_not_valid(testdir):
+    testdir.makefile(
+        ".feature",
+        steps=textwrap.dedent(
+            """\
+            Feature: Steps
+                Scenario: Steps
+                    Given there are the users:
+                        | name  | age |
+                        | Alice |
+            """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import scenarios
+
+            scenarios("steps.feature")
+            """
+        )
+    )
+    result = testdir.runpytest()
+    result.stdout.fnmatch_lines(["*FeatureError: Data table row has 1 cells, the table has 2 columns.*"])
+
+
+def test_datatable_columns():
+    calls = []
+
+    def to_int(value):
+        calls.append(value)
+        return int(value)
+
+    table = DataTable(["name", "age"], [["Alice", "31"], ["Bob", "27"]])
+    converters = {"age": to_int}
+    converted = table.with_converters(converters)
+    # The same converted table is returned for the same converters
+    assert table.with_converters(converters) is converted
+    assert len(converted) == 2
+    assert "age" in converted and "email" not in converted
+    assert converted["name"] == ("Alice", "Bob")
+    assert not calls
+
+    # The column is converted on the first access only
+    assert converted["age"] == (31, 27)
+    assert converted.row(1) == {"name": "Bob", "age": 27}
+    assert list(converted) == [{"name": "Alice", "age": 31}, {"name": "Bob", "age": 27}]
+    assert calls == ["31", "27"]
+    assert table["age"] == ("31", "27")
+    assert str(table) == "| name  | age |\n| Alice | 31  |\n| Bob   | 27  |"
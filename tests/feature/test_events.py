@@ -0,0 +1,204 @@
+"""Test the NDJSON event stream output."""
+import json
+import os
+import textwrap
+
+import pytest
+
+
+def test_events(testdir):
+    """Test the events of the passing and failing scenarios."""
+    testdir.makefile(
+        ".feature",
+        events=textwrap.dedent(
+            """\
+            Feature: Events
+
+                Scenario: Passing
+                    Given a passing step
+
+                Scenario: Failing
+                    Given a passing step
+                    And a failing step
+            """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("events.feature")
+
+            @given("a passing step")
+            def passing_step():
+                pass
+
+            @given("a failing step")
+            def failing_step():
+                raise ValueError("failed")
+            """
+        )
+    )
+    result = testdir.runpytest("--bdd-events=events/events.ndjson")
+    result.assert_outcomes(passed=1, failed=1)
+
+    with testdir.tmpdir.join("events", "events.ndjson").open() as fd:
+        events = [json.loads(line) for line in fd]
+    event_types = [next(iter(event)) for event in events]
+    assert event_types == [
+        "testRunStarted",
+        "pickle",
+        "testCaseStarted",
+        "testStepStarted",
+        "testStepFinished",
+        "testCaseFinished",
+        "pickle",
+        "testCaseStarted",
+        "testStepStarted",
+        "testStepFinished",
+        "testStepStarted",
+        "testStepFinished",
+        "testCaseFinished",
+        "testRunFinished",
+    ]
+
+    pickle = events[6]["pickle"]
+    assert pickle["id"] == "test_events.py::test_failing"
+    assert pickle["name"] == "Failing"
+    assert [step["text"] for step in pickle["steps"]] == ["a passing step", "a failing step"]
+
+    step_finished = events[11]["testStepFinished"]
+    assert step_finished["testCaseId"] == "test_events.py::test_failing"
+    assert step_finished["step"]["text"] == "a failing step"
+    assert step_finished["status"] == "failed"
+    assert "failed" in step_finished["error"]
+    assert step_finished["duration"] >= 0
+
+    assert events[5]["testCaseFinished"]["status"] == "passed"
+    assert events[12]["testCaseFinished"]["status"] == "failed"
+    assert events[13]["testRunFinished"]["success"] is False
+
+
+def test_events_undefined_step(testdir):
+    """Test that the undefined step is started and finished, and the test function outcome is reported."""
+    testdir.makefile(
+        ".feature",
+        events=textwrap.dedent(
+            """\
+            Feature: Events
+
+                Scenario: Undefined
+                    Given an undefined step
+
+                Scenario: Failing test
+                    Given a passing step
+            """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenario
+
+            @scenario("events.feature", "Undefined")
+            def test_undefined():
+                pass
+
+            @scenario("events.feature", "Failing test")
+            def test_failing():
+                assert False
+
+            @given("a passing step")
+            def passing_step():
+                pass
+            """
+        )
+    )
+    result = testdir.runpytest("--bdd-events=events.ndjson")
+    result.assert_outcomes(failed=2)
+
+    with testdir.tmpdir.join("events.ndjson").open() as fd:
+        events = [json.loads(line) for line in fd]
+    event_types = [next(iter(event)) for event in events]
+    assert event_types == [
+        "testRunStarted",
+        "pickle",
+        "testCaseStarted",
+        "testStepStarted",
+        "testStepFinished",
+        "testCaseFinished",
+        "pickle",
+        "testCaseStarted",
+        "testStepStarted",
+        "testStepFinished",
+        "testCaseFinished",
+        "testRunFinished",
+    ]
+    assert events[3]["testStepStarted"]["step"]["text"] == "an undefined step"
+    assert events[4]["testStepFinished"]["status"] == "undefined"
+    assert events[5]["testCaseFinished"]["status"] == "failed"
+    # The step passed, but the test function failed
+    assert events[9]["testStepFinished"]["status"] == "passed"
+    assert events[10]["testCaseFinished"]["status"] == "failed"
+
+
+@pytest.mark.parametrize("tags", ["", "@background-scope:fork"])
+def test_events_xdist(testdir, tags):
+    """Test that the events of the xdist workers are written by the controller as the reports arrive."""
+    pytest.importorskip("xdist")
+    if tags and not hasattr(os, "fork"):
+        pytest.skip("Forking is not supported")
+    testdir.makefile(
+        ".feature",
+        events=textwrap.dedent(
+            """\
+            {tags}
+            Feature: Events
+                Scenario Outline: Passing
+                    Given a passing step with <value>
+
+                    Examples:
+                    | value |
+                    | 1     |
+                    | 2     |
+                    | 3     |
+                    | 4     |
+            """
+        ).format(tags=tags),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            import json
+            import time
+
+            from pytest_bdd import given, scenarios
+
+            scenarios("events.feature")
+
+            @given("a passing step with <value>")
+            def passing_step(value):
+                if value != "4":
+                    return
+                # The events of the first test are written while the session is running
+                for _ in range(50):
+                    with open("events.ndjson") as fd:
+                        if any("testCaseFinished" in json.loads(line) for line in fd):
+                            return
+                    time.sleep(0.1)
+                assert False, "The events are not written"
+            """
+        )
+    )
+    result = testdir.runpytest("-n", "1", "--bdd-events=events.ndjson")
+    result.assert_outcomes(passed=4)
+
+    assert [path.basename for path in testdir.tmpdir.listdir("events.ndjson*")] == ["events.ndjson"]
+    with testdir.tmpdir.join("events.ndjson").open() as fd:
+        events = [json.loads(line) for line in fd]
+    event_types = [next(iter(event)) for event in events]
+    assert event_types[0] == "testRunStarted"
+    assert event_types[-1] == "testRunFinished"
+    assert event_types.count("testCaseStarted") == event_types.count("testCaseFinished") == 4
+    assert event_types.count("testStepStarted") == event_types.count("testStepFinished") == 4
@@ -0,0 +1,144 @@
+"""Test the execution plans of the scenario steps."""
+import textwrap
+
+FEATURE = """\
+Feature: Basket
+    Background:
+        Given there is an empty basket
+
+    Scenario Outline: Adding the fruits
+        When I add 3 <fruit>
+        Then the basket has 3 fruits
+
+        Examples:
+        | fruit   |
+        | apples  |
+        | pears   |
+        | bananas |
+"""
+
+GIVEN = """\
+from pytest_bdd import given
+
+
+@given("there is an empty basket", target_fixture="basket")
+def basket():
+    return {basket}
+"""
+
+CONFTEST = """\
+import importlib
+
+import pytest
+
+from pytest_bdd import given
+
+scenario_module = importlib.import_module("pytest_bdd.scenario")
+
+PLANNED = []
+
+
+@pytest.fixture(autouse=True, scope="session")
+def count_plans():
+    plan_step = scenario_module._plan_step
+
+    def counting_plan_step(step, request, encoding):
+        PLANNED.append((request.node.parent.nodeid, step.name))
+        return plan_step(step, request, encoding)
+
+    scenario_module._plan_step = counting_plan_step
+    yield
+    scenario_module._plan_step = plan_step
+
+
+def pytest_sessionfinish(session):
+    session.config.planned = list(PLANNED)
+
+
+@given("there is an empty basket", target_fixture="basket")
+def basket():
+    return []
+"""
+
+STEPS = """\
+from pytest_bdd import when, then, parsers, scenarios
+
+scenarios("../basket.feature")
+
+
+@when(parsers.parse("I add {{count:d}} <fruit>"), converters={{"count": lambda count: [count]}})
+def add_fruits(basket, count, fruit):
+    # The converted value is not shared between the example rows
+    assert count == [3]
+    count.append(fruit)
+    basket.extend([fruit] * count[0])
+
+
+@then(parsers.parse("the basket has {{count:d}} fruits"))
+def basket_has_fruits(basket, count):
+    assert len(basket) == {factor} * count
+"""
+
+
+def test_step_plans_reused_between_example_rows(testdir):
+    testdir.makefile(".feature", basket=FEATURE)
+    testdir.makeconftest(CONFTEST)
+    testdir.mkdir("single").join("test_single.py").write(STEPS.format(factor=1))
+    result = testdir.inline_run("-p", "no:cacheprovider")
+    result.assertoutcome(passed=3)
+
+    # Every step is planned once for all the example rows
+    assert sorted(result.getcalls("pytest_sessionfinish")[0].session.config.planned) == [
+        ("single/test_single.py", "I add 3 <fruit>"),
+        ("single/test_single.py", "the basket has 3 fruits"),
+        ("single/test_single.py", "there is an empty basket"),
+    ]
+
+
+def test_step_plans_per_module(testdir):
+    testdir.makefile(".feature", basket=FEATURE)
+    testdir.makeconftest(GIVEN.format(basket=[]))
+    testdir.mkdir("single").join("test_single.py").write(STEPS.format(factor=1))
+    # The step of the conftest in the directory overrides the step of the root conftest for its modules only
+    double = testdir.mkdir("double")
+    double.join("conftest.py").write(GIVEN.format(basket=["apples"] * 3))
+    double.join("test_double.py").write(STEPS.format(factor=2))
+    result = testdir.runpytest("-p", "no:cacheprovider")
+    result.assert_outcomes(passed=6)
+
+
+def test_step_plan_stacked_decorators(testdir):
+    """Test that the arguments are parsed by the parser of the matching step decorator."""
+    testdir.makefile(
+        ".feature",
+        buy=textwrap.dedent(
+            """\
+            Feature: Buying
+                Scenario: Buying the items
+                    Given I buy 5 items
+                    Then I have 5 items
+            """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, then, parsers, scenarios
+
+            scenarios("buy.feature")
+
+
+            @given("I buy <n> items", target_fixture="items")
+            @given(parsers.parse("I buy {n:d} items"), target_fixture="items")
+            def buy(n):
+                return n
+
+
+            @then(parsers.parse("I have {count:d} items"))
+            def have_items(items, count):
+                assert items == count
+            """
+        )
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
@@ -0,0 +1,105 @@
+"""Test direct collection of the feature files."""
+import textwrap
+
+FEATURE = """\
+Feature: Login
+
+    Background:
+        Given I have a browser
+
+    Scenario: Successful login
+        When I log in as <user>
+        Then I am logged in
+
+        Examples:
+        | user  |
+        | alice |
+        | bob   |
+
+    Scenario: Anonymous
+        Then I am not logged in
+"""
+
+CONFTEST = """\
+from pytest_bdd import given, when, then
+
+@given("I have a browser", target_fixture="browser")
+def browser():
+    return {}
+
+@when("I log in as <user>")
+def log_in(browser, user):
+    browser["user"] = user
+
+@then("I am logged in")
+def logged_in(browser):
+    assert browser["user"]
+
+@then("I am not logged in")
+def not_logged_in(browser):
+    assert "user" not in browser
+"""
+
+
+def test_feature_collection(testdir):
+    """Test that the scenarios of the feature files are collected without the python test modules."""
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_collect_feature_files = true
+        """
+    )
+    features = testdir.mkdir("features")
+    features.join("login.feature").write(FEATURE)
+    features.join("conftest.py").write(CONFTEST)
+
+    result = testdir.runpytest("-v")
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(
+        [
+            "features/login.feature::Successful login[[]alice[]] PASSED*",
+            "features/login.feature::Successful login[[]bob[]] PASSED*",
+            "features/login.feature::Anonymous PASSED*",
+        ]
+    )
+
+    result = testdir.runpytest("-v", "features/login.feature::Anonymous")
+    result.assert_outcomes(passed=1)
+
+    result = testdir.runpytest("-v", "-k", "Successful")
+    result.assert_outcomes(passed=2)
+
+
+def test_feature_collection_disabled(testdir):
+    """Test that the feature files are not collected by default."""
+    testdir.makefile(".feature", login=FEATURE)
+    testdir.makeconftest(CONFTEST)
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=0)
+    assert "collected 0 items" in result.stdout.str()
+
+    # The feature files collector is not even registered
+    config = testdir.parseconfigure()
+    assert not config.pluginmanager.has_plugin("pytest-bdd-feature-files")
+
+
+def test_feature_collection_docstring(testdir):
+    """Test that the docstrings of the collected scenarios have the relative feature file path."""
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_collect_feature_files = true
+        """
+    )
+    features = testdir.mkdir("features")
+    features.join("login.feature").write(FEATURE)
+    features.join("conftest.py").write(CONFTEST)
+
+    items, _ = testdir.inline_genitems()
+    assert [item.function.__doc__ for item in items] == [
+        "features/login.feature: Successful login",
+        "features/login.feature: Successful login",
+        "features/login.feature: Anonymous",
+    ]
+    assert items[0].config.pluginmanager.has_plugin("pytest-bdd-feature-files")
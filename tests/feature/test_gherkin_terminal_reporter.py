@@ -232,3 +232,21 @@ def test_step_parameters_should_be_replaced_by_their_values(testdir):
     result.stdout.fnmatch_lines("*When I eat {eat} cucumbers".format(**example))
     result.stdout.fnmatch_lines("*Then I should have {left} cucumbers".format(**example))
     result.stdout.fnmatch_lines("*PASSED")
+
+
+def test_xdist_very_verbose_mode_should_display_steps(testdir):
+    pytest.importorskip("xdist")
+    testdir.makefile(".feature", test=FEATURE)
+    testdir.makepyfile(TEST)
+    result = testdir.runpytest("--gherkin-terminal-reporter", "-vv", "-n", "2")
+    result.assert_outcomes(passed=1, failed=0)
+    result.stdout.fnmatch_lines(
+        [
+            "Feature: Gherkin terminal output feature",
+            "*Scenario: Scenario example 1",
+            "*Given there is a bar",
+            "*When the bar is accessed",
+            "*Then world explodes",
+            "*PASSED",
+        ]
+    )
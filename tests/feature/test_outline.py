@@ -1,6 +1,9 @@
 """Scenario Outline tests."""
 import textwrap
 
+import pytest
+
+from pytest_bdd.parser import Step
 from tests.utils import assert_outcomes
 
 STEPS = """\
@@ -424,3 +427,28 @@ def test_outline_with_escaped_pipes(testdir):
     )
     result = testdir.runpytest()
     result.assert_outcomes(passed=7)
+
+
+@pytest.mark.parametrize(
+    ["name", "example_kwargs", "expected"],
+    [
+        ("there are <start> cucumbers", {"start": "12"}, "there are 12 cucumbers"),
+        ("I eat <eat> of <start>", {"start": "12", "eat": "5"}, "I eat 5 of 12"),
+        ("<left><left>", {"left": "7"}, "77"),
+        ("there are <start> cucumbers", {}, "there are <start> cucumbers"),
+        ("there are no cucumbers", {"start": "12"}, "there are no cucumbers"),
+    ],
+)
+def test_step_expand(name, example_kwargs, expected):
+    """Test filling in the step name with the example values."""
+    step = Step(name=name, type="given", indent=0, line_number=1, keyword="Given")
+    assert step.expand(example_kwargs) == expected
+
+
+def test_step_template_compiled_with_name():
+    """Test the step template is compiled with the step name, including the multiline lines."""
+    step = Step(name="there are <start>", type="given", indent=0, line_number=1, keyword="Given")
+    assert step.template.segments == ["there are ", "start", ""]
+    step.add_line("  <eat> cucumbers")
+    assert step.template.segments == ["there are ", "start", "\n", "eat", " cucumbers"]
+    assert step.expand({"start": "12", "eat": "5"}) == "there are 12\n5 cucumbers"
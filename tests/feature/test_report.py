@@ -119,6 +119,8 @@ def test_step_trace(testdir):
                 "keyword": "Given",
                 "line_number": 6,
                 "name": u"a passing step",
+                "reused": False,
+                "template": [u"a passing step"],
                 "type": "given",
             },
             {
@@ -127,6 +129,8 @@ def test_step_trace(testdir):
                 "keyword": "And",
                 "line_number": 7,
                 "name": u"some other passing step",
+                "reused": False,
+                "template": [u"some other passing step"],
                 "type": "given",
             },
         ],
@@ -156,6 +160,8 @@ def test_step_trace(testdir):
                 "keyword": "Given",
                 "line_number": 11,
                 "name": u"a passing step",
+                "reused": False,
+                "template": [u"a passing step"],
                 "type": "given",
             },
             {
@@ -164,6 +170,8 @@ def test_step_trace(testdir):
                 "keyword": "And",
                 "line_number": 12,
                 "name": u"a failing step",
+                "reused": False,
+                "template": [u"a failing step"],
                 "type": "given",
             },
         ],
@@ -192,6 +200,8 @@ def test_step_trace(testdir):
                 "keyword": "Given",
                 "line_number": 15,
                 "name": u"there are <start> cucumbers",
+                "reused": False,
+                "template": [u"there are ", u"start", u" cucumbers"],
                 "type": "given",
             },
             {
@@ -200,6 +210,8 @@ def test_step_trace(testdir):
                 "keyword": "When",
                 "line_number": 16,
                 "name": u"I eat <eat> cucumbers",
+                "reused": False,
+                "template": [u"I eat ", u"eat", u" cucumbers"],
                 "type": "when",
             },
             {
@@ -208,6 +220,8 @@ def test_step_trace(testdir):
                 "keyword": "Then",
                 "line_number": 17,
                 "name": u"I should have <left> cucumbers",
+                "reused": False,
+                "template": [u"I should have ", u"left", u" cucumbers"],
                 "type": "then",
             },
         ],
@@ -243,6 +257,8 @@ def test_step_trace(testdir):
                 "keyword": "Given",
                 "line_number": 15,
                 "name": u"there are <start> cucumbers",
+                "reused": False,
+                "template": [u"there are ", u"start", u" cucumbers"],
                 "type": "given",
             },
             {
@@ -251,6 +267,8 @@ def test_step_trace(testdir):
                 "keyword": "When",
                 "line_number": 16,
                 "name": u"I eat <eat> cucumbers",
+                "reused": False,
+                "template": [u"I eat ", u"eat", u" cucumbers"],
                 "type": "when",
             },
             {
@@ -259,6 +277,8 @@ def test_step_trace(testdir):
                 "keyword": "Then",
                 "line_number": 17,
                 "name": u"I should have <left> cucumbers",
+                "reused": False,
+                "template": [u"I should have ", u"left", u" cucumbers"],
                 "type": "then",
             },
         ],
@@ -335,3 +355,104 @@ def test_complex_types(testdir):
     report = result.matchreport("test_complex[point0-alien0]", when="call")
     assert execnet.gateway_base.dumps(report.item)
     assert execnet.gateway_base.dumps(report.scenario)
+
+
+def test_multiple_examples_tables(testdir):
+    """Test the examples and the row indexes of the scenario with multiple example tables."""
+    testdir.makefile(
+        ".feature",
+        test=textwrap.dedent(
+            """
+    Feature: Multiple example tables
+
+        Examples:
+        | fruit |
+        | apple |
+        | pear  |
+
+        Scenario Outline: Eating
+            Given there are <count> <fruit>s of <size> size
+
+            Examples: Counts
+            | count |
+            | 1     |
+            | 2     |
+            | 3     |
+
+            Examples: Sizes
+            | size  |
+            | small |
+            | large |
+    """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """
+        from pytest_bdd import given, scenarios
+
+        @given("there are <count> <fruit>s of <size> size")
+        def fruits(count, fruit, size):
+            pass
+
+        scenarios("test.feature")
+    """
+        )
+    )
+    result = testdir.inline_run()
+    reports = [report for report in result.getreports("pytest_runtest_logreport") if report.when == "call"]
+    assert len(reports) == 12
+
+    # The scenario example tables come first
+    tables = [(11, ["count"], ["1", "2", "3"]), (17, ["size"], ["small", "large"]), (3, ["fruit"], ["apple", "pear"])]
+    for report in reports:
+        examples = report.scenario["examples"]
+        assert [(table["line_number"], table["rows"]) for table in examples] == [
+            (line_number, [params, [[value] for value in values]]) for line_number, params, values in tables
+        ]
+        example_kwargs = report.scenario["example_kwargs"]
+        assert [table["row_index"] for table in examples] == [
+            values.index(example_kwargs[params[0]]) for _, params, values in tables
+        ]
+
+
+def test_unhashable_example_values(testdir):
+    """Test the row indexes of the converted example values which can not be hashed."""
+    testdir.makefile(
+        ".feature",
+        test=textwrap.dedent(
+            """
+    Feature: Unhashable example values
+
+        Scenario Outline: Coordinates
+            Given there is a coordinate <point>
+
+            Examples:
+            |  point  |
+            |  10,20  |
+            |  30,40  |
+            |  10,20  |
+    """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """
+        from pytest_bdd import given, scenario
+
+        @given("there is a coordinate <point>")
+        def point(point):
+            assert isinstance(point, list)
+
+        @scenario("test.feature", "Coordinates", example_converters=dict(point=lambda value: value.split(",")))
+        def test_coordinates():
+            pass
+    """
+        )
+    )
+    result = testdir.inline_run()
+    reports = [report for report in result.getreports("pytest_runtest_logreport") if report.when == "call"]
+    assert all(report.passed for report in reports)
+    # The equal rows are reported as the first of them
+    assert [report.scenario["examples"][0]["row_index"] for report in reports] == [0, 1, 0]
+    assert reports[1].scenario["examples"][0]["rows"] == [["point"], [[["10", "20"]], [["30", "40"]], [["10", "20"]]]]
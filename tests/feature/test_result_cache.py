@@ -0,0 +1,66 @@
+"""Test skipping of the unchanged passing scenarios."""
+import textwrap
+
+FEATURE = """\
+Feature: Result cache
+
+    Scenario: Passing
+        Given I have a bar
+
+    Scenario: Failing
+        Given I have a bar
+        Then it fails
+"""
+
+STEPS = """\
+import pytest
+
+from pytest_bdd import given, then, scenarios
+
+scenarios("result_cache.feature")
+
+@pytest.fixture
+def bar_value():
+    return "{bar_value}"
+
+@given("I have a bar")
+def i_have_a_bar(bar_value):
+    return bar_value
+
+@then("it fails")
+def it_fails():
+    assert False
+"""
+
+
+def test_skip_unchanged(testdir):
+    """Test that only the scenarios which didn't pass or changed are executed."""
+    testdir.makefile(".feature", result_cache=FEATURE)
+    testdir.makepyfile(test_result_cache=STEPS.format(bar_value="bar"))
+
+    result = testdir.runpytest("--bdd-skip-unchanged")
+    result.assert_outcomes(passed=1, failed=1)
+
+    result = testdir.runpytest("--bdd-skip-unchanged", "-v")
+    result.assert_outcomes(passed=0, failed=1)
+    result.stdout.fnmatch_lines(["*1 deselected*"])
+
+    # Without the option all the scenarios are executed
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1, failed=1)
+
+    # The fixture of the step changed
+    testdir.makepyfile(test_result_cache=STEPS.format(bar_value="foo"))
+    result = testdir.runpytest("--bdd-skip-unchanged", "-v")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*test_passing PASSED*"])
+
+    # The failing scenario changed, the parsed features are cached in the process
+    testdir.makefile(".feature", result_cache=FEATURE.replace("Then it fails", "And I have a bar"))
+    result = testdir.runpytest_subprocess("--bdd-skip-unchanged")
+    result.assert_outcomes(passed=1, failed=0)
+    result.stdout.fnmatch_lines(["*1 deselected*"])
+
+    result = testdir.runpytest_subprocess("--bdd-skip-unchanged")
+    result.assert_outcomes(passed=0, failed=0)
+    result.stdout.fnmatch_lines(["*2 deselected*"])
@@ -0,0 +1,157 @@
+"""Test the execution of all the example rows of a scenario outline in one item."""
+import json
+import textwrap
+
+FEATURE = """\
+Feature: Cucumbers
+    @rows-in-one-item
+    Scenario Outline: Eating
+        Given there are <start> cucumbers
+        When I eat <eat> cucumbers
+        Then I should have <left> cucumbers
+
+        Examples:
+        | start | eat | left |
+        |  12   |  5  |  7   |
+        |  5    |  4  |  2   |
+        |  4    |  2  |  2   |
+"""
+
+STEPS = """\
+from pytest_bdd import given, when, then
+
+@given("there are <start> cucumbers", target_fixture="start_cucumbers")
+def start_cucumbers(start):
+    return dict(start=int(start), eat=0)
+
+@when("I eat <eat> cucumbers")
+def eat_cucumbers(start_cucumbers, eat):
+    start_cucumbers["eat"] += int(eat)
+
+@then("I should have <left> cucumbers")
+def should_have_left_cucumbers(start_cucumbers, start, left):
+    assert int(start) - start_cucumbers["eat"] == int(left)
+"""
+
+
+def test_rows_in_one_item(testdir):
+    testdir.makefile(".feature", outline=FEATURE)
+    testdir.makeconftest(STEPS)
+    testdir.makepyfile(
+        textwrap.dedent(
+            """
+            from pytest_bdd import scenarios
+
+            scenarios("outline.feature")
+            """
+        )
+    )
+    result = testdir.runpytest("-v", "--cucumberjson=cucumber.json")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["*collected 1 item*", "*ExampleRowsFailedError: 1 of 3 example rows failed:*"])
+    result.stdout.fnmatch_lines(["*[[]1[]] {*'left': '2'*}: AssertionError*"])
+
+    with open(str(testdir.tmpdir.join("cucumber.json"))) as fd:
+        [feature] = json.load(fd)
+    assert [element["id"] for element in feature["elements"]] == ["test_eating[0]", "test_eating[1]", "test_eating[2]"]
+    assert [[step["result"]["status"] for step in element["steps"]] for element in feature["elements"]] == [
+        ["passed", "passed", "passed"],
+        ["passed", "passed", "failed"],
+        ["passed", "passed", "passed"],
+    ]
+
+
+def test_rows_in_one_item_ini(testdir):
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_rows_in_one_item = true
+        """
+    )
+    feature = FEATURE.replace("    @rows-in-one-item\n", "").replace("|  2   |\n", "|  1   |\n", 1)
+    testdir.makefile(".feature", outline=feature)
+    testdir.makeconftest(STEPS)
+    testdir.makepyfile(
+        textwrap.dedent(
+            """
+            from pytest_bdd import scenarios
+
+            scenarios("outline.feature")
+            """
+        )
+    )
+    result = testdir.runpytest("-vv", "--gherkin-terminal-reporter")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*Scenario: Eating",
+            "*Example: eat=5, left=7, start=12",
+            "*Given there are <start> cucumbers",
+            "*When I eat <eat> cucumbers",
+            "*Then I should have <left> cucumbers",
+            "*PASSED",
+            "*Example: eat=4, left=1, start=5",
+        ]
+    )
+
+
+def test_rows_in_one_item_outcomes(testdir):
+    """Test that the skipped and failed rows don't stop the execution of the following rows."""
+    testdir.makefile(".feature", outline=FEATURE)
+    testdir.makeconftest(
+        STEPS.replace(
+            "def start_cucumbers(start):\n",
+            textwrap.dedent(
+                """\
+                def start_cucumbers(start):
+                    if start == "12":
+                        pytest.skip("Too many cucumbers")
+                    if start == "5":
+                        pytest.fail("Not enough cucumbers")
+                """
+            ),
+        ).replace("from pytest_bdd", "import pytest\n\nfrom pytest_bdd")
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """
+            from pytest_bdd import scenarios
+
+            scenarios("outline.feature")
+            """
+        )
+    )
+    result = testdir.runpytest("-vv", "--gherkin-terminal-reporter")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["*1 of 3 example rows failed:*", "*[[]1[]] {*'start': '5'*}: Not enough cucumbers*"])
+    result.stdout.fnmatch_lines(
+        [
+            "*Example: eat=5, left=7, start=12",
+            "*SKIPPED",
+            "*Example: eat=4, left=2, start=5",
+            "*FAILED",
+            "*Example: eat=2, left=2, start=4",
+            "*PASSED",
+        ]
+    )
+
+
+def test_rows_in_one_item_skipped(testdir):
+    """Test that the item is skipped when all its rows are skipped."""
+    testdir.makefile(".feature", outline=FEATURE)
+    testdir.makeconftest(
+        STEPS.replace(
+            "def start_cucumbers(start):\n", 'def start_cucumbers(start):\n    pytest.skip("No cucumbers")\n'
+        ).replace("from pytest_bdd", "import pytest\n\nfrom pytest_bdd")
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """
+            from pytest_bdd import scenarios
+
+            scenarios("outline.feature")
+            """
+        )
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(skipped=1)
@@ -0,0 +1,105 @@
+"""Test the deterministic sampling of the example rows."""
+import re
+import textwrap
+
+import pytest
+
+from pytest_bdd.sampling import Sampling
+
+COUNTRIES = ["de"] * 12 + ["fr"] * 6 + ["nl"] * 2
+
+
+@pytest.fixture
+def outline(testdir):
+    rows = "\n".join("        | {0:<7} | {1:<5} |".format(country, index) for index, country in enumerate(COUNTRIES))
+    testdir.makefile(
+        ".feature",
+        outline=textwrap.dedent(
+            """\
+            Feature: Shipping
+                Scenario Outline: Ship
+                    Given I ship order <order> to <country>
+
+                    Examples:
+                    | country | order |
+            """
+        )
+        + rows
+        + "\n",
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            @given("I ship order <order> to <country>")
+            def ship(order, country):
+                pass
+
+            scenarios("outline.feature")
+            """
+        )
+    )
+    return testdir
+
+
+def get_passed_rows(result):
+    return re.findall(r"::test_ship\[(\w+)-(\d+)\] PASSED", str(result.stdout))
+
+
+def test_sample_rows(outline):
+    result = outline.runpytest("-v", "--bdd-sample-rows", "5")
+    result.assert_outcomes(passed=5)
+    rows = get_passed_rows(result)
+    assert len(rows) == 5
+    # The rows keep their order
+    assert [int(order) for _, order in rows] == sorted(int(order) for _, order in rows)
+
+    result = outline.runpytest("-v", "--bdd-sample-rows", "5")
+    assert get_passed_rows(result) == rows
+
+    samples = set()
+    for seed in range(5):
+        result = outline.runpytest("-v", "--bdd-sample-rows", "5", "--bdd-seed", str(seed))
+        samples.add(tuple(get_passed_rows(result)))
+    assert len(samples) > 1
+
+    result = outline.runpytest("-v", "--bdd-sample-fraction", "0.1")
+    result.assert_outcomes(passed=2)
+
+    result = outline.runpytest()
+    result.assert_outcomes(passed=20)
+
+
+def test_sample_stratified(outline):
+    result = outline.runpytest("-v", "--bdd-sample-rows", "3", "--bdd-sample-stratify", "country")
+    result.assert_outcomes(passed=3)
+    assert sorted(country for country, _ in get_passed_rows(result)) == ["de", "fr", "nl"]
+
+    result = outline.runpytest("-v", "--bdd-sample-fraction", "0.1", "--bdd-sample-stratify", "country")
+    result.assert_outcomes(passed=3)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 4, 10])
+def test_sample_stratified_limit(limit):
+    """Test the stratified sample doesn't exceed the number of the rows."""
+    rows = [[country, str(index)] for index, country in enumerate(COUNTRIES + ["be", "lu", "at"])]
+    for seed in range(20):
+        sampling = Sampling(rows=limit, stratify="country", seed=str(seed))
+        sample = sampling.sample("outline.feature:5", ["country", "order"], rows)
+        assert len(sample) == limit
+        if limit >= 6:
+            assert set(country for country, _ in sample) == set(COUNTRIES + ["be", "lu", "at"])
+
+
+def test_sample_options_not_valid(outline):
+    result = outline.runpytest("--bdd-sample-fraction", "2")
+    assert result.ret == 4
+    result.stderr.fnmatch_lines(["*--bdd-sample-fraction: the fraction must be greater than 0 and at most 1.*"])
+
+
+@pytest.mark.parametrize(
+    ["rows", "fraction", "count", "size"], [(None, 0.05, 100, 5), (None, 0.05, 10, 1), (3, 0.5, 10, 3), (5, None, 2, 2)]
+)
+def test_sample_size(rows, fraction, count, size):
+    assert Sampling(rows=rows, fraction=fraction).get_size(count) == size
@@ -1,6 +1,7 @@
 """Test scenarios shortcut."""
 import textwrap
 
+from pytest_bdd.plugin import reorder_scenario_items
 from tests.utils import assert_outcomes
 
 
@@ -88,3 +89,32 @@ def test_scenarios_none_found(testdir, pytest_params):
     result = testdir.runpytest_subprocess(testpath, *pytest_params)
     assert_outcomes(result, errors=1)
     result.stdout.fnmatch_lines(["*NoScenariosFound*"])
+
+
+def test_reorder_scenario_items():
+    """Test that only the scenario items are re-ordered by the declaration order."""
+
+    class Item(object):
+        def __init__(self, name, declaration_order=None):
+            self.name = name
+            self.function = lambda: None
+            if declaration_order is not None:
+                self.function.__pytest_bdd_counter__ = declaration_order
+
+    items = [
+        Item("test_1"),
+        Item("scenario_2[1]", 2),
+        Item("scenario_2[2]", 2),
+        Item("test_2"),
+        Item("scenario_1", 1),
+        Item("test_3"),
+    ]
+    reorder_scenario_items(items)
+    assert [item.name for item in items] == [
+        "test_1",
+        "scenario_1",
+        "scenario_2[1]",
+        "test_2",
+        "scenario_2[2]",
+        "test_3",
+    ]
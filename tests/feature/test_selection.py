@@ -0,0 +1,166 @@
+"""Test the selection of the scenarios by the feature file line number."""
+import textwrap
+
+FEATURE = """\
+Feature: Checkout
+    Scenario: Pay by card
+        Given I have a cart
+
+    @smoke
+    Scenario: Pay by voucher
+        Given I have a cart
+
+    Scenario Outline: Pay in installments
+        Given I have a cart
+        When I pay in <count> installments
+
+        Examples:
+        | count |
+        | 2     |
+        | 3     |
+        | 4     |
+"""
+
+STEPS = """\
+from pytest_bdd import given, when
+
+@given("I have a cart")
+def cart():
+    pass
+
+@when("I pay in <count> installments")
+def pay(count):
+    pass
+"""
+
+
+def test_select_by_line(testdir):
+    testdir.makeini(
+        """
+        [pytest]
+        markers =
+            smoke
+        """
+    )
+    testdir.makefile(".feature", checkout=FEATURE)
+    testdir.makefile(".feature", other="Feature: Other\n    Given a step outside of a scenario\n")
+    testdir.makeconftest(STEPS)
+    testdir.makepyfile(
+        test_checkout="""
+        from pytest_bdd import scenario, scenarios
+
+        @scenario("checkout.feature", "Pay by card")
+        def test_pay_by_card():
+            pass
+
+        scenarios("checkout.feature")
+        """,
+        # The feature file is not valid, it would fail the collection if it was parsed
+        test_other="""
+        from pytest_bdd import scenarios
+
+        scenarios("other.feature")
+        """,
+    )
+
+    result = testdir.runpytest()
+    result.assert_outcomes(errors=1)
+
+    result = testdir.runpytest("checkout.feature:3", "-v")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*::test_pay_by_card PASSED*"])
+
+    # The tags line belongs to the scenario
+    result = testdir.runpytest("--bdd-select", "checkout.feature:5", "-v")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*::test_pay_by_voucher PASSED*"])
+
+    result = testdir.runpytest("--bdd-select", "checkout.feature:9", "-v")
+    result.assert_outcomes(passed=3)
+
+    result = testdir.runpytest("checkout.feature:16", "-v")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*::test_pay_in_installments[[]3[]] PASSED*"])
+
+    result = testdir.runpytest("checkout.feature:15", "checkout.feature:17", "-v")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(
+        ["*::test_pay_in_installments[[]2[]] PASSED*", "*::test_pay_in_installments[[]4[]] PASSED*"]
+    )
+
+    # The feature header selects all the scenarios of the feature
+    result = testdir.runpytest("--bdd-select", "checkout.feature:1")
+    result.assert_outcomes(passed=5)
+
+    result = testdir.runpytest("--bdd-select", "checkout.feature")
+    assert result.ret == 4
+    result.stderr.fnmatch_lines(['*--bdd-select: "checkout.feature" is not in form FEATURE:LINE*'])
+
+
+def test_select_collected_feature_file(testdir):
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_collect_feature_files = true
+        markers =
+            smoke
+        """
+    )
+    testdir.makefile(".feature", checkout=FEATURE)
+    testdir.makefile(".feature", other="Feature: Other\n    Given a step outside of a scenario\n")
+    testdir.makeconftest(STEPS)
+
+    result = testdir.runpytest("checkout.feature:17", "-v")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*checkout.feature::Pay in installments[[]4[]] PASSED*"])
+
+
+def test_select_in_features_directory(testdir):
+    features = testdir.mkdir("features")
+    features.join("checkout.feature").write(FEATURE)
+    features.join("other.feature").write("Feature: Other\n    Given a step outside of a scenario\n")
+    testdir.makeconftest(STEPS)
+    testdir.makepyfile(
+        textwrap.dedent(
+            """
+            from pytest_bdd import scenarios
+
+            scenarios("features")
+            """
+        )
+    )
+
+    result = testdir.runpytest("features/checkout.feature:2", "-v")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*::test_pay_by_card PASSED*"])
+
+
+def test_select_with_computed_feature_paths(testdir):
+    """Test that the modules binding the selected feature by the computed paths or the base directory are collected."""
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_features_base_dir = features/
+        """
+    )
+    features = testdir.mkdir("features")
+    features.join("checkout.feature").write(FEATURE)
+    testdir.makeconftest(STEPS)
+    testdir.makepyfile(
+        test_current_dir="""
+        from pytest_bdd import scenarios
+
+        scenarios(".")
+        """,
+        test_joined="""
+        import os
+
+        from pytest_bdd import scenarios
+
+        scenarios(os.path.join("check" + "out.feature"))
+        """,
+    )
+
+    result = testdir.runpytest("features/checkout.feature:2", "-v")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*test_current_dir.py::*PASSED*", "*test_joined.py::*PASSED*"])
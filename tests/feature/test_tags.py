@@ -3,7 +3,9 @@ import textwrap
 
 import pytest
 
+from pytest_bdd.exceptions import TagExpressionError
 from pytest_bdd.parser import get_tags
+from pytest_bdd.tag_expression import TagExpression
 
 
 def test_tags_selector(testdir):
@@ -252,3 +254,105 @@ def test_at_in_scenario(testdir):
 )
 def test_get_tags(line, expected):
     assert get_tags(line) == expected
+
+
+def test_tag_expression_selector(testdir):
+    """Test the scenarios selection by the tag expression at the collection time."""
+    testdir.makefile(
+        ".ini",
+        pytest=textwrap.dedent(
+            """
+    [pytest]
+    markers =
+        feature_tag
+        smoke
+        slow
+        wip
+    """
+        ),
+    )
+    testdir.makefile(
+        ".feature",
+        test="""
+    @feature_tag
+    Feature: Tags
+
+    @smoke
+    Scenario: Smoke
+        Given I have a bar
+
+    @smoke @slow
+    Scenario: Slow smoke
+        Given I have a bar
+
+    @wip
+    Scenario: Work in progress
+        Given I have a bar
+
+    @smoke
+    Scenario: Bound smoke
+        Given I have a bar
+
+    @wip
+    Scenario: Bound work in progress
+        Given I have a bar
+    """,
+    )
+    testdir.makepyfile(
+        """
+        import pytest
+        from pytest_bdd import given, scenario, scenarios
+
+        @given('I have a bar')
+        def i_have_bar():
+            return 'bar'
+
+        @scenario('test.feature', 'Bound smoke')
+        def test_bound_smoke():
+            pass
+
+        @scenario('test.feature', 'Bound work in progress')
+        def test_bound_work_in_progress():
+            pass
+
+        scenarios('test.feature')
+    """
+    )
+    result = testdir.runpytest("--bdd-tags", "@smoke and not @slow", "-v")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*collected 2 items*", "*::test_bound_smoke PASSED*", "*::test_smoke PASSED*"])
+
+    result = testdir.runpytest("--bdd-tags", "@feature_tag and (wip or slow)", "-v")
+    result.assert_outcomes(passed=3)
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=5)
+
+    result = testdir.runpytest("--bdd-tags", "@smoke and")
+    assert result.ret == 4
+    result.stderr.fnmatch_lines(['*--bdd-tags: Invalid tag expression "@smoke and": unexpected end of the expression*'])
+
+
+@pytest.mark.parametrize(
+    ["expression", "tags", "expected"],
+    [
+        ("@smoke", {"smoke"}, True),
+        ("smoke", {"smoke"}, True),
+        ("@smoke", {"slow"}, False),
+        ("not @smoke", {"slow"}, True),
+        ("@smoke and @slow", {"smoke"}, False),
+        ("@smoke or @slow", {"slow"}, True),
+        ("@smoke and not @slow or @wip", {"wip", "slow"}, True),
+        ("@smoke and not (@slow or @wip)", {"smoke", "wip"}, False),
+        ("not not @smoke", {"smoke"}, True),
+        ("@background-scope:feature", {"background-scope:feature"}, True),
+    ],
+)
+def test_tag_expression(expression, tags, expected):
+    assert TagExpression(expression).evaluate(tags) is expected
+
+
+@pytest.mark.parametrize("expression", ["", "@smoke and", "(@smoke", "@smoke)", "@smoke @slow", "and @smoke", "not"])
+def test_invalid_tag_expression(expression):
+    with pytest.raises(TagExpressionError):
+        TagExpression(expression)
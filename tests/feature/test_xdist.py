@@ -0,0 +1,145 @@
+"""Test pytest-xdist scheduling of the scenarios."""
+import textwrap
+
+import pytest
+
+pytest.importorskip("xdist")
+
+
+FEATURE = """\
+Feature: {name}
+    Scenario Outline: Outline of {name}
+        Given I record the worker for <value>
+
+        Examples:
+        | value |
+        | 1     |
+        | 2     |
+        | 3     |
+        | 4     |
+"""
+
+
+def test_loadfeature(testdir):
+    """Test that the scenarios of the same feature are executed by the same worker."""
+    testdir.makefile(".feature", first=FEATURE.format(name="first"), second=FEATURE.format(name="second"))
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+        import os
+
+        from pytest_bdd import given, scenarios
+
+        scenarios("first.feature", "second.feature")
+
+
+        @given("I record the worker for <value>")
+        def record_worker(request):
+            with open(request.node.function.__scenario__.feature.name + ".workers", "a") as f:
+                f.write(os.environ["PYTEST_XDIST_WORKER"] + "\\n")
+        """
+        )
+    )
+    result = testdir.runpytest("-n", "2", "--bdd-dist=loadfeature")
+    result.assert_outcomes(passed=8)
+    for name in ("first", "second"):
+        workers = testdir.tmpdir.join(name + ".workers").read().split()
+        assert len(workers) == 4
+        assert len(set(workers)) == 1
+
+
+def test_loadfeature_split(testdir):
+    """Test that the oversized features are split in balanced chunks, keeping the node ids."""
+    testdir.makefile(".feature", first=FEATURE.format(name="first"))
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+        import os
+
+        from pytest_bdd import given, scenarios
+
+        scenarios("first.feature")
+
+
+        @given("I record the worker for <value>")
+        def record_worker(request, value):
+            assert "@bdd-feature" not in request.node.nodeid
+            with open(value + ".workers", "w") as f:
+                f.write(os.environ["PYTEST_XDIST_WORKER"])
+        """
+        )
+    )
+    result = testdir.runpytest("-n", "2", "--bdd-dist=loadfeature", "-v", "--junitxml=junit.xml")
+    result.assert_outcomes(passed=4)
+    workers = [testdir.tmpdir.join(value + ".workers").read() for value in ("1", "2", "3", "4")]
+    assert workers[0] == workers[1]
+    assert workers[2] == workers[3]
+    assert "@bdd-feature" not in result.stdout.str()
+    assert "@bdd-feature" not in testdir.tmpdir.join("junit.xml").read()
+
+
+def test_compact_report_transport(testdir):
+    """Test that the feature data sent once per worker is restored in every report on the controller."""
+    testdir.makefile(
+        ".feature",
+        first=textwrap.dedent(
+            """\
+            @feature-tag
+            Feature: first
+                Feature description.
+
+                Scenario Outline: Outline of first
+                    Given I record the worker for <value>
+
+                    Examples:
+                    | value |
+                    | 1     |
+                    | 2     |
+                    | 3     |
+            """
+        ),
+    )
+    testdir.makeini(
+        """\
+        [pytest]
+        markers =
+            feature-tag
+        """
+    )
+    testdir.makeconftest(
+        textwrap.dedent(
+            """\
+        FEATURES = []
+
+
+        def pytest_runtest_logreport(report):
+            if report.when == "call":
+                FEATURES.append(report.scenario["feature"])
+
+
+        def pytest_sessionfinish(session):
+            if not hasattr(session.config, "workerinput"):
+                assert len(FEATURES) == 3
+                for feature in FEATURES:
+                    assert feature["description"] == "Feature description."
+                    assert feature["tags"] == ["feature-tag"]
+        """
+        )
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+        from pytest_bdd import given, scenarios
+
+        scenarios("first.feature")
+
+
+        @given("I record the worker for <value>")
+        def record_worker():
+            pass
+        """
+        )
+    )
+    result = testdir.runpytest("-n", "1")
+    result.assert_outcomes(passed=3)
+    assert result.ret == 0
@@ -85,3 +85,45 @@ def test_generate_missing(testdir):
     )
 
     result.stdout.fnmatch_lines(["Please place the code above to the test file(s):"])
+
+
+def test_generate_missing_argumented_steps(testdir):
+    """Test that the steps defined with the step parsers are not reported as missing."""
+    testdir.makefile(
+        ".feature",
+        generation=textwrap.dedent(
+            """\
+            Feature: Missing code generation of argumented steps
+
+                Scenario: Argumented steps are found
+                    Given I have 5 bars
+                    And I have 7 bars
+                    When I eat 3 bars
+            """
+        ),
+    )
+
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+        from pytest_bdd import scenario, given, parsers
+
+        @given(parsers.parse("I have {count:d} bars"))
+        def i_have_bars(count):
+            return count
+
+        @scenario("generation.feature", "Argumented steps are found")
+        def test_argumented():
+            pass
+        """
+        )
+    )
+
+    result = testdir.runpytest("--generate-missing", "--feature", "generation.feature")
+    assert_outcomes(result, passed=0, failed=0, errors=0)
+
+    result.stdout.fnmatch_lines(
+        ['Step When "I eat 3 bars" is not defined in the scenario "Argumented steps are found" *']
+    )
+    result.stdout.no_fnmatch_line("*I have * bars*")
+    result.stdout.no_fnmatch_line("*is not bound to any test*")
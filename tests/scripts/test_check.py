@@ -0,0 +1,180 @@
+"""Test the step definitions check command."""
+
+import sys
+import textwrap
+
+from pytest_bdd.scripts import main
+
+
+def test_check(testdir, monkeypatch, capsys):
+    """Test the undefined and ambiguous steps are reported without importing the step definitions."""
+    testdir.makefile(
+        ".feature",
+        check=textwrap.dedent(
+            """\
+            Feature: Check
+
+                Background:
+                    Given I have a bar
+
+                Scenario: Defined steps
+                    Given I have 5 cucumbers
+                    When I eat <eat> cucumbers
+                    Then I should have 3 cucumbers
+                    And trace
+
+                Scenario: Undefined and ambiguous steps
+                    Given I have a foo
+                    Then I should have 3 apples
+            """
+        ),
+    )
+    testdir.makepyfile(
+        test_check=textwrap.dedent(
+            """\
+            import this_module_is_not_imported
+
+            from pytest_bdd import given, when, then, parsers
+
+            @given("I have a bar")
+            def i_have_a_bar():
+                pass
+
+            @given("I have a {name}")
+            def not_a_parser():
+                pass
+
+            @given(parsers.parse("I have {count:d} cucumbers"))
+            def i_have_cucumbers(count):
+                pass
+
+            @when("I eat <eat> cucumbers")
+            def i_eat_cucumbers(eat):
+                pass
+
+            @then(parsers.re(r"I should have (?P<count>\\d+) \\w+"))
+            def i_should_have(count):
+                pass
+
+            @then(name=parsers.cfparse("I should have {count:d} apples"))
+            def i_should_have_apples(count):
+                pass
+            """
+        ),
+    )
+
+    cache = testdir.tmpdir.join("cache", "step_index")
+    for _ in range(2):
+        monkeypatch.setattr(sys, "argv", ["", "check", testdir.tmpdir.strpath, "--cache", cache.strpath])
+        assert main() == 1
+        out, err = capsys.readouterr()
+        lines = out.splitlines()
+        assert lines[0].endswith('check.feature:13: Step definition is not found: Given "I have a foo"')
+        assert lines[1].endswith(
+            'check.feature:14: Step Then "I should have 3 apples" is ambiguous, it matches the step definitions:'
+        )
+        assert lines[2].endswith("test_check.py:21 'I should have (?P<count>\\\\d+) \\\\w+'")
+        assert lines[3].endswith("test_check.py:25 'I should have {count:d} apples'")
+        assert lines[4] == "2 step definition error(s) found."
+        assert len(lines) == 5
+        assert cache.check()
+
+
+def test_check_passing(testdir, monkeypatch, capsys):
+    """Test the check of the feature with all the steps defined."""
+    feature = testdir.makefile(".feature", check="Feature: Check\n    Scenario: Passing\n        Given I have a bar\n")
+    steps = testdir.makepyfile('from pytest_bdd import given\n@given("I have a bar")\ndef bar():\n    pass\n')
+
+    monkeypatch.setattr(sys, "argv", ["", "check", feature.strpath, steps.strpath])
+    assert main() == 0
+    out, err = capsys.readouterr()
+    assert out == ""
+
+
+def test_check_parser_arguments(testdir, monkeypatch, capsys):
+    """Test the check of the steps defined with the parser keyword arguments."""
+    feature = testdir.makefile(
+        ".feature",
+        check=textwrap.dedent(
+            """\
+            Feature: Check
+                Scenario: Parser arguments
+                    Given I have 5 cucumbers
+                    And I have 3 apples
+                    And I have 2 PEARS
+                    And I have 4 bananas
+                    Then I should have 7 cucumbers
+            """
+        ),
+    )
+    steps = testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            import re
+
+            from pytest_bdd import given, then, parsers
+
+            TYPES = {"Fruit": str}
+
+
+            @given(parsers.cfparse("I have {count:Number} cucumbers", extra_types=dict(Number=int)))
+            def cucumbers(count):
+                pass
+
+
+            @given(parsers.parse("I have {count:Number} apples", extra_types={"Number": int}))
+            def apples(count):
+                pass
+
+
+            @given(parsers.re(r"I have (?P<count>\\d+) pears", flags=re.IGNORECASE))
+            def pears(count):
+                pass
+
+
+            @given(parsers.parse("I have {count:d} {fruit:Fruit}", extra_types=TYPES))
+            def fruits(count, fruit):
+                pass
+
+
+            @then(parsers.cfparse("I should have {count:Number} cucumbers", extra_types=dict(Number=int)))
+            def should_have_cucumbers(count):
+                pass
+            """
+        )
+    )
+
+    # The cache file is in the current directory
+    testdir.chdir()
+    monkeypatch.setattr(sys, "argv", ["", "check", "--cache", "steps.json", feature.strpath, steps.strpath])
+    assert main() == 0
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert testdir.tmpdir.join("steps.json").check()
+
+
+def test_check_invalid_pattern(testdir, monkeypatch, capsys):
+    """Test the check of the step definitions with the patterns which can not be compiled."""
+    feature = testdir.makefile(".feature", check="Feature: Check\n    Scenario: Passing\n        Given I have a bar\n")
+    steps = testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, parsers
+
+
+            @given(parsers.re("I have (a bar"))
+            def bar():
+                pass
+
+
+            @given("I have a bar")
+            def the_bar():
+                pass
+            """
+        )
+    )
+
+    monkeypatch.setattr(sys, "argv", ["", "check", feature.strpath, steps.strpath])
+    assert main() == 1
+    out, err = capsys.readouterr()
+    assert u'{0}:4: Step pattern "I have (a bar" is not valid'.format(steps.strpath) in out
@@ -0,0 +1,109 @@
+# coding=utf-8
+"""Test cucumber json reports merge command."""
+
+import json
+import sys
+
+import pytest
+
+from pytest_bdd import cucumber_json
+from pytest_bdd.scripts import main
+
+
+def make_feature(feature_id, *element_ids):
+    return {
+        "keyword": "Feature",
+        "uri": feature_id,
+        "name": feature_id,
+        "id": feature_id,
+        "line": 1,
+        "description": "",
+        "tags": [],
+        "elements": [{"keyword": "Scenario", "id": element_id, "steps": []} for element_id in element_ids],
+    }
+
+
+def test_merge_cucumber(testdir, monkeypatch):
+    """Test merging the reports of the shards of the same test suite."""
+    shard_0 = testdir.tmpdir.join("cucumber-0.json")
+    shard_0.write(json.dumps([make_feature("a.feature", "a1"), make_feature("b.feature", "b1")]))
+    shard_1 = testdir.tmpdir.join("cucumber-1.json")
+    shard_1.write(json.dumps([make_feature("b.feature", "b2", "b3"), make_feature("c.feature", "c1")]))
+    output = testdir.tmpdir.join("reports", "cucumber.json")
+
+    monkeypatch.setattr(sys, "argv", ["", "merge-cucumber", shard_0.strpath, shard_1.strpath, "-o", output.strpath])
+    main()
+
+    report = json.loads(output.read())
+    assert [feature["id"] for feature in report] == ["a.feature", "b.feature", "c.feature"]
+    assert [[element["id"] for element in feature["elements"]] for feature in report] == [
+        ["a1"],
+        ["b1", "b2", "b3"],
+        ["c1"],
+    ]
+    assert report[1]["name"] == "b.feature"
+    # The spool directory is removed
+    assert output.dirpath().listdir() == [output]
+
+
+def test_iter_json_array(testdir):
+    """Test reading the report items in chunks smaller than an item."""
+    features = [make_feature("{0}.feature".format(index), u"scenario ☃") for index in range(10)]
+    path = testdir.tmpdir.join("cucumber.json")
+    path.write(json.dumps(features, indent=2))
+
+    assert list(cucumber_json.iter_json_array(path.strpath, chunk_size=7)) == features
+    path.write("[]")
+    assert list(cucumber_json.iter_json_array(path.strpath)) == []
+
+
+def test_iter_json_array_values(testdir):
+    """Test the items split at every position of the chunks, with the tokens in the strings."""
+    items = [
+        {"name": u'a "quoted" {brace} [bracket] \\ backslash ☃', "elements": [[], {}, [1, 2.5e3]]},
+        u"string, with ] comma",
+        u'\\"',
+        -12.5,
+        True,
+        None,
+        [[{"a": "]"}]],
+        {},
+    ]
+    path = testdir.tmpdir.join("cucumber.json")
+    path.write(json.dumps(items, indent=1))
+    for chunk_size in range(1, 20):
+        assert list(cucumber_json.iter_json_array(path.strpath, chunk_size=chunk_size)) == items
+    path.write(json.dumps(items, separators=(",", ":")))
+    assert list(cucumber_json.iter_json_array(path.strpath, chunk_size=3)) == items
+
+    path.write('[{"a": 1}, {"b"')
+    with pytest.raises(ValueError):
+        list(cucumber_json.iter_json_array(path.strpath))
+
+
+def test_feature_spool_open_files(testdir):
+    """Test that the spool files of the least recently used features are closed."""
+    spool = cucumber_json.FeatureSpool(testdir.tmpdir.strpath, max_open_files=2)
+    for feature_id in ("a.feature", "b.feature", "c.feature"):
+        spool.add_feature(feature_id, make_feature(feature_id))
+    for feature_id, element_id in [("a.feature", "a1"), ("b.feature", "b1"), ("a.feature", "a2"), ("c.feature", "c1")]:
+        spool.add_element(feature_id, {"id": element_id})
+        assert len(spool.files) <= 2
+    # The spool file of "b.feature" is the least recently used one
+    assert [spool.features[feature_id][1] in spool.files for feature_id in ("a.feature", "b.feature", "c.feature")] == [
+        True,
+        False,
+        True,
+    ]
+    spool.add_element("b.feature", {"id": "b2"})
+
+    output = testdir.tmpdir.join("cucumber.json")
+    spool.write(output.strpath)
+    assert not spool.files
+    spool.close()
+    report = json.loads(output.read())
+    assert [[element["id"] for element in feature["elements"]] for feature in report] == [
+        ["a1", "a2"],
+        ["b1", "b2"],
+        ["c1"],
+    ]
@@ -0,0 +1,203 @@
+"""Step cache tests."""
+import os
+import textwrap
+
+import pytest
+
+
+FEATURE = """\
+Feature: Step cache
+    Scenario Outline: Cached dataset
+        Given there is a dataset of <size> rows
+        Then the dataset has <size> rows
+
+        Examples:
+        | size |
+        | 1    |
+        | 2    |
+        | 1    |
+        | 2    |
+"""
+
+
+def test_step_cache(testdir):
+    """Test that the cached step is called once per distinct arguments."""
+    testdir.makefile(".feature", cache=FEATURE)
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+        from pytest_bdd import given, then, scenarios
+
+        CALLS = []
+
+        scenarios("cache.feature", example_converters={"size": int})
+
+
+        @given("there is a dataset of <size> rows", target_fixture="dataset", cache="session")
+        def dataset(size):
+            CALLS.append(size)
+            return list(range(size))
+
+
+        @then("the dataset has <size> rows")
+        def dataset_has_rows(dataset, size):
+            assert len(dataset) == size
+
+
+        def test_calls():
+            assert CALLS == [1, 2]
+        """
+        )
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=5)
+    result.stdout.fnmatch_lines(
+        ["*pytest-bdd step cache*", 'Given "there is a dataset of <size> rows": 2 hits, 2 misses']
+    )
+
+
+def test_step_cache_maxsize(testdir):
+    """Test that the least recently used values are evicted and the custom cache key is used."""
+    testdir.makefile(".feature", cache=FEATURE)
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+        from pytest_bdd import given, then, scenarios
+
+        CALLS = []
+
+        scenarios("cache.feature", example_converters={"size": int})
+
+
+        @given(
+            "there is a dataset of <size> rows",
+            target_fixture="dataset",
+            cache="session",
+            cache_key=lambda size: size,
+            cache_maxsize=1,
+        )
+        def dataset(size):
+            CALLS.append(size)
+            return list(range(size))
+
+
+        @then("the dataset has <size> rows")
+        def dataset_has_rows(dataset, size):
+            assert len(dataset) == size
+
+
+        def test_calls():
+            assert CALLS == [1, 2, 1, 2]
+        """
+        )
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=5)
+
+
+def test_step_cache_invalid_scope():
+    """Test that only the session cache scope is supported."""
+    from pytest_bdd import given
+
+    with pytest.raises(ValueError):
+
+        @given("there is a dataset", cache="module")
+        def dataset():
+            pass
+
+
+def test_step_cache_fixture_arguments(testdir):
+    """Test that the fixture objects are not part of the default cache key, so the step is not cached."""
+    testdir.makefile(".feature", cache=FEATURE)
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+        import pytest
+
+        from pytest_bdd import given, then, scenarios
+
+        CALLS = []
+
+        scenarios("cache.feature", example_converters={"size": int})
+
+
+        @pytest.fixture
+        def factory():
+            return list
+
+
+        @given("there is a dataset of <size> rows", target_fixture="dataset", cache="session")
+        def dataset(size, factory):
+            CALLS.append(size)
+            return factory(range(size))
+
+
+        @then("the dataset has <size> rows")
+        def dataset_has_rows(dataset, size):
+            assert len(dataset) == size
+
+
+        def test_calls():
+            assert CALLS == [1, 2, 1, 2]
+        """
+        )
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=5)
+
+
+def test_step_cache_key():
+    """Test the default cache key and size."""
+    from pytest_bdd.step_cache import DEFAULT_MAXSIZE, StepCache
+
+    cache = StepCache("session")
+    assert cache.maxsize == DEFAULT_MAXSIZE
+    assert cache.get_key({"size": 1, "name": u"rows", "shape": (1, 2)}) == (
+        ("name", u"rows"),
+        ("shape", (1, 2)),
+        ("size", 1),
+    )
+    assert cache.get_key({"size": 1, "request": object()}) is None
+    assert cache.get_key({"size": 1, "rows": [1]}) is None
+
+
+STEPS = """\
+from pytest_bdd import given, then, scenarios
+
+scenarios("cache.feature", example_converters={"size": int})
+
+
+@given("there is a dataset of <size> rows", target_fixture="dataset", cache="session")
+def dataset(size):
+    return list(range(size))
+
+
+@then("the dataset has <size> rows")
+def dataset_has_rows(dataset, size):
+    assert len(dataset) == size
+"""
+
+
+def test_step_cache_xdist(testdir):
+    """Test that the cache hits and misses of the xdist workers are reported by the controller."""
+    pytest.importorskip("xdist")
+    testdir.makefile(".feature", cache=FEATURE)
+    testdir.makepyfile(STEPS)
+    result = testdir.runpytest("-n", "2", "--dist=loadscope")
+    result.assert_outcomes(passed=4)
+    result.stdout.fnmatch_lines(
+        ["*pytest-bdd step cache*", 'Given "there is a dataset of <size> rows": 2 hits, 2 misses']
+    )
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Forking is not supported")
+def test_step_cache_forked(testdir):
+    """Test that the cache hits and misses of the forked scenario processes are reported."""
+    testdir.makefile(".feature", cache="@background-scope:fork\n" + FEATURE)
+    testdir.makepyfile(STEPS)
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=4)
+    # The values cached in the forked processes are discarded with them
+    result.stdout.fnmatch_lines(
+        ["*pytest-bdd step cache*", 'Given "there is a dataset of <size> rows": 0 hits, 4 misses']
+    )